@@ -0,0 +1,48 @@
+"""issue search indexes
+
+Revision ID: 3b9e2c7d41a6
+Revises: f258b256b118
+Create Date: 2026-10-18 09:12:44.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9e2c7d41a6'
+down_revision: Union[str, None] = 'f258b256b118'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Giống JiraIssueEntity.search_vector tại thời điểm tạo migration
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'A') || "
+    "setweight(to_tsvector('simple', regexp_replace(coalesce(description, ''), '<[^>]+>', ' ', 'g')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column(
+        'jira_issues',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True
+        )
+    )
+    op.create_index('ix_jira_issues_search_vector', 'jira_issues', ['search_vector'], unique=False,
+                    postgresql_using='gin')
+    op.create_index('ix_jira_issues_summary_trgm', 'jira_issues', ['summary'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'summary': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jira_issues_summary_trgm', table_name='jira_issues')
+    op.drop_index('ix_jira_issues_search_vector', table_name='jira_issues')
+    op.drop_column('jira_issues', 'search_vector')
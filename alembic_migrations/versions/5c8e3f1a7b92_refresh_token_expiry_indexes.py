@@ -0,0 +1,44 @@
+"""refresh token expiry indexes
+
+Revision ID: 5c8e3f1a7b92
+Revises: 9d4f1a6b2e85
+Create Date: 2026-10-18 11:32:08.613527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8e3f1a7b92'
+down_revision: Union[str, None] = '9d4f1a6b2e85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, columns)
+INDEXES = [
+    ('ix_refresh_tokens_expires_at', ['expires_at']),
+    ('ix_refresh_tokens_user_id_token_type_created_at', ['user_id', 'token_type', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                'refresh_tokens',
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True
+            )
+    op.execute('ANALYZE refresh_tokens')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='refresh_tokens', if_exists=True, postgresql_concurrently=True)
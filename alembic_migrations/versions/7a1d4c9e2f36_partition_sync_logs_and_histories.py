@@ -0,0 +1,140 @@
+"""partition sync_logs and jira_issue_histories by month
+
+Revision ID: 7a1d4c9e2f36
+Revises: 5c8e3f1a7b92
+Create Date: 2026-10-18 14:12:40.318254
+
+Rebuilds both tables as range-partitioned tables on created_at (one partition per month plus a
+DEFAULT partition for rows outside the created ranges) and copies the existing rows over. The
+copy rewrites the whole table while holding an exclusive lock, so run it in a maintenance window.
+Later partitions are created and expired by the partition maintenance job.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1d4c9e2f36'
+down_revision: Union[str, None] = '5c8e3f1a7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Số tháng partition được tạo trước, job bảo trì sẽ tạo tiếp các tháng sau
+PREMAKE_MONTHS = 3
+
+# (table, foreign keys, indexes (name, columns), unique constraints (name, columns))
+# - khóa chính, index unique và ràng buộc unique phải chứa created_at
+TABLES = [
+    (
+        'sync_logs',
+        [('sync_logs_sender_fkey', 'sender', 'jira_users (user_id)')],
+        [('ix_sync_logs_entity_id_created_at', 'entity_id, created_at')],
+        [],
+    ),
+    (
+        'jira_issue_histories',
+        [
+            ('fk_jira_issues', 'jira_issue_id', 'jira_issues (jira_issue_id)'),
+            ('fk_jira_users', 'author_id', 'jira_users (jira_account_id)'),
+        ],
+        [
+            ('ix_jira_issue_histories_issue_field_created', 'jira_issue_id, field_name, created_at'),
+            ('ix_jira_issue_histories_issue_created', 'jira_issue_id, created_at, id'),
+        ],
+        [('uq_jira_issue_history_jira_change_id_field_name', 'jira_change_id, field_name, created_at')],
+    ),
+]
+
+
+def _create_monthly_partitions(table: str) -> None:
+    # Tạo partition từ tháng của bản ghi cũ nhất tới PREMAKE_MONTHS tháng sau, biên theo UTC
+    op.execute(f"""
+        DO $$
+        DECLARE
+            current_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC');
+            month_start timestamp;
+        BEGIN
+            SELECT date_trunc('month', min(created_at) AT TIME ZONE 'UTC') INTO month_start FROM {table}_legacy;
+            month_start := LEAST(COALESCE(month_start, current_month), current_month);
+            WHILE month_start <= current_month + interval '{PREMAKE_MONTHS} months' LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                    '{table}_p' || to_char(month_start, 'YYYYMM'),
+                    month_start::text || '+00',
+                    (month_start + interval '1 month')::text || '+00'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+    """)
+
+
+def upgrade() -> None:
+    for table, foreign_keys, indexes, unique_constraints in TABLES:
+        op.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+        op.execute(f'ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey')
+        # Bảng tạo bằng create_all có thể đã có ràng buộc cùng tên, bảng mới tạo lại nó bên dưới
+        for name, _ in unique_constraints:
+            op.execute(f'ALTER TABLE {table}_legacy DROP CONSTRAINT IF EXISTS {name}')
+        # Khóa phân vùng phải NOT NULL và nằm trong khóa chính
+        op.execute(f'UPDATE {table}_legacy SET created_at = now() WHERE created_at IS NULL')
+
+        op.execute(f"""
+            CREATE TABLE {table} (
+                LIKE {table}_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+                PRIMARY KEY (id, created_at)
+            ) PARTITION BY RANGE (created_at)
+        """)
+        for name, column, reference in foreign_keys:
+            op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) REFERENCES {reference}')
+        # LIKE ... INCLUDING CONSTRAINTS chỉ copy CHECK constraint, ràng buộc unique phải tạo lại
+        for name, columns in unique_constraints:
+            op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE ({columns})')
+
+        _create_monthly_partitions(table)
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        if unique_constraints:
+            # Bỏ các dòng trùng đã có trước khi bảng có ràng buộc unique
+            op.execute(f'INSERT INTO {table} SELECT * FROM {table}_legacy ON CONFLICT DO NOTHING')
+        else:
+            op.execute(f'INSERT INTO {table} SELECT * FROM {table}_legacy')
+        # Giữ sequence của id để id mới tiếp tục tăng
+        op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+        op.execute(f'DROP TABLE {table}_legacy')
+
+        # Index trên bảng cha được tạo trên từng partition
+        for name, columns in indexes:
+            op.execute(f'CREATE INDEX {name} ON {table} ({columns})')
+        op.execute(f'ANALYZE {table}')
+
+
+def downgrade() -> None:
+    for table, foreign_keys, indexes, unique_constraints in reversed(TABLES):
+        for name, _ in unique_constraints:
+            op.execute(f'ALTER TABLE {table} DROP CONSTRAINT {name}')
+        op.execute(f'ALTER TABLE {table} RENAME TO {table}_partitioned')
+        op.execute(f'ALTER TABLE {table}_partitioned RENAME CONSTRAINT {table}_pkey TO {table}_partitioned_pkey')
+        for name, _ in indexes:
+            op.execute(f'ALTER INDEX {name} RENAME TO {name}_partitioned')
+
+        op.execute(f"""
+            CREATE TABLE {table} (
+                LIKE {table}_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+                PRIMARY KEY (id)
+            )
+        """)
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN created_at DROP NOT NULL')
+        for name, column, reference in foreign_keys:
+            op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) REFERENCES {reference}')
+
+        op.execute(f'INSERT INTO {table} SELECT * FROM {table}_partitioned')
+        op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+        # Xóa bảng cha xóa luôn các partition còn gắn với nó
+        op.execute(f'DROP TABLE {table}_partitioned')
+
+        for name, columns in indexes:
+            op.execute(f'CREATE INDEX {name} ON {table} ({columns})')
+        op.execute(f'ANALYZE {table}')
@@ -0,0 +1,57 @@
+"""hot query indexes
+
+Revision ID: 9d4f1a6b2e85
+Revises: 3b9e2c7d41a6
+Create Date: 2026-10-18 10:05:17.204961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f1a6b2e85'
+down_revision: Union[str, None] = '3b9e2c7d41a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_jira_issues_project_key_updated_at_active', 'jira_issues', ['project_key', 'updated_at', 'id'],
+     'is_deleted = false'),
+    ('ix_jira_issues_project_key', 'jira_issues', ['project_key'], None),
+    ('ix_jira_issues_assignee_id', 'jira_issues', ['assignee_id'], None),
+    ('ix_jira_issues_story_id', 'jira_issues', ['story_id'], 'story_id IS NOT NULL'),
+    ('ix_jira_issue_histories_issue_field_created', 'jira_issue_histories',
+     ['jira_issue_id', 'field_name', 'created_at'], None),
+    ('ix_jira_issue_histories_issue_created', 'jira_issue_histories', ['jira_issue_id', 'created_at', 'id'], None),
+    ('ix_jira_issue_sprints_sprint_issue', 'jira_issue_sprints', ['jira_sprint_id', 'jira_issue_id'], None),
+    ('ix_sync_logs_entity_id_created_at', 'sync_logs', ['entity_id', 'created_at'], None),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY không chạy được trong transaction và không khóa ghi bảng lớn
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None
+            )
+    op.execute('ANALYZE jira_issues')
+    op.execute('ANALYZE jira_issue_histories')
+    op.execute('ANALYZE jira_issue_sprints')
+    op.execute('ANALYZE sync_logs')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""jira_issues.updated_at not null
+
+Revision ID: c4e7b2a9d103
+Revises: 7a1d4c9e2f36
+Create Date: 2026-10-18 22:31:06.482190
+
+updated_at is the sort key of the keyset pagination on project issues; NULLs would sort first
+and never match the cursor comparison, so existing NULLs are backfilled from created_at.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7b2a9d103'
+down_revision: Union[str, None] = '7a1d4c9e2f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('UPDATE jira_issues SET updated_at = COALESCE(created_at, now()) WHERE updated_at IS NULL')
+    op.alter_column(
+        'jira_issues',
+        'updated_at',
+        existing_type=sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text('now()')
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'jira_issues',
+        'updated_at',
+        existing_type=sa.DateTime(timezone=True),
+        nullable=True,
+        server_default=None
+    )
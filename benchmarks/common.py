@@ -0,0 +1,83 @@
+"""Helpers shared by the benchmarks: SQL statement counting and BENCH data reset"""
+import statistics
+from typing import Any, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks import payloads
+from src.configs.database import AsyncSessionManager
+
+
+class StatementCounter:
+    """Counts SQL statements executed on an engine while attached
+
+    Usage:
+        with StatementCounter(engine) as statements:
+            ...
+        statements.count
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        """Start counting"""
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop counting"""
+        event.remove(self.engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+
+def percentile(values: List[float], percent: float) -> Optional[float]:
+    """Inclusive percentile of ``values`` (None when empty)"""
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+async def reset_benchmark_data(seed_project: bool = True) -> None:
+    """Remove rows of the BENCH project left by a previous run and seed the benchmark user
+
+    The project itself is seeded only with ``seed_project`` (the project sync creates it).
+    """
+    project_key = {"project_key": payloads.BENCH_PROJECT_KEY}
+    async with AsyncSessionManager.session() as session:
+        for statement in (
+            "DELETE FROM jira_issue_histories WHERE jira_issue_id IN "
+            "(SELECT jira_issue_id FROM jira_issues WHERE project_key = :project_key)",
+            "DELETE FROM jira_issue_sprints WHERE jira_issue_id IN "
+            "(SELECT jira_issue_id FROM jira_issues WHERE project_key = :project_key)",
+            "DELETE FROM jira_issues WHERE project_key = :project_key",
+            "DELETE FROM jira_sprints WHERE project_key = :project_key",
+            "DELETE FROM jira_projects WHERE key = :project_key",
+        ):
+            await session.exec(text(statement).bindparams(**project_key))  # type: ignore
+
+        # Chỉ giữ user của benchmark gắn với system user, các user khác do project sync tạo lại
+        await session.exec(text(  # type: ignore
+            "DELETE FROM jira_users WHERE jira_account_id LIKE :prefix AND user_id IS NULL"
+        ).bindparams(prefix=f"{payloads.BENCH_ACCOUNT_PREFIX}%"))
+        await session.exec(text(  # type: ignore
+            "INSERT INTO jira_users (email, user_id, jira_account_id, is_system_user, is_active, name, created_at) "
+            "VALUES (:email, :user_id, :account_id, false, true, 'Benchmark User', now()) "
+            "ON CONFLICT (jira_account_id) DO NOTHING"
+        ).bindparams(
+            email=f"{payloads.BENCH_ACCOUNT_ID}@bench.example",
+            user_id=payloads.BENCH_USER_ID,
+            account_id=payloads.BENCH_ACCOUNT_ID
+        ))
+
+        if seed_project:
+            await session.exec(text(  # type: ignore
+                "INSERT INTO jira_projects (jira_project_id, name, key, is_system_linked, user_id, created_at) "
+                "VALUES (:jira_project_id, 'Benchmark', :project_key, true, :user_id, now())"
+            ).bindparams(jira_project_id=payloads.BENCH_PROJECT_ID, user_id=payloads.BENCH_USER_ID, **project_key))
@@ -0,0 +1,211 @@
+"""Local fake Jira server serving canned payloads with configurable latency and 429 injection"""
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import random
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from benchmarks import payloads
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@dataclass
+class FakeJiraConfig:
+    latency_seconds: float = 0.05
+    # Độ lệch ngẫu nhiên cộng thêm vào latency (0..jitter)
+    latency_jitter_seconds: float = 0.02
+    # Tỉ lệ request trả về 429 Too Many Requests
+    rate_limit_ratio: float = 0.0
+    retry_after_seconds: int = 1
+    changelog_entries: int = 2
+    # Kích thước project BENCH trả về bởi các API cấp project (search, board sprints, assignable users)
+    issues: int = 0
+    sprints: int = 0
+    users: int = 1
+    seed: int = 42
+
+
+class FakeJiraServer:
+    """Serves the Jira REST / Agile endpoints used by the webhook and sync paths
+
+    Issues and sprints are generated from their id (see ``benchmarks.payloads``); each GET of the
+    same issue or sprint returns the next revision so updates produce real changes.
+
+    Usage:
+        async with FakeJiraServer(FakeJiraConfig(latency_seconds=0.1)) as server:
+            settings.JIRA_BASE_URL = server.base_url
+    """
+
+    def __init__(self, config: Optional[FakeJiraConfig] = None):
+        self.config = config or FakeJiraConfig()
+        self.requests: Counter[str] = Counter()
+        self.rate_limited: Counter[str] = Counter()
+        self._revisions: Counter[str] = Counter()
+        self._random = random.Random(self.config.seed)
+        self._server: Optional[TestServer] = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "FakeJiraServer has not been started"
+        return str(self._server.make_url("")).rstrip("/")
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def reset_counters(self) -> None:
+        self.requests.clear()
+        self.rate_limited.clear()
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._simulate_network])
+        app.router.add_get("/rest/api/3/project/{project_key}", self._get_project)
+        app.router.add_get("/rest/api/3/user/assignable/search", self._get_assignable_users)
+        app.router.add_post("/rest/api/3/search", self._search_issues)
+        app.router.add_get("/rest/agile/1.0/board", self._get_boards)
+        app.router.add_get("/rest/agile/1.0/board/{board_id}/sprint", self._get_board_sprints)
+        app.router.add_get("/rest/api/3/issue/{issue_id}", self._get_issue)
+        app.router.add_get("/rest/api/3/issue/{issue_id}/changelog", self._get_changelog)
+        app.router.add_post("/rest/api/3/issue/bulkfetch", self._bulk_get_issues)
+        app.router.add_post("/rest/api/3/changelog/bulkfetch", self._bulk_get_changelogs)
+        app.router.add_get("/rest/api/3/user", self._get_user)
+        app.router.add_get("/rest/agile/1.0/sprint/{sprint_id}", self._get_sprint)
+        app.router.add_get("/rest/agile/1.0/board/{board_id}", self._get_board)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeJiraServer":
+        """Start the server"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the server"""
+        await self.stop()
+
+    @web.middleware
+    async def _simulate_network(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        endpoint = f"{request.method} {route}"
+        self.requests[endpoint] += 1
+
+        latency = self.config.latency_seconds + self._random.uniform(0, self.config.latency_jitter_seconds)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        if self.config.rate_limit_ratio and self._random.random() < self.config.rate_limit_ratio:
+            self.rate_limited[endpoint] += 1
+            return web.json_response(
+                {"errorMessages": ["Rate limit exceeded"]},
+                status=429,
+                headers={"Retry-After": str(self.config.retry_after_seconds)}
+            )
+        return await handler(request)
+
+    def _next_revision(self, key: str) -> int:
+        revision = self._revisions[key]
+        self._revisions[key] += 1
+        return revision
+
+    @staticmethod
+    def _issue_index(issue_id_or_key: str) -> Optional[int]:
+        if issue_id_or_key.startswith(f"{payloads.BENCH_PROJECT_KEY}-"):
+            return int(issue_id_or_key.rsplit("-", 1)[1]) - 1
+        if issue_id_or_key.isdigit() and int(issue_id_or_key) >= payloads.ISSUE_ID_OFFSET:
+            return int(issue_id_or_key) - payloads.ISSUE_ID_OFFSET
+        return None
+
+    @staticmethod
+    def _not_found(message: str) -> web.Response:
+        return web.json_response({"errorMessages": [message]}, status=404)
+
+    def _issue(self, index: int, revision: int) -> Dict[str, Any]:
+        # Issue được gán lần lượt cho các user và sprint của project
+        return payloads.issue_payload(
+            index,
+            revision,
+            assignee_index=index % max(self.config.users, 1),
+            sprint_index=index % self.config.sprints if self.config.sprints else None
+        )
+
+    async def _get_project(self, request: web.Request) -> web.Response:
+        if request.match_info["project_key"] not in (payloads.BENCH_PROJECT_KEY, payloads.BENCH_PROJECT_ID):
+            return self._not_found("No project could be found")
+        return web.json_response(payloads.project_payload())
+
+    async def _get_assignable_users(self, request: web.Request) -> web.Response:
+        return web.json_response([payloads.user_payload(payloads.account_id(index)) for index in range(self.config.users)])
+
+    async def _search_issues(self, request: web.Request) -> web.Response:
+        body: Dict[str, Any] = await request.json()
+        start_at = int(body.get("startAt", 0))
+        max_results = int(body.get("maxResults", 50))
+        indexes = range(start_at, min(start_at + max_results, self.config.issues))
+        return web.json_response({
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": self.config.issues,
+            "issues": [self._issue(index, self._revisions[f"issue:{index}"]) for index in indexes],
+        })
+
+    async def _get_boards(self, request: web.Request) -> web.Response:
+        return web.json_response({"startAt": 0, "maxResults": 50, "total": 1, "isLast": True, "values": [payloads.board_payload()]})
+
+    async def _get_board_sprints(self, request: web.Request) -> web.Response:
+        sprints = [payloads.sprint_payload(index) for index in range(self.config.sprints)]
+        return web.json_response({"startAt": 0, "maxResults": len(sprints), "isLast": True, "values": sprints})
+
+    async def _get_issue(self, request: web.Request) -> web.Response:
+        index = self._issue_index(request.match_info["issue_id"])
+        if index is None:
+            return self._not_found("Issue does not exist")
+        return web.json_response(self._issue(index, self._next_revision(f"issue:{index}")))
+
+    async def _get_changelog(self, request: web.Request) -> web.Response:
+        index = self._issue_index(request.match_info["issue_id"])
+        if index is None:
+            return self._not_found("Issue does not exist")
+        return web.json_response(payloads.changelog_payload(index, self.config.changelog_entries))
+
+    async def _bulk_get_issues(self, request: web.Request) -> web.Response:
+        body: Dict[str, Any] = await request.json()
+        issues = []
+        for issue_id_or_key in body.get("issueIdsOrKeys", []):
+            index = self._issue_index(str(issue_id_or_key))
+            if index is not None:
+                issues.append(self._issue(index, self._revisions[f"issue:{index}"]))
+        return web.json_response({"issues": issues})
+
+    async def _bulk_get_changelogs(self, request: web.Request) -> web.Response:
+        body: Dict[str, Any] = await request.json()
+        changelogs = []
+        for issue_id_or_key in body.get("issueIdsOrKeys", []):
+            index = self._issue_index(str(issue_id_or_key))
+            if index is not None:
+                changelogs.append({
+                    "issueId": payloads.issue_id(index),
+                    "changeHistories": payloads.changelog_payload(index, self.config.changelog_entries)["values"],
+                })
+        return web.json_response({"issueChangeLogs": changelogs})
+
+    async def _get_user(self, request: web.Request) -> web.Response:
+        return web.json_response(payloads.user_payload(request.query.get("accountId", payloads.BENCH_ACCOUNT_ID)))
+
+    async def _get_sprint(self, request: web.Request) -> web.Response:
+        sprint_id = int(request.match_info["sprint_id"])
+        if sprint_id < payloads.SPRINT_ID_OFFSET:
+            return self._not_found("Sprint does not exist")
+        index = sprint_id - payloads.SPRINT_ID_OFFSET
+        return web.json_response(payloads.sprint_payload(index, self._next_revision(f"sprint:{index}")))
+
+    async def _get_board(self, request: web.Request) -> web.Response:
+        return web.json_response(payloads.board_payload(int(request.match_info["board_id"])))
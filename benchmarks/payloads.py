@@ -0,0 +1,220 @@
+"""Canned Jira API and webhook payloads shaped like Jira Cloud responses"""
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Any, Dict, List, Optional
+
+BENCH_PROJECT_KEY = "BENCH"
+BENCH_PROJECT_ID = "990000"
+BENCH_BOARD_ID = 9901
+BENCH_ACCOUNT_ID = "bench-account-000000000001"
+BENCH_ACCOUNT_PREFIX = "bench-account-"
+BENCH_USER_ID = 990000001
+
+# Các issue / sprint của benchmark dùng dải id riêng để không đụng dữ liệu thật
+ISSUE_ID_OFFSET = 9900000
+SPRINT_ID_OFFSET = 990000
+
+_STATUSES = ["To Do", "In Progress", "Done"]
+_AVATAR_URLS = {size: f"https://avatar.example/{size}.png" for size in ("48x48", "24x24", "16x16", "32x32")}
+_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def issue_id(index: int) -> str:
+    """Jira issue id of the n-th benchmark issue"""
+    return str(ISSUE_ID_OFFSET + index)
+
+
+def sprint_id(index: int) -> int:
+    """Jira sprint id of the n-th benchmark sprint"""
+    return SPRINT_ID_OFFSET + index
+
+
+def account_id(index: int) -> str:
+    """Jira account id of the n-th benchmark user (the first one is BENCH_ACCOUNT_ID)"""
+    return f"bench-account-{index + 1:012d}"
+
+
+def _jira_datetime(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+def user_payload(jira_account_id: str = BENCH_ACCOUNT_ID) -> Dict[str, Any]:
+    """User as embedded in issues and returned by GET /rest/api/3/user"""
+    return {
+        "self": f"https://jira.example/rest/api/3/user?accountId={jira_account_id}",
+        "accountId": jira_account_id,
+        "accountType": "atlassian",
+        "emailAddress": f"{jira_account_id}@bench.example",
+        "avatarUrls": _AVATAR_URLS,
+        "displayName": "Benchmark User",
+        "active": True,
+        "timeZone": "UTC",
+    }
+
+
+def project_payload() -> Dict[str, Any]:
+    """Project as returned by GET /rest/api/3/project/{key} and embedded in issues"""
+    return {
+        "self": f"https://jira.example/rest/api/3/project/{BENCH_PROJECT_ID}",
+        "id": BENCH_PROJECT_ID,
+        "key": BENCH_PROJECT_KEY,
+        "name": "Benchmark",
+        "projectTypeKey": "software",
+        "simplified": True,
+        "avatarUrls": _AVATAR_URLS,
+    }
+
+
+def _status_payload(name: str) -> Dict[str, Any]:
+    category = {"To Do": "new", "In Progress": "indeterminate", "Done": "done"}[name]
+    return {
+        "self": "https://jira.example/rest/api/3/status/1",
+        "description": "",
+        "iconUrl": "https://jira.example/status.png",
+        "name": name,
+        "id": str(_STATUSES.index(name) + 1),
+        "statusCategory": {
+            "self": "https://jira.example/rest/api/3/statuscategory/1",
+            "id": _STATUSES.index(name) + 2,
+            "key": category,
+            "colorName": "blue-gray",
+            "name": name,
+        },
+    }
+
+
+def issue_payload(
+    index: int,
+    revision: int = 0,
+    assignee_index: int = 0,
+    sprint_index: Optional[int] = None
+) -> Dict[str, Any]:
+    """Issue as returned by GET /rest/api/3/issue/{id}, status advances with ``revision``"""
+    updated_at = _CREATED_AT + timedelta(minutes=revision)
+    sprints = [sprint_payload(sprint_index)] if sprint_index is not None else None
+    return {
+        "id": issue_id(index),
+        "key": f"{BENCH_PROJECT_KEY}-{index + 1}",
+        "self": f"https://jira.example/rest/api/3/issue/{issue_id(index)}",
+        "renderedFields": {"description": f"<p>Benchmark issue {index}</p>"},
+        "fields": {
+            "summary": f"Benchmark issue {index} r{revision}",
+            "description": None,
+            "status": _status_payload(_STATUSES[min(revision, len(_STATUSES) - 1)]),
+            "assignee": user_payload(account_id(assignee_index)),
+            "reporter": user_payload(),
+            "priority": {"id": "3", "name": "Medium", "iconUrl": "https://jira.example/medium.svg"},
+            "project": project_payload(),
+            "issuetype": {
+                "id": "10001",
+                "name": "Task",
+                "hierarchyLevel": 0,
+                "iconUrl": "https://jira.example/task.svg",
+            },
+            "created": _jira_datetime(_CREATED_AT),
+            "updated": _jira_datetime(updated_at),
+            "customfield_10016": 3.0,
+            "customfield_10020": sprints,
+        },
+    }
+
+
+def changelog_payload(index: int, entries: int) -> Dict[str, Any]:
+    """Changelog page of GET /rest/api/3/issue/{id}/changelog with ``entries`` status changes"""
+    values: List[Dict[str, Any]] = []
+    for entry in range(entries):
+        from_status = _STATUSES[min(entry, len(_STATUSES) - 1)]
+        to_status = _STATUSES[min(entry + 1, len(_STATUSES) - 1)]
+        values.append({
+            "id": str((ISSUE_ID_OFFSET + index) * 100 + entry),
+            "author": user_payload(),
+            "created": _jira_datetime(_CREATED_AT + timedelta(minutes=entry + 1)),
+            "items": [{
+                "field": "status",
+                "fieldtype": "jira",
+                "fieldId": "status",
+                "from": str(_STATUSES.index(from_status) + 1),
+                "fromString": from_status,
+                "to": str(_STATUSES.index(to_status) + 1),
+                "toString": to_status,
+            }],
+        })
+    return {"values": values, "startAt": 0, "maxResults": 100, "total": len(values), "isLast": True}
+
+
+def sprint_payload(index: int, revision: int = 0) -> Dict[str, Any]:
+    """Sprint as returned by GET /rest/agile/1.0/sprint/{id}"""
+    start_date = _CREATED_AT + timedelta(weeks=2 * index)
+    return {
+        "id": sprint_id(index),
+        "self": f"https://jira.example/rest/agile/1.0/sprint/{sprint_id(index)}",
+        "state": "active" if revision else "future",
+        "name": f"{BENCH_PROJECT_KEY} Sprint {index + 1}",
+        "startDate": start_date.isoformat().replace("+00:00", "Z"),
+        "endDate": (start_date + timedelta(weeks=2)).isoformat().replace("+00:00", "Z"),
+        "createdDate": _CREATED_AT.isoformat().replace("+00:00", "Z"),
+        "originBoardId": BENCH_BOARD_ID,
+        "goal": f"Revision {revision}",
+    }
+
+
+def board_payload(board_id: int = BENCH_BOARD_ID) -> Dict[str, Any]:
+    """Board as returned by GET /rest/agile/1.0/board/{id}"""
+    return {
+        "id": board_id,
+        "self": f"https://jira.example/rest/agile/1.0/board/{board_id}",
+        "name": f"{BENCH_PROJECT_KEY} board",
+        "type": "scrum",
+        "location": {
+            "projectId": int(BENCH_PROJECT_ID),
+            "projectKey": BENCH_PROJECT_KEY,
+            "projectName": "Benchmark",
+            "projectTypeKey": "software",
+            "displayName": f"Benchmark ({BENCH_PROJECT_KEY})",
+            "name": f"Benchmark ({BENCH_PROJECT_KEY})",
+        },
+    }
+
+
+def issue_webhook(event: str, index: int, revision: int = 0) -> Dict[str, Any]:
+    """Body of a jira:issue_created / jira:issue_updated webhook"""
+    issue = issue_payload(index, revision)
+    issue.pop("renderedFields")
+    fields = issue["fields"]
+    issue["fields"] = {
+        "statuscategorychangedate": fields["updated"],
+        "issuetype": {
+            **fields["issuetype"],
+            "self": "https://jira.example/rest/api/3/issuetype/10001",
+            "description": "",
+            "subtask": False,
+            "avatarId": 10318,
+            "entityId": "bench-task",
+        },
+        "project": fields["project"],
+        "created": fields["created"],
+        "updated": fields["updated"],
+        "status": fields["status"],
+        "summary": fields["summary"],
+        "assignee": fields["assignee"],
+        "reporter": fields["reporter"],
+        "priority": {**fields["priority"], "self": "https://jira.example/rest/api/3/priority/3"},
+        "customfield_10016": fields["customfield_10016"],
+    }
+    return {
+        "timestamp": int(time.time() * 1000),
+        "webhookEvent": event,
+        "issue_event_type_name": "issue_generic" if event == "jira:issue_updated" else "issue_created",
+        "user": user_payload(),
+        "issue": issue,
+    }
+
+
+def sprint_webhook(event: str, index: int, revision: int = 0) -> Dict[str, Any]:
+    """Body of a sprint_created / sprint_updated webhook"""
+    sprint = sprint_payload(index, revision)
+    return {
+        "timestamp": int(time.time() * 1000),
+        "webhookEvent": event,
+        "sprint": {key: value for key, value in sprint.items() if key not in ("self", "createdDate")},
+    }
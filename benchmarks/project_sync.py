@@ -0,0 +1,323 @@
+"""Project sync benchmark and profiling harness
+
+Runs ``JiraProjectApplicationService.sync_project`` (as the NATS project sync handler does) for a
+synthetic project served by ``FakeJiraServer`` and reports, per sync stage, wall time, Jira
+requests, SQL statements and peak Python memory. The first run imports the project into an empty
+database, later runs (``--runs``) measure a re-sync of unchanged data.
+
+Requirements: a disposable Postgres migrated to head, Redis and NATS reachable with the usual
+settings. Only rows of project ``BENCH`` are deleted and recreated.
+
+Usage:
+    python -m benchmarks.project_sync --preset medium
+    python -m benchmarks.project_sync --preset large --changelog-entries 20 --profile sync.prof
+"""
+import argparse
+import asyncio
+from contextlib import contextmanager
+import cProfile
+from dataclasses import asdict, dataclass, field
+import json
+import pstats
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from benchmarks import payloads
+from benchmarks.common import StatementCounter, reset_benchmark_data
+from benchmarks.fake_jira import FakeJiraConfig, FakeJiraServer
+from src.app.dependencies.container import DependencyContainer
+from src.app.services.jira_project_service import JiraProjectApplicationService
+from src.configs.database import AsyncSessionManager, engine
+from src.configs.logger import log
+from src.configs.resource_pools import use_resource_class
+from src.configs.settings import settings
+from src.domain.constants.resource_pools import ResourceClass
+from src.domain.models.jira_issue import JiraIssueModel
+from src.domain.models.jira_project import JiraProjectModel
+from src.domain.models.jira_user import JiraUserModel
+from src.domain.models.nats.requests.jira_project import JiraProjectSyncNATSRequestDTO
+from src.infrastructure.services.sync_log_writer_service import SyncLogWriterService
+
+# project_id của hệ thống cho project BENCH (unique trong jira_projects)
+BENCH_SYSTEM_PROJECT_ID = 990000
+
+
+@dataclass
+class SyncSize:
+    issues: int
+    sprints: int
+    users: int
+    changelog_entries: int
+
+
+PRESETS: Dict[str, SyncSize] = {
+    "small": SyncSize(issues=200, sprints=5, users=10, changelog_entries=3),
+    "medium": SyncSize(issues=1000, sprints=20, users=30, changelog_entries=5),
+    "large": SyncSize(issues=5000, sprints=60, users=80, changelog_entries=10),
+}
+
+
+@dataclass
+class StageResult:
+    name: str
+    wall_seconds: float
+    jira_requests: int
+    db_statements: int
+    peak_memory_mb: Optional[float]
+
+
+@dataclass
+class RunResult:
+    run: int
+    wall_seconds: float
+    jira_requests: int
+    db_statements: int
+    peak_memory_mb: Optional[float]
+    synced_issues: int
+    synced_sprints: int
+    synced_users: int
+    stages: List[StageResult] = field(default_factory=list)
+
+
+class StageProfiler:
+    """Measures wall time, Jira requests, SQL statements and peak memory of named stages"""
+
+    def __init__(self, fake_jira: FakeJiraServer, statements: StatementCounter, trace_memory: bool):
+        self.fake_jira = fake_jira
+        self.statements = statements
+        self.trace_memory = trace_memory
+        self.stages: List[StageResult] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        jira_before = self.fake_jira.total_requests
+        statements_before = self.statements.count
+        memory_before = 0
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            peak_memory_mb = None
+            if self.trace_memory:
+                peak_memory_mb = round((tracemalloc.get_traced_memory()[1] - memory_before) / 1024 / 1024, 2)
+            self.stages.append(StageResult(
+                name=name,
+                wall_seconds=round(time.perf_counter() - started_at, 3),
+                jira_requests=self.fake_jira.total_requests - jira_before,
+                db_statements=self.statements.count - statements_before,
+                peak_memory_mb=peak_memory_mb
+            ))
+
+
+class ProfiledJiraProjectApplicationService(JiraProjectApplicationService):
+    """Project service that reports each stage of ``sync_project`` to a StageProfiler"""
+
+    profiler: StageProfiler
+
+    async def _sync_project_details(self, session: AsyncSession, user_id: int, project_key: str, project_id: int) -> JiraProjectModel:
+        with self.profiler.stage("details"):
+            return await super()._sync_project_details(session, user_id, project_key, project_id)
+
+    async def _sync_project_users(self, session: AsyncSession, user_id: int, project_key: str) -> List[JiraUserModel]:
+        with self.profiler.stage("users"):
+            return await super()._sync_project_users(session, user_id, project_key)
+
+    async def _sync_project_sprints(self, session: AsyncSession, user_id: int, project_key: str) -> dict[int, int]:
+        with self.profiler.stage("sprints"):
+            return await super()._sync_project_sprints(session, user_id, project_key)
+
+    async def _sync_project_issues(self, session: AsyncSession, user_id: int, project_key: str) -> List[JiraIssueModel]:
+        with self.profiler.stage("issues"):
+            return await super()._sync_project_issues(session, user_id, project_key)
+
+    async def _sync_project_changelog(self, session: AsyncSession, issue_ids: List[str]) -> None:
+        with self.profiler.stage("changelog"):
+            await super()._sync_project_changelog(session, issue_ids)
+
+
+def _create_project_service(container: DependencyContainer) -> ProfiledJiraProjectApplicationService:
+    # Cùng dependencies với service của container (xem DependencyContainer.initialize)
+    return ProfiledJiraProjectApplicationService(
+        jira_project_api_service=container.jira_project_api_service,
+        jira_project_db_service=container.jira_project_database_service,
+        jira_issue_db_service=container.jira_issue_database_service,
+        jira_sprint_db_service=container.jira_sprint_database_service,
+        jira_issue_api_service=container.jira_issue_api_service,
+        jira_issue_history_service=container.issue_history_sync_service,
+        sync_log_repository=container.sync_log_repository,
+        jira_project_repository=container.project_repository,
+        jira_issue_repository=container.jira_issue_repository,
+        jira_sprint_repository=container.jira_sprint_repository,
+        jira_user_repository=container.jira_user_repository,
+        jira_issue_history_repository=container.issue_history_repository,
+        board_cache_service=container.jira_board_cache_service
+    )
+
+
+async def _run_sync(
+    run: int,
+    service: ProfiledJiraProjectApplicationService,
+    fake_jira: FakeJiraServer,
+    statements: StatementCounter,
+    sync_log_writer: SyncLogWriterService,
+    trace_memory: bool
+) -> RunResult:
+    request = JiraProjectSyncNATSRequestDTO(
+        user_id=payloads.BENCH_USER_ID,
+        project_key=payloads.BENCH_PROJECT_KEY,
+        project_id=BENCH_SYSTEM_PROJECT_ID,
+        jira_project_id=payloads.BENCH_PROJECT_ID
+    )
+    profiler = StageProfiler(fake_jira, statements, trace_memory)
+    service.profiler = profiler
+
+    log.info(f"Run {run}: syncing project {request.project_key}")
+    with profiler.stage("total"):
+        # Giống NATS handler: một session cho cả lần sync, tính vào ngân sách SYNC
+        with use_resource_class(ResourceClass.SYNC):
+            async with AsyncSessionManager.session() as session:
+                reply = await service.sync_project(session, request)
+        # Sync log được ghi theo lô ở background, flush để tính vào số statement của lần sync
+        await sync_log_writer.flush()
+
+    total = profiler.stages.pop()
+    summary = reply.sync_summary
+    return RunResult(
+        run=run,
+        wall_seconds=total.wall_seconds,
+        jira_requests=total.jira_requests,
+        db_statements=total.db_statements,
+        peak_memory_mb=total.peak_memory_mb,
+        synced_issues=summary.total_issues if summary else 0,
+        synced_sprints=summary.total_sprints if summary else 0,
+        synced_users=summary.total_users if summary else 0,
+        stages=profiler.stages
+    )
+
+
+async def run_benchmark(args: argparse.Namespace, size: SyncSize) -> List[RunResult]:
+    """Start the fake Jira and the container, then sync the BENCH project ``args.runs`` times"""
+    fake_config = FakeJiraConfig(
+        latency_seconds=args.jira_latency_ms / 1000,
+        latency_jitter_seconds=args.jira_jitter_ms / 1000,
+        changelog_entries=size.changelog_entries,
+        issues=size.issues,
+        sprints=size.sprints,
+        users=size.users
+    )
+    results: List[RunResult] = []
+
+    async with FakeJiraServer(fake_config) as fake_jira:
+        # JiraAPIClient đọc base URL khi được tạo trong initialize()
+        settings.JIRA_BASE_URL = fake_jira.base_url
+        await DependencyContainer.initialize()
+        container = DependencyContainer.get_instance()
+        assert container.sync_log_writer_service is not None and container.redis_service is not None
+        await container.sync_log_writer_service.start()
+
+        try:
+            await reset_benchmark_data(seed_project=False)
+            # Sync dùng token Jira của user, không gọi refresh token trong benchmark
+            await container.redis_service.cache_jira_token(payloads.BENCH_USER_ID, "bench-token")
+            await container.redis_service.mark_jira_token_checked(payloads.BENCH_USER_ID)
+
+            service = _create_project_service(container)
+            with StatementCounter(engine) as statements:
+                for run in range(1, args.runs + 1):
+                    fake_jira.reset_counters()
+                    results.append(await _run_sync(
+                        run, service, fake_jira, statements, container.sync_log_writer_service, not args.no_memory
+                    ))
+        finally:
+            await DependencyContainer.cleanup()
+
+    return results
+
+
+def _print_report(size: SyncSize, results: List[RunResult]) -> None:
+    print(
+        f"Project BENCH: {size.issues} issues, {size.sprints} sprints, {size.users} users, "
+        f"{size.changelog_entries} changelog entries per issue"
+    )
+    header = f"{'run':<5}{'stage':<12}{'wall s':>10}{'jira':>8}{'sql':>10}{'peak MB':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        for stage in result.stages:
+            print(
+                f"{result.run:<5}{stage.name:<12}{stage.wall_seconds:>10}{stage.jira_requests:>8}"
+                f"{stage.db_statements:>10}{str(stage.peak_memory_mb):>10}"
+            )
+        print(
+            f"{result.run:<5}{'total':<12}{result.wall_seconds:>10}{result.jira_requests:>8}"
+            f"{result.db_statements:>10}{str(result.peak_memory_mb):>10}"
+        )
+        print(
+            f"     synced {result.synced_issues} issues, {result.synced_sprints} sprints, {result.synced_users} users"
+        )
+    # ru_maxrss tính theo KB trên Linux
+    print(f"Process max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Benchmark command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark JiraProjectApplicationService.sync_project against a fake Jira")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--issues", type=int, help="Override the number of issues of the preset")
+    parser.add_argument("--sprints", type=int, help="Override the number of sprints of the preset")
+    parser.add_argument("--users", type=int, help="Override the number of assignable users of the preset")
+    parser.add_argument("--changelog-entries", type=int, help="Override changelog entries per issue of the preset")
+    parser.add_argument("--runs", type=int, default=2, help="Sync runs; the first imports, the next ones re-sync")
+    parser.add_argument("--jira-latency-ms", type=float, default=50.0)
+    parser.add_argument("--jira-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--no-memory", action="store_true", help="Disable tracemalloc (lower overhead)")
+    parser.add_argument("--profile", help="Write cProfile stats of the whole benchmark to this file")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark and print the per-stage report"""
+    args = parse_args(argv)
+    preset = PRESETS[args.preset]
+    size = SyncSize(
+        issues=args.issues if args.issues is not None else preset.issues,
+        sprints=args.sprints if args.sprints is not None else preset.sprints,
+        users=args.users if args.users is not None else preset.users,
+        changelog_entries=args.changelog_entries if args.changelog_entries is not None else preset.changelog_entries
+    )
+
+    if not args.no_memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    try:
+        results = asyncio.run(run_benchmark(args, size))
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+
+    _print_report(size, results)
+    if profiler:
+        print(f"\nTop functions by cumulative time (full stats in {args.profile}):")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+    if args.output:
+        report: Dict[str, Any] = {"size": asdict(size), "runs": [asdict(result) for result in results]}
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -24,18 +24,26 @@ class JiraIssueController:
         self.jira_issue_service = jira_issue_service
         self.jira_issue_history_service = jira_issue_history_service
 
-    async def get_issue_changelogs(self, session: AsyncSession, issue_key: str) -> StandardResponse[JiraIssueHistoryAPIGetDTO]:
+    async def get_issue_changelogs(
+        self,
+        session: AsyncSession,
+        issue_key: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> StandardResponse[JiraIssueHistoryAPIGetDTO]:
         """Lấy changelog của một Jira Issue
 
         Args:
             session: AsyncSession
             issue_key: Key của Jira Issue
+            limit: Số history event tối đa (None = lấy tất cả)
+            offset: Số history event bỏ qua
 
         Returns:
             Lịch sử thay đổi của issue
         """
         try:
-            result = await self.jira_issue_history_service.get_issue_changelogs(session, issue_key)
+            result = await self.jira_issue_history_service.get_issue_changelogs(session, issue_key, limit=limit, offset=offset)
             return StandardResponse(
                 message="Successfully fetched changelogs",
                 data=result
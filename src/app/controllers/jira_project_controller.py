@@ -3,7 +3,7 @@ from typing import List, Optional
 from fastapi import HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.app.schemas.responses.base import StandardResponse
+from src.app.schemas.responses.base import CursorPaginatedResponse, StandardResponse
 from src.app.schemas.responses.jira_issue import (
     GetJiraIssueResponse,
 )
@@ -15,6 +15,7 @@ from src.app.services.jira_project_service import JiraProjectApplicationService
 from src.configs.logger import log
 from src.domain.constants.jira import JiraIssueType
 from src.domain.exceptions.jira_exceptions import JiraAuthenticationError, JiraConnectionError, JiraRequestError
+from src.domain.exceptions.pagination_exceptions import InvalidCursorError
 from src.domain.models.jira_sprint import JiraSprintModel
 from src.domain.repositories.jira_project_repository import IJiraProjectRepository
 from src.domain.services.jira_sprint_database_service import IJiraSprintDatabaseService
@@ -40,13 +41,14 @@ class JiraProjectController:
         is_backlog: Optional[bool] = None,
         issue_type: Optional[JiraIssueType] = None,
         search: Optional[str] = None,
-        limit: int = 50
-    ) -> StandardResponse[List[GetJiraIssueResponse]]:
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> CursorPaginatedResponse[List[GetJiraIssueResponse]]:
         try:
             # Sprint id is system sprint id, not sprint id in Jira
 
             log.info(f"User {user_id} is fetching issues for project {project_key} from database")
-            issues = await self.jira_project_service.get_project_issues(
+            issues, next_cursor = await self.jira_project_service.get_project_issues(
                 session=session,
                 user_id=user_id,
                 project_key=project_key,
@@ -54,17 +56,21 @@ class JiraProjectController:
                 is_backlog=is_backlog,
                 issue_type=issue_type,
                 search=search,
-                limit=limit
+                limit=limit,
+                cursor=cursor
             )
 
             current_sprint: Optional[JiraSprintModel] = None
             if sprint_id:
                 current_sprint = await self.jira_sprint_database_service.get_sprint_by_id(session=session, sprint_id=sprint_id)
 
-            return StandardResponse(
+            return CursorPaginatedResponse(
                 message="Issues fetched successfully from database",
-                data=[GetJiraIssueResponse.from_domain(issue, current_sprint) for issue in issues]
+                data=[GetJiraIssueResponse.from_domain(issue, current_sprint) for issue in issues],
+                next_cursor=next_cursor
             )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
         except Exception as e:
             log.error(f"Error fetching issues from database: {str(e)}")
             raise HTTPException(
@@ -3,7 +3,8 @@ from typing import Any, Dict
 from fastapi import HTTPException
 
 from src.app.services.jira_webhook_queue_service import JiraWebhookQueueService
-from src.configs.logger import log
+from src.configs.logger import log, log_rate_limited
+from src.configs.tracing import tracer
 from src.domain.models.jira.webhooks.jira_webhook import BaseJiraWebhookDTO
 from src.domain.services.jira_webhook_service import IJiraWebhookService
 
@@ -21,15 +22,17 @@ class JiraWebhookController:
 
             # Sử dụng factory method từ BaseJiraWebhookDTO để tạo DTO phù hợp
             if "webhookEvent" in payload:
-                log.info(f"Processing webhook event: {payload['webhookEvent']}")
+                log_rate_limited("webhook.received", "INFO", "Processing webhook event: {}", payload['webhookEvent'])
 
             # Parse webhook data sử dụng factory method
             try:
-                webhook_data = BaseJiraWebhookDTO.parse_webhook(payload)
-                log.info(f"Webhook parsed successfully as {type(webhook_data).__name__}")
+                with tracer.start_as_current_span("webhook.receive") as span:
+                    webhook_data = BaseJiraWebhookDTO.parse_webhook(payload)
+                    span.set_attribute("jira.webhook.event", webhook_data.webhook_event)
+                    log.debug("Webhook parsed successfully as {}", type(webhook_data).__name__)
 
-                # Thêm vào queue để xử lý bất đồng bộ
-                await self.jira_webhook_queue_service.add_webhook_to_queue(webhook_data)
+                    # Thêm vào queue để xử lý bất đồng bộ; task xử lý entity kế thừa span này
+                    await self.jira_webhook_queue_service.add_webhook_to_queue(webhook_data)
 
                 return {"status": "queued", "event_type": webhook_data.webhook_event}
             except ValueError as ve:
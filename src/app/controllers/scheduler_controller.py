@@ -0,0 +1,23 @@
+from fastapi import HTTPException
+
+from src.app.schemas.responses.base import StandardResponse
+from src.app.schemas.responses.scheduler import SchedulerLeaderStatusResponse
+from src.configs.logger import log
+from src.domain.services.scheduler_leader_service import ISchedulerLeaderService
+
+
+class SchedulerController:
+    def __init__(self, scheduler_leader_service: ISchedulerLeaderService):
+        self.scheduler_leader_service = scheduler_leader_service
+
+    async def get_leader_status(self) -> StandardResponse[SchedulerLeaderStatusResponse]:
+        """Get which process currently runs the scheduled jobs"""
+        try:
+            status = await self.scheduler_leader_service.get_status()
+            return StandardResponse(
+                message="Scheduler leader status retrieved successfully",
+                data=SchedulerLeaderStatusResponse.from_domain(status)
+            )
+        except Exception as e:
+            log.error(f"Error getting scheduler leader status: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}") from e
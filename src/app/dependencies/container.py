@@ -1,4 +1,7 @@
+import asyncio
+from collections import Counter, defaultdict
 from contextlib import asynccontextmanager
+import time
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -26,15 +29,26 @@ from src.app.services.nats_handlers.user_message_handler import UserMessageHandl
 from src.app.services.nats_handlers.workflow_edit_handler import WorkflowEditRequestHandler
 from src.app.services.nats_handlers.workflow_sync_handler import WorkflowSyncRequestHandler
 from src.app.services.system_config_service import SystemConfigApplicationService
-from src.configs.database import create_session, get_db
+from src.configs.database import AsyncSessionManager, create_session, dispose_engines, get_db, read_replica_router
+from src.configs.http_transport import close_http_transports
 from src.configs.logger import log
+from src.configs.resource_pools import install_resource_task_factory, use_resource_class
 from src.configs.settings import settings
+from src.configs.tracing import configure_tracing, shutdown_tracing
 from src.domain.constants.nats_events import NATSSubscribeTopic
+from src.domain.constants.partitions import PartitionedTable
+from src.domain.constants.refresh_tokens import TokenRefreshResult
+from src.domain.constants.resource_pools import ResourceClass
+from src.domain.models.refresh_token import RefreshTokenModel
+from src.domain.repositories.jira_user_repository import IJiraUserRepository
+from src.domain.repositories.sync_log_repository import ISyncLogRepository
 from src.domain.services.jira_issue_api_service import IJiraIssueAPIService
 from src.domain.services.jira_project_api_service import IJiraProjectAPIService
 from src.domain.services.jira_sprint_api_service import IJiraSprintAPIService
 from src.domain.services.jira_user_api_service import IJiraUserAPIService
 from src.domain.services.nats_message_handler import INATSMessageHandler, INATSRequestHandler
+from src.infrastructure.repositories.buffered_sync_log_repository import BufferedSyncLogRepository
+from src.infrastructure.repositories.cached_jira_user_repository import CachedJiraUserRepository
 from src.infrastructure.repositories.sqlalchemy_jira_issue_history_repository import (
     SQLAlchemyJiraIssueHistoryRepository,
 )
@@ -43,10 +57,12 @@ from src.infrastructure.repositories.sqlalchemy_jira_project_repository import S
 from src.infrastructure.repositories.sqlalchemy_jira_sprint_repository import SQLAlchemyJiraSprintRepository
 from src.infrastructure.repositories.sqlalchemy_jira_user_repository import SQLAlchemyJiraUserRepository
 from src.infrastructure.repositories.sqlalchemy_media_repository import SQLAlchemyMediaRepository
+from src.infrastructure.repositories.sqlalchemy_partition_repository import SQLAlchemyPartitionRepository
 from src.infrastructure.repositories.sqlalchemy_refresh_token_repository import SQLAlchemyRefreshTokenRepository
 from src.infrastructure.repositories.sqlalchemy_sync_log_repository import SQLAlchemySyncLogRepository
 from src.infrastructure.repositories.sqlalchemy_system_config_repository import SQLAlchemySystemConfigRepository
 from src.infrastructure.services.gantt_chart_calculator_service import GanttChartCalculatorService
+from src.infrastructure.services.jira_board_cache_service import JiraBoardCacheService
 from src.infrastructure.services.jira_issue_api_service import JiraIssueAPIService
 from src.infrastructure.services.jira_issue_database_service import JiraIssueDatabaseService
 from src.infrastructure.services.jira_issue_history_database_service import JiraIssueHistoryDatabaseService
@@ -55,11 +71,16 @@ from src.infrastructure.services.jira_project_database_service import JiraProjec
 from src.infrastructure.services.jira_service import JiraAPIClient
 from src.infrastructure.services.jira_sprint_api_service import JiraSprintAPIService
 from src.infrastructure.services.jira_sprint_database_service import JiraSprintDatabaseService
+from src.infrastructure.services.jira_transition_cache_service import JiraTransitionCacheService
 from src.infrastructure.services.jira_user_api_service import JiraUserAPIService
 from src.infrastructure.services.jira_user_database_service import JiraUserDatabaseService
+from src.infrastructure.services.jira_user_identity_map_service import JiraUserIdentityMapService
 from src.infrastructure.services.nats_service import NATSService
 from src.infrastructure.services.nats_workflow_service_client import NATSWorkflowServiceClient
+from src.infrastructure.services.partition_maintenance_service import PartitionMaintenanceService
 from src.infrastructure.services.redis_service import RedisService
+from src.infrastructure.services.scheduler_leader_service import RedisSchedulerLeaderService
+from src.infrastructure.services.sync_log_writer_service import SyncLogWriterService
 from src.infrastructure.services.token_refresh_service import TokenRefreshService
 from src.infrastructure.services.token_scheduler_service import TokenSchedulerService
 
@@ -77,12 +98,13 @@ class DependencyContainer:
     redis_service: Optional[RedisService] = None
     nats_service: Optional[NATSService] = None
     scheduler: Optional[AsyncIOScheduler] = None
+    scheduler_leader_service: Optional[RedisSchedulerLeaderService] = None
 
     # Repositories
-    jira_user_repository: Optional[SQLAlchemyJiraUserRepository] = None
+    jira_user_repository: Optional[IJiraUserRepository] = None
     refresh_token_repository: Optional[SQLAlchemyRefreshTokenRepository] = None
     project_repository: Optional[SQLAlchemyJiraProjectRepository] = None
-    sync_log_repository: Optional[SQLAlchemySyncLogRepository] = None
+    sync_log_repository: Optional[ISyncLogRepository] = None
     jira_issue_repository: Optional[SQLAlchemyJiraIssueRepository] = None
     jira_sprint_repository: Optional[SQLAlchemyJiraSprintRepository] = None
     issue_history_repository: Optional[SQLAlchemyJiraIssueHistoryRepository] = None
@@ -90,11 +112,16 @@ class DependencyContainer:
     system_config_repository: Optional[SQLAlchemySystemConfigRepository] = None
 
     # Infrastructure services
+    jira_user_identity_map_service: Optional[JiraUserIdentityMapService] = None
+    sync_log_writer_service: Optional[SyncLogWriterService] = None
     token_refresh_service: Optional[TokenRefreshService] = None
     token_scheduler_service: Optional[TokenSchedulerService] = None
+    partition_maintenance_service: Optional[PartitionMaintenanceService] = None
     jira_issue_database_service: Optional[JiraIssueDatabaseService] = None
     jira_api_client: Optional[JiraAPIClient] = None
     jira_api_admin_client: Optional[JiraAPIClient] = None
+    jira_transition_cache_service: Optional[JiraTransitionCacheService] = None
+    jira_board_cache_service: Optional[JiraBoardCacheService] = None
     jira_issue_api_service: Optional[IJiraIssueAPIService] = None
     jira_sprint_api_service: Optional[IJiraSprintAPIService] = None
     jira_user_api_service: Optional[IJiraUserAPIService] = None
@@ -147,10 +174,31 @@ class DependencyContainer:
         await instance.nats_service.connect()
 
         # Initialize repositories
-        instance.jira_user_repository = SQLAlchemyJiraUserRepository()
+        instance.jira_user_identity_map_service = JiraUserIdentityMapService(
+            max_size=settings.USER_IDENTITY_MAP_MAX_SIZE,
+            ttl_seconds=settings.USER_IDENTITY_MAP_TTL_SECONDS
+        )
+        instance.jira_user_repository = CachedJiraUserRepository(
+            SQLAlchemyJiraUserRepository(),
+            instance.jira_user_identity_map_service,
+            redis_service=instance.redis_service,
+            version_check_interval=settings.USER_IDENTITY_MAP_VERSION_CHECK_SECONDS
+        )
         instance.refresh_token_repository = SQLAlchemyRefreshTokenRepository()
         instance.project_repository = SQLAlchemyJiraProjectRepository()
-        instance.sync_log_repository = SQLAlchemySyncLogRepository()
+        # sync_logs được ghi theo lô ở background, không nằm trên luồng xử lý webhook / NATS
+        instance.sync_log_writer_service = SyncLogWriterService(
+            SQLAlchemySyncLogRepository(),
+            flush_interval_seconds=settings.SYNC_LOG_FLUSH_INTERVAL_SECONDS,
+            batch_size=settings.SYNC_LOG_BATCH_SIZE,
+            max_queue_size=settings.SYNC_LOG_QUEUE_MAX_SIZE,
+            max_payload_bytes=settings.SYNC_LOG_MAX_PAYLOAD_BYTES,
+            success_sample_rate=settings.SYNC_LOG_SUCCESS_SAMPLE_RATE
+        )
+        instance.sync_log_repository = BufferedSyncLogRepository(
+            SQLAlchemySyncLogRepository(),
+            instance.sync_log_writer_service
+        )
         instance.jira_issue_repository = SQLAlchemyJiraIssueRepository()
         instance.jira_sprint_repository = SQLAlchemyJiraSprintRepository()
         instance.issue_history_repository = SQLAlchemyJiraIssueHistoryRepository()
@@ -170,7 +218,18 @@ class DependencyContainer:
         )
         instance.token_scheduler_service = TokenSchedulerService(
             instance.token_refresh_service,
-            instance.refresh_token_repository
+            instance.refresh_token_repository,
+            instance.redis_service
+        )
+        instance.partition_maintenance_service = PartitionMaintenanceService(
+            SQLAlchemyPartitionRepository(),
+            retention_months={
+                PartitionedTable.SYNC_LOGS: settings.SYNC_LOG_RETENTION_MONTHS,
+                PartitionedTable.JIRA_ISSUE_HISTORIES: settings.JIRA_ISSUE_HISTORY_RETENTION_MONTHS,
+            },
+            premake_months=settings.PARTITION_PREMAKE_MONTHS,
+            archive_schema=settings.PARTITION_ARCHIVE_SCHEMA,
+            lock_timeout_seconds=settings.PARTITION_MAINTENANCE_LOCK_TIMEOUT_SECONDS
         )
 
         # Initialize Jira services
@@ -189,10 +248,14 @@ class DependencyContainer:
             use_admin_auth=True
         )
 
+        instance.jira_transition_cache_service = JiraTransitionCacheService(instance.redis_service)
+        instance.jira_board_cache_service = JiraBoardCacheService(instance.redis_service)
+
         instance.jira_issue_api_service = JiraIssueAPIService(
             client=instance.jira_api_client,
             user_repository=instance.jira_user_repository,
-            admin_client=instance.jira_api_admin_client
+            admin_client=instance.jira_api_admin_client,
+            transition_cache=instance.jira_transition_cache_service
         )
 
         instance.jira_sprint_api_service = JiraSprintAPIService(
@@ -254,7 +317,8 @@ class DependencyContainer:
             jira_issue_repository=instance.jira_issue_repository,
             jira_sprint_repository=instance.jira_sprint_repository,
             jira_user_repository=instance.jira_user_repository,
-            jira_issue_history_repository=instance.issue_history_repository
+            jira_issue_history_repository=instance.issue_history_repository,
+            board_cache_service=instance.jira_board_cache_service
         )
 
         instance.gantt_calculator_service = GanttChartCalculatorService()
@@ -328,17 +392,45 @@ class DependencyContainer:
         instance.nats_event_service = NATSEventService(
             nats_service=instance.nats_service,
             message_handlers=instance.message_handlers,
-            request_handlers=instance.request_handlers
+            request_handlers=instance.request_handlers,
+            # Sync cả project chạy lâu, dùng ngân sách sync; các handler khác có người đang chờ reply
+            resource_classes={NATSSubscribeTopic.JIRA_PROJECT_SYNC.value: ResourceClass.SYNC}
         )
 
         # Initialize scheduler
         instance.scheduler = AsyncIOScheduler()
+        # Chỉ process được bầu làm leader mới chạy scheduled jobs
+        instance.scheduler_leader_service = RedisSchedulerLeaderService(
+            redis_service=instance.redis_service,
+            scheduler=instance.scheduler,
+            lease_seconds=settings.SCHEDULER_LEADER_LEASE_SECONDS,
+            renew_interval_seconds=settings.SCHEDULER_LEADER_RENEW_INTERVAL_SECONDS
+        )
+
+    @classmethod
+    async def warm_up_user_identity_map(cls) -> None:
+        """Load users into the identity map so the first lookups don't hit the DB"""
+        instance = cls.get_instance()
+        assert instance.jira_user_repository is not None, "JiraUserRepository has not been initialized"
+
+        db = await cls.get_db_for_job()
+        try:
+            users = await instance.jira_user_repository.get_all_users(session=db)
+            log.info(f"Warmed up user identity map with {len(users)} users")
+        except Exception as e:
+            log.warning(f"Error warming up user identity map: {str(e)}")
+        finally:
+            await db.close()
 
     @classmethod
     async def cleanup(cls) -> None:
         """Clean up all resources"""
         instance = cls.get_instance()
 
+        # Hand over scheduler leadership before shutting down
+        if instance.scheduler_leader_service:
+            await instance.scheduler_leader_service.stop()
+
         # Shutdown scheduler
         if instance.scheduler:
             instance.scheduler.shutdown()
@@ -351,9 +443,18 @@ class DependencyContainer:
         if instance.nats_service:
             await instance.nats_service.disconnect()
 
+        # Write the remaining buffered sync logs
+        if instance.sync_log_writer_service:
+            await instance.sync_log_writer_service.stop()
+
+        # Write responses still buffered by recording HTTP transports
+        await close_http_transports()
+
         # Close database connection
         if instance.db:
             await instance.db.close()
+        await read_replica_router.stop()
+        await dispose_engines()
 
         # Reset instance
         cls._instance = None
@@ -390,8 +491,6 @@ class DependencyContainer:
         from src.infrastructure.repositories.sqlalchemy_jira_issue_repository import SQLAlchemyJiraIssueRepository
         from src.infrastructure.repositories.sqlalchemy_jira_project_repository import SQLAlchemyJiraProjectRepository
         from src.infrastructure.repositories.sqlalchemy_jira_sprint_repository import SQLAlchemyJiraSprintRepository
-        from src.infrastructure.repositories.sqlalchemy_jira_user_repository import SQLAlchemyJiraUserRepository
-        from src.infrastructure.repositories.sqlalchemy_sync_log_repository import SQLAlchemySyncLogRepository
         from src.infrastructure.services.jira_issue_database_service import JiraIssueDatabaseService
         from src.infrastructure.services.jira_issue_history_database_service import JiraIssueHistoryDatabaseService
         from src.infrastructure.services.jira_sprint_database_service import JiraSprintDatabaseService
@@ -400,14 +499,18 @@ class DependencyContainer:
 
         # Tạo các repositories cần thiết
         issue_repo = SQLAlchemyJiraIssueRepository()
-        sync_log_repo = SQLAlchemySyncLogRepository()
         project_repo = SQLAlchemyJiraProjectRepository()
         sprint_repo = SQLAlchemyJiraSprintRepository()
-        user_repo = SQLAlchemyJiraUserRepository()
         issue_history_repo = SQLAlchemyJiraIssueHistoryRepository()
 
         # Lấy services từ container chính
         container = cls.get_instance()
+        # Dùng chung repository (và identity map) với container để các webhook user cập nhật cache
+        user_repo = container.jira_user_repository
+        # Ghi sync log qua writer chung của container
+        sync_log_repo = container.sync_log_repository
+        assert user_repo is not None, "JiraUserRepository has not been initialized"
+        assert sync_log_repo is not None, "SyncLogRepository has not been initialized"
 
         # Tạo Redis service mới cho session này
         redis_client = Redis.from_url(
@@ -432,6 +535,7 @@ class DependencyContainer:
             jira_user_db_service = JiraUserDatabaseService(user_repo)
             sprint_database_service = JiraSprintDatabaseService(sprint_repo)
             issue_history_db_service = JiraIssueHistoryDatabaseService(issue_history_repo)
+            board_cache_service = JiraBoardCacheService(redis_service)
 
             issue_history_sync_service = JiraIssueHistoryApplicationService(
                 jira_issue_api_service,
@@ -461,9 +565,9 @@ class DependencyContainer:
                 IssueDeleteWebhookHandler(issue_repo, sync_log_repo),
 
                 # Sprint handlers
-                SprintCreateWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service),
+                SprintCreateWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service, board_cache_service),
                 SprintUpdateWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service),
-                SprintStartWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service),
+                SprintStartWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service, board_cache_service),
                 SprintCloseWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service, issue_repo),
                 SprintDeleteWebhookHandler(sprint_database_service, sync_log_repo, jira_sprint_api_service),
 
@@ -504,6 +608,12 @@ async def lifespan_manager(app: FastAPI) -> AsyncGenerator[None, None]:
     """Context manager for FastAPI application lifespan"""
     log.info(f"Starting up {settings.APP_NAME}")
 
+    # Tracing phải bật trước khi tạo các client để span đầu tiên cũng được xuất
+    configure_tracing()
+
+    # Task con (gather, create_task) không được dùng lại slot DB session / Jira request của task cha
+    install_resource_task_factory()
+
     # Initialize all dependencies
     await DependencyContainer.initialize()
 
@@ -513,15 +623,25 @@ async def lifespan_manager(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.nats = container.nats_service
     app.state.nats_event_service = container.nats_event_service
 
+    # Warm up user identity map
+    await DependencyContainer.warm_up_user_identity_map()
+
+    # Check the read replica lag in the background, requests only read the cached result
+    await read_replica_router.start()
+
+    # Start the background sync log writer
+    await container.sync_log_writer_service.start()
+
     # Start the NATS event service
     await container.nats_event_service.start()
 
     # Setup scheduled jobs
     setup_scheduled_jobs(container.scheduler)
 
-    # Start the scheduler
-    container.scheduler.start()
+    # Start the scheduler paused, it is resumed only while this process is the leader
+    container.scheduler.start(paused=True)
     app.state.scheduler = container.scheduler
+    await container.scheduler_leader_service.start()
 
     # Create webhook queue service directly
     webhook_queue_service = None
@@ -550,6 +670,12 @@ async def lifespan_manager(app: FastAPI) -> AsyncGenerator[None, None]:
         # Then clean up other resources
         await DependencyContainer.cleanup()
 
+        # Flush spans still buffered in the exporter
+        shutdown_tracing()
+
+        # Write out log messages still queued for the sinks
+        await log.complete()
+
 
 def setup_scheduled_jobs(scheduler: AsyncIOScheduler) -> None:
     """Set up all scheduled jobs"""
@@ -571,31 +697,72 @@ def setup_scheduled_jobs(scheduler: AsyncIOScheduler) -> None:
     # Add token refresh check job
     async def check_tokens_for_refresh() -> None:
         try:
-            db = await DependencyContainer.get_db_for_job()
-            try:
-                container = DependencyContainer.get_instance()
-                user_repository = SQLAlchemyJiraUserRepository()
-                refresh_token_repository = SQLAlchemyRefreshTokenRepository()
-                token_refresh_service = TokenRefreshService(
-                    redis_service=container.redis_service,
-                    user_repository=user_repository,
-                    refresh_token_repository=refresh_token_repository
-                )
-                token_scheduler_service = TokenSchedulerService(
-                    token_refresh_service=token_refresh_service,
-                    refresh_token_repository=refresh_token_repository
+            started_at = time.perf_counter()
+            token_scheduler_service = DependencyContainer.get_instance().token_scheduler_service
+            assert token_scheduler_service is not None, "Token scheduler service is not initialized"
+
+            # Job nền: tính vào ngân sách sync, không chiếm DB session / Jira request của UI
+            with use_resource_class(ResourceClass.SYNC):
+                # Một query lấy token mới nhất của mỗi user sắp hết hạn, không duyệt toàn bộ user
+                async with AsyncSessionManager.read_only_session() as session:
+                    tokens = await token_scheduler_service.get_tokens_due_for_refresh(session=session)
+
+                # Token Jira và Microsoft của cùng user được xử lý tuần tự dưới cùng một lock
+                tokens_by_user: Dict[int, List[RefreshTokenModel]] = defaultdict(list)
+                for token in tokens:
+                    tokens_by_user[token.user_id].append(token)
+
+                semaphore = asyncio.Semaphore(settings.TOKEN_REFRESH_JOB_CONCURRENCY)
+
+                async def refresh_user_tokens(user_id: int, user_tokens: List[RefreshTokenModel]) -> List[TokenRefreshResult]:
+                    async with semaphore:
+                        try:
+                            # Mỗi user một session (và transaction) riêng, lỗi của user này không ảnh hưởng user khác
+                            async with AsyncSessionManager.session() as session:
+                                return await token_scheduler_service.refresh_user_tokens_if_due(
+                                    session=session,
+                                    user_id=user_id,
+                                    tokens=user_tokens
+                                )
+                        except Exception as e:
+                            log.error(f"Error refreshing tokens of user {user_id}: {str(e)}")
+                            return [TokenRefreshResult.FAILED for _ in user_tokens]
+
+                results = await asyncio.gather(
+                    *(refresh_user_tokens(user_id, user_tokens) for user_id, user_tokens in tokens_by_user.items())
                 )
 
-                users = await user_repository.get_all_users(db)
-                for user in users:
-                    if user and user.user_id:
-                        await token_scheduler_service.schedule_token_refresh(session=db, user_id=user.user_id)
-                log.info("Completed token refresh check")
-            finally:
-                await db.close()
+            counts = Counter(result.value for user_results in results for result in user_results)
+            log.info(
+                f"Completed token refresh check: {len(tokens)} tokens due, "
+                f"refreshed={counts[TokenRefreshResult.REFRESHED.value]}, "
+                f"rotated={counts[TokenRefreshResult.ROTATED.value]}, "
+                f"failed={counts[TokenRefreshResult.FAILED.value]}, "
+                f"skipped={counts[TokenRefreshResult.SKIPPED.value]} "
+                f"in {time.perf_counter() - started_at:.2f}s"
+            )
         except Exception as e:
             log.error(f"Error checking tokens for refresh: {str(e)}")
 
+    # Add partition maintenance job
+    async def maintain_partitions() -> None:
+        partition_maintenance_service = DependencyContainer.get_instance().partition_maintenance_service
+        assert partition_maintenance_service is not None, "Partition maintenance service is not initialized"
+
+        with use_resource_class(ResourceClass.SYNC):
+            for table in partition_maintenance_service.get_partitioned_tables():
+                try:
+                    # Mỗi bảng một transaction, lỗi của bảng này không chặn bảng kia
+                    async with AsyncSessionManager.session() as session:
+                        result = await partition_maintenance_service.maintain_partitions(session=session, table=table)
+                    log.info(
+                        f"Completed partition maintenance of {result.table}: "
+                        f"created={result.created}, dropped={result.dropped}, archived={result.archived}, "
+                        f"default_rows_deleted={result.default_rows_deleted}"
+                    )
+                except Exception as e:
+                    log.error(f"Error maintaining partitions of {table.value}: {str(e)}")
+
     # Schedule jobs
     scheduler.add_job(
         cleanup_expired_tokens,
@@ -605,6 +772,14 @@ def setup_scheduled_jobs(scheduler: AsyncIOScheduler) -> None:
         misfire_grace_time=None
     )
 
+    scheduler.add_job(
+        maintain_partitions,
+        IntervalTrigger(hours=24),
+        id='partition_maintenance',
+        replace_existing=True,
+        misfire_grace_time=None
+    )
+
     scheduler.add_job(
         check_tokens_for_refresh,
         IntervalTrigger(hours=24),
@@ -8,6 +8,7 @@ from src.app.controllers.jira_sprint_controller import JiraSprintController
 from src.app.controllers.jira_webhook_controller import JiraWebhookController
 from src.app.controllers.media_controller import MediaController
 from src.app.controllers.microsoft_calendar_controller import MicrosoftCalendarController
+from src.app.controllers.scheduler_controller import SchedulerController
 from src.app.controllers.system_config_controller import SystemConfigController
 from src.app.controllers.util_controller import UtilController
 from src.app.dependencies.repositories import get_jira_project_repository, get_jira_sprint_repository
@@ -21,6 +22,7 @@ from src.app.dependencies.services import (
     get_jira_sprint_service,
     get_media_service,
     get_microsoft_calendar_application_service,
+    get_scheduler_leader_service,
     get_sprint_analytics_application_service,
     get_system_config_service,
     get_util_service,
@@ -38,6 +40,7 @@ from src.domain.repositories.jira_project_repository import IJiraProjectReposito
 from src.domain.repositories.jira_sprint_repository import IJiraSprintRepository
 from src.domain.services.jira_performance_summary_service import IJiraPerformanceSummaryService
 from src.domain.services.jira_sprint_database_service import IJiraSprintDatabaseService
+from src.domain.services.scheduler_leader_service import ISchedulerLeaderService
 
 
 async def get_jira_issue_controller(
@@ -118,3 +121,10 @@ def get_jira_performance_summary_controller(
 ) -> JiraPerformanceSummaryController:
     """Dependency injection cho JiraPerformanceSummaryController"""
     return JiraPerformanceSummaryController(jira_performance_summary_service)
+
+
+def get_scheduler_controller(
+    scheduler_leader_service: ISchedulerLeaderService = Depends(get_scheduler_leader_service)
+) -> SchedulerController:
+    """Get scheduler controller"""
+    return SchedulerController(scheduler_leader_service=scheduler_leader_service)
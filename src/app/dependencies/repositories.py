@@ -1,22 +1,22 @@
 from fastapi import Depends
 
 from src.app.dependencies.container import DependencyContainer
+from src.domain.repositories.jira_user_repository import IJiraUserRepository
+from src.domain.repositories.sync_log_repository import ISyncLogRepository
 from src.infrastructure.repositories.sqlalchemy_jira_issue_history_repository import (
     SQLAlchemyJiraIssueHistoryRepository,
 )
 from src.infrastructure.repositories.sqlalchemy_jira_issue_repository import SQLAlchemyJiraIssueRepository
 from src.infrastructure.repositories.sqlalchemy_jira_project_repository import SQLAlchemyJiraProjectRepository
 from src.infrastructure.repositories.sqlalchemy_jira_sprint_repository import SQLAlchemyJiraSprintRepository
-from src.infrastructure.repositories.sqlalchemy_jira_user_repository import SQLAlchemyJiraUserRepository
 from src.infrastructure.repositories.sqlalchemy_media_repository import SQLAlchemyMediaRepository
 from src.infrastructure.repositories.sqlalchemy_refresh_token_repository import SQLAlchemyRefreshTokenRepository
-from src.infrastructure.repositories.sqlalchemy_sync_log_repository import SQLAlchemySyncLogRepository
 from src.infrastructure.repositories.sqlalchemy_system_config_repository import SQLAlchemySystemConfigRepository
 
 # Repositories dependencies
 
 
-def get_jira_user_repository() -> SQLAlchemyJiraUserRepository:
+def get_jira_user_repository() -> IJiraUserRepository:
     """Get Jira User repository from container"""
     container = DependencyContainer.get_instance()
     return container.jira_user_repository
@@ -34,7 +34,7 @@ def get_jira_project_repository() -> SQLAlchemyJiraProjectRepository:
     return container.project_repository
 
 
-def get_sync_log_repository() -> SQLAlchemySyncLogRepository:
+def get_sync_log_repository() -> ISyncLogRepository:
     """Get Sync Log repository from container"""
     container = DependencyContainer.get_instance()
     return container.sync_log_repository
@@ -71,7 +71,7 @@ def get_system_config_repository() -> SQLAlchemySystemConfigRepository:
 
 
 def get_jira_repositories(
-    user_repository: SQLAlchemyJiraUserRepository = Depends(get_jira_user_repository),
+    user_repository: IJiraUserRepository = Depends(get_jira_user_repository),
     project_repository: SQLAlchemyJiraProjectRepository = Depends(get_jira_project_repository),
     issue_repository: SQLAlchemyJiraIssueRepository = Depends(get_jira_issue_repository),
     sprint_repository: SQLAlchemyJiraSprintRepository = Depends(get_jira_sprint_repository),
@@ -52,11 +52,13 @@ from src.domain.services.jira_sprint_database_service import IJiraSprintDatabase
 from src.domain.services.jira_user_api_service import IJiraUserAPIService
 from src.domain.services.jira_user_database_service import IJiraUserDatabaseService
 from src.domain.services.nats_service import INATSService
+from src.domain.services.scheduler_leader_service import ISchedulerLeaderService
 from src.domain.services.token_scheduler_service import ITokenSchedulerService
 from src.domain.services.workflow_service_client import IWorkflowServiceClient
 from src.infrastructure.services.azure_blob_storage_service import AzureBlobStorageService
 from src.infrastructure.services.excel_file_service import ExcelFileService
 from src.infrastructure.services.gantt_chart_calculator_service import GanttChartCalculatorService
+from src.infrastructure.services.jira_board_cache_service import JiraBoardCacheService
 from src.infrastructure.services.jira_issue_api_service import JiraIssueAPIService
 from src.infrastructure.services.jira_issue_database_service import JiraIssueDatabaseService
 from src.infrastructure.services.jira_issue_history_database_service import JiraIssueHistoryDatabaseService
@@ -92,6 +94,12 @@ def get_nats_service() -> NATSService:
     return container.nats_service
 
 
+def get_scheduler_leader_service() -> ISchedulerLeaderService:
+    """Get scheduler leader election service from container"""
+    container = DependencyContainer.get_instance()
+    return container.scheduler_leader_service
+
+
 def get_nats_application_service() -> NATSApplicationService:
     """Get NATS application service from container"""
     container = DependencyContainer.get_instance()
@@ -240,6 +248,13 @@ async def get_jira_sprint_api_service(
     )
 
 
+def get_jira_board_cache_service(
+    redis_service: RedisService = Depends(get_redis_service)
+) -> JiraBoardCacheService:
+    """Get the board / sprint mapping cache"""
+    return JiraBoardCacheService(redis_service)
+
+
 # async def get_jira_sprint_database_service(
 #     sprint_repository: IJiraSprintRepository = Depends(get_jira_sprint_repository)
 # ) -> IJiraSprintDatabaseService:
@@ -472,7 +487,8 @@ async def get_webhook_handlers(
     jira_project_repository=Depends(get_jira_project_repository),
     redis_service=Depends(get_redis_service),
     nats_application_service=Depends(get_nats_application_service),
-    jira_sprint_repository=Depends(get_jira_sprint_repository)
+    jira_sprint_repository=Depends(get_jira_sprint_repository),
+    board_cache_service=Depends(get_jira_board_cache_service)
 ) -> List[JiraWebhookHandler]:
     """Get list of webhook handlers with dependencies"""
     return [
@@ -490,9 +506,9 @@ async def get_webhook_handlers(
         IssueDeleteWebhookHandler(jira_issue_repository, sync_log_repository),
 
         # Sprint handlers
-        SprintCreateWebhookHandler(sprint_database_service, sync_log_repository, jira_sprint_api_service),
+        SprintCreateWebhookHandler(sprint_database_service, sync_log_repository, jira_sprint_api_service, board_cache_service),
         SprintUpdateWebhookHandler(sprint_database_service, sync_log_repository, jira_sprint_api_service),
-        SprintStartWebhookHandler(sprint_database_service, sync_log_repository, jira_sprint_api_service),
+        SprintStartWebhookHandler(sprint_database_service, sync_log_repository, jira_sprint_api_service, board_cache_service),
         SprintCloseWebhookHandler(sprint_database_service, sync_log_repository,
                                   jira_sprint_api_service, jira_issue_repository),
         SprintDeleteWebhookHandler(sprint_database_service, sync_log_repository, jira_sprint_api_service),
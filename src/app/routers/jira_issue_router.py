@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.controllers.jira_issue_controller import JiraIssueController
@@ -13,7 +13,7 @@ from src.app.schemas.responses.jira_issue import (
     JiraIssueCommentAPIGetDTO,
     JiraIssueDescriptionAPIGetDTO,
 )
-from src.configs.database import get_db
+from src.configs.database import get_db, get_read_db
 from src.domain.models.apis.jira_issue_history import JiraIssueHistoryAPIGetDTO
 
 router = APIRouter()
@@ -22,18 +22,20 @@ router = APIRouter()
 @router.get("/{issue_key}/changelogs", response_model=StandardResponse[JiraIssueHistoryAPIGetDTO])
 async def get_issue_changelogs(
     issue_key: str,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Max number of changelogs, all if omitted"),
+    offset: int = Query(0, ge=0, description="Number of changelogs to skip"),
     controller: JiraIssueController = Depends(get_jira_issue_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_read_db)
 ) -> StandardResponse[JiraIssueHistoryAPIGetDTO]:
-    """Lấy changelog của một Jira Issue"""
-    return await controller.get_issue_changelogs(session, issue_key)
+    """Lấy changelog của một Jira Issue, response có total và hasMore để phân trang"""
+    return await controller.get_issue_changelogs(session, issue_key, limit=limit, offset=offset)
 
 
 @router.get("/{issue_key}/description", response_model=StandardResponse[JiraIssueDescriptionAPIGetDTO])
 async def get_issue_description(
     issue_key: str,
     controller: JiraIssueController = Depends(get_jira_issue_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_read_db)
 ) -> StandardResponse[JiraIssueDescriptionAPIGetDTO]:
     """Lấy HTML description của một Jira Issue"""
     return await controller.get_issue_description(session, issue_key)
@@ -43,7 +45,7 @@ async def get_issue_description(
 async def get_issue_comments(
     issue_key: str,
     controller: JiraIssueController = Depends(get_jira_issue_controller),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> StandardResponse[List[JiraIssueCommentAPIGetDTO]]:
     """Lấy comments của một Jira Issue"""
     return await controller.get_issue_comments(session, issue_key)
@@ -7,7 +7,7 @@ from src.app.controllers.jira_project_controller import JiraProjectController
 from src.app.dependencies.auth import get_jwt_claims
 from src.app.dependencies.controllers import get_jira_project_controller
 from src.app.schemas.requests.auth import JWTClaims
-from src.app.schemas.responses.base import StandardResponse
+from src.app.schemas.responses.base import CursorPaginatedResponse, StandardResponse
 from src.app.schemas.responses.jira_issue import (
     GetJiraIssueResponse,
 )
@@ -15,13 +15,13 @@ from src.app.schemas.responses.jira_project import (
     GetJiraProjectResponse,
     GetJiraSprintResponse,
 )
-from src.configs.database import get_db
+from src.configs.database import get_db, get_replica_db
 from src.domain.constants.jira import JiraIssueType
 
 router = APIRouter()
 
 
-@router.get("/{project_key}/issues", response_model=StandardResponse[List[GetJiraIssueResponse]])
+@router.get("/{project_key}/issues", response_model=CursorPaginatedResponse[List[GetJiraIssueResponse]])
 async def get_project_issues(
     project_key: str,
     claims: JWTClaims = Depends(get_jwt_claims),
@@ -31,10 +31,11 @@ async def get_project_issues(
         None, alias="issueType", description="Filter by issue type (Bug, Task, Story, Epic)"),
     search: Optional[str] = Query(None, alias="search", description="Search in issue summary and description"),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
     controller: JiraProjectController = Depends(get_jira_project_controller),
-    session: AsyncSession = Depends(get_db)
-) -> StandardResponse[List[GetJiraIssueResponse]]:
-    """Get issues from a specific Jira project"""
+    session: AsyncSession = Depends(get_replica_db)
+) -> CursorPaginatedResponse[List[GetJiraIssueResponse]]:
+    """Get issues from a specific Jira project, most recently updated first"""
     is_backlog: bool = False
     sprint_number: Optional[int] = None
     if sprint_id == "backlog":
@@ -51,7 +52,8 @@ async def get_project_issues(
         is_backlog=is_backlog,
         issue_type=issue_type,
         search=search,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
 
 
@@ -71,7 +73,7 @@ async def get_project_sprints(
     project_key: str,
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraProjectController = Depends(get_jira_project_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ) -> StandardResponse[List[GetJiraSprintResponse]]:
     """Get all sprints from a specific Jira project
 
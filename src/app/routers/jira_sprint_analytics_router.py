@@ -16,7 +16,7 @@ from src.app.schemas.responses.jira_sprint_analytics import (
     SprintGoalResponse,
     WorkloadResponse,
 )
-from src.configs.database import get_db
+from src.configs.database import get_db, get_replica_db
 
 router = APIRouter()
 
@@ -32,7 +32,7 @@ async def get_sprint_burndown_chart(
     sprint_id: int = Path(..., description="Sprint ID"),
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraSprintAnalyticsController = Depends(get_sprint_analytics_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Get burndown chart data for a sprint"""
     return await controller.get_sprint_burndown_chart(
@@ -54,7 +54,7 @@ async def get_sprint_burnup_chart(
     sprint_id: int = Path(..., description="Sprint ID"),
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraSprintAnalyticsController = Depends(get_sprint_analytics_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Get burnup chart data for a sprint"""
     return await controller.get_sprint_burnup_chart(
@@ -76,7 +76,7 @@ async def get_sprint_goal(
     sprint_id: int = Path(..., description="Sprint ID"),
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraSprintAnalyticsController = Depends(get_sprint_analytics_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Get sprint goal data for a sprint"""
     return await controller.get_sprint_goal(
@@ -98,7 +98,7 @@ async def get_bug_report(
     sprint_id: int = Path(..., description="Sprint ID"),
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraSprintAnalyticsController = Depends(get_sprint_analytics_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Get bug report data for a sprint"""
     return await controller.get_bug_report(
@@ -120,7 +120,7 @@ async def get_team_workload(
     sprint_id: int = Path(..., description="Sprint ID"),
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraSprintAnalyticsController = Depends(get_sprint_analytics_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Get workload data for team members in a sprint"""
     return await controller.get_team_workload(
@@ -142,7 +142,7 @@ async def get_gantt_chart_data(
     sprint_id: int = Path(..., description="Sprint ID"),
     claims: JWTClaims = Depends(get_jwt_claims),
     controller: JiraSprintAnalyticsController = Depends(get_sprint_analytics_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Get Gantt chart data for a sprint"""
     return await controller.get_gantt_chart_data(
@@ -6,7 +6,7 @@ from src.app.dependencies.controllers import get_jira_sprint_controller
 from src.app.schemas.requests.jira_sprint import SprintStartRequest
 from src.app.schemas.responses.base import StandardResponse
 from src.app.schemas.responses.jira_project import GetJiraSprintDetailsResponse, GetJiraSprintResponse
-from src.configs.database import get_db
+from src.configs.database import get_db, get_read_db
 
 router = APIRouter()
 
@@ -15,7 +15,7 @@ router = APIRouter()
 async def get_current_sprint(
     controller: JiraSprintController = Depends(get_jira_sprint_controller),
     project_key: str = Query(..., description="Key of the project to get current sprint", alias="projectKey"),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_read_db)
 ) -> StandardResponse[GetJiraSprintResponse]:
     """Get the current sprint in Jira"""
     return await controller.get_current_sprint(session=session, project_key=project_key)
@@ -25,7 +25,7 @@ async def get_current_sprint(
 async def get_sprint_by_id(
     sprint_id: int = Path(..., description="ID of the sprint to retrieve"),
     controller: JiraSprintController = Depends(get_jira_sprint_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_read_db)
 ) -> StandardResponse[GetJiraSprintDetailsResponse]:
     """Get detailed sprint information by ID.
 
@@ -6,7 +6,7 @@ from src.app.dependencies.controllers import get_jira_performance_summary_contro
 from src.app.schemas.requests.jira_performance_summary import PerformanceSummaryRequest
 from src.app.schemas.responses.base import StandardResponse
 from src.app.schemas.responses.jira_performance_summary import UserPerformanceSummaryResponse
-from src.configs.database import get_db
+from src.configs.database import get_replica_db
 
 router = APIRouter()
 
@@ -17,7 +17,7 @@ async def get_user_performance_summary(
     quarter: int,
     year: int,
     controller: JiraPerformanceSummaryController = Depends(get_jira_performance_summary_controller),
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_replica_db)
 ):
     """Lấy thông tin hiệu suất của người dùng trong một quý"""
     request = PerformanceSummaryRequest(user_id=user_id, quarter=quarter, year=year)
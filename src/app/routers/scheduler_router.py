@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from src.app.controllers.scheduler_controller import SchedulerController
+from src.app.dependencies.controllers import get_scheduler_controller
+from src.app.schemas.responses.base import StandardResponse
+from src.app.schemas.responses.scheduler import SchedulerLeaderStatusResponse
+
+router = APIRouter()
+
+
+@router.get("/leader", response_model=StandardResponse[SchedulerLeaderStatusResponse])
+async def get_scheduler_leader(
+    controller: SchedulerController = Depends(get_scheduler_controller)
+):
+    """Get the process currently elected to run scheduled jobs"""
+    return await controller.get_leader_status()
@@ -22,3 +22,8 @@ class StandardResponse(BaseModel, Generic[T]):
         populate_by_name=True,
         from_attributes=True
     )
+
+
+class CursorPaginatedResponse(StandardResponse[T], Generic[T]):
+    """StandardResponse with the cursor of the next page (None on the last page)"""
+    next_cursor: Optional[str] = None
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from src.app.schemas.responses.base import BaseResponse
+from src.domain.models.scheduler_leader import SchedulerLeaderStatusModel
+
+
+class SchedulerLeaderStatusResponse(BaseResponse):
+    instance_id: str
+    is_leader: bool
+    leader_id: Optional[str] = None
+    lease_seconds: int
+    acquired_at: Optional[str] = None
+    last_renewed_at: Optional[str] = None
+
+    @classmethod
+    def from_domain(cls, status: SchedulerLeaderStatusModel) -> "SchedulerLeaderStatusResponse":
+        return cls(
+            instance_id=status.instance_id,
+            is_leader=status.is_leader,
+            leader_id=status.leader_id,
+            lease_seconds=status.lease_seconds,
+            acquired_at=status.acquired_at.isoformat() if status.acquired_at else None,
+            last_renewed_at=status.last_renewed_at.isoformat() if status.last_renewed_at else None
+        )
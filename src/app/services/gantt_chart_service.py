@@ -4,6 +4,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.services.system_config_service import SystemConfigApplicationService
 from src.configs.logger import log
+from src.configs.metrics import timed_computation
 from src.domain.models.database.jira_issue import JiraIssueDBUpdateDTO
 from src.domain.models.gantt_chart import (
     GanttChartConnectionModel,
@@ -36,6 +37,7 @@ class GanttChartApplicationService:
         self.workflow_service_client = workflow_service_client
         self.system_config_service = system_config_service
 
+    @timed_computation("gantt.get_gantt_chart")
     async def get_gantt_chart(
         self,
         session: AsyncSession,
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -13,6 +13,8 @@ from src.domain.models.apis.jira_issue_history import (
 )
 from src.domain.models.database.jira_issue_history import JiraIssueHistoryChangeDBCreateDTO, JiraIssueHistoryDBCreateDTO
 from src.domain.models.jira.apis.responses.jira_changelog import JiraChangelogDetailAPIGetResponseDTO
+from src.domain.models.jira_issue_history import JiraIssueHistoryModel
+from src.domain.models.jira_user import JiraUserModel
 from src.domain.services.jira_issue_api_service import IJiraIssueAPIService
 from src.domain.services.jira_issue_database_service import IJiraIssueDatabaseService
 from src.domain.services.jira_issue_history_database_service import IJiraIssueHistoryDatabaseService
@@ -22,6 +24,17 @@ from src.domain.services.jira_user_database_service import IJiraUserDatabaseServ
 class JiraIssueHistoryApplicationService:
     """Service đồng bộ lịch sử thay đổi issue từ Jira API"""
 
+    # Các field được trả về trong changelog (tên field trong database -> enum)
+    CHANGELOG_FIELD_MAPPING: Dict[str, JiraIssueFieldId] = {
+        "status": JiraIssueFieldId.STATUS,
+        "sprint": JiraIssueFieldId.SPRINT,
+        "assignee": JiraIssueFieldId.ASSIGNEE,
+        "story_points": JiraIssueFieldId.STORY_POINTS,
+        "summary": JiraIssueFieldId.SUMMARY,
+        "description": JiraIssueFieldId.DESCRIPTION,
+        "reporter": JiraIssueFieldId.REPORTER,
+    }
+
     def __init__(
         self,
         jira_issue_api_service: IJiraIssueAPIService,
@@ -120,12 +133,20 @@ class JiraIssueHistoryApplicationService:
 
         return field_mapping.get(jira_field_name, jira_field_name)
 
-    async def get_issue_changelogs(self, session: AsyncSession, issue_key: str) -> JiraIssueHistoryAPIGetDTO:
+    async def get_issue_changelogs(
+        self,
+        session: AsyncSession,
+        issue_key: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> JiraIssueHistoryAPIGetDTO:
         """Lấy changelog của một Jira Issue
 
         Args:
             session: The database session
             issue_key: Key của Jira Issue
+            limit: Số history event tối đa (None = lấy tất cả)
+            offset: Số history event bỏ qua
 
         Returns:
             Lịch sử thay đổi của issue
@@ -135,13 +156,34 @@ class JiraIssueHistoryApplicationService:
             if not issue:
                 raise JiraIssueNotFoundError(f"Issue {issue_key} not found")
 
-            # Lấy tất cả các changelog từ database
-            history_events = await self.issue_history_db_service.get_issue_history(session, issue.jira_issue_id)
+            # Lọc field không hỗ trợ và tác giả không xác định ngay trong truy vấn,
+            # để limit/offset áp dụng lên các changelog thực sự được trả về
+            field_names = list(self.CHANGELOG_FIELD_MAPPING.keys())
+            history_events = await self.issue_history_db_service.get_issue_history(
+                session,
+                issue.jira_issue_id,
+                limit=limit,
+                offset=offset,
+                field_names=field_names,
+                with_known_author=True
+            )
+            if limit is None and not offset:
+                total = len(history_events)
+            else:
+                total = await self.issue_history_db_service.count_issue_history(
+                    session,
+                    issue.jira_issue_id,
+                    field_names=field_names,
+                    with_known_author=True
+                )
+
+            # Lấy thông tin tất cả user liên quan (tác giả + assignee mới) trong một lần
+            users = await self._get_users_by_account_id(session, history_events)
 
             # Chuyển đổi sang định dạng DTO
             changelogs = []
             for event in history_events:
-                changelog = await self._convert_to_changelog_dto(session, event)
+                changelog = self._convert_to_changelog_dto(event, users)
                 if changelog:
                     changelogs.append(changelog)
 
@@ -149,13 +191,33 @@ class JiraIssueHistoryApplicationService:
             return JiraIssueHistoryAPIGetDTO(
                 key=issue_key,
                 created_at=issue.created_at.isoformat(),
-                changelogs=changelogs
+                changelogs=changelogs,
+                total=total,
+                has_more=offset + len(history_events) < total
             )
         except Exception as e:
             log.error(f"Error getting changelogs for issue {issue_key}: {str(e)}")
             raise e
 
-    async def _convert_to_changelog_dto(self, session: AsyncSession, event) -> Optional[JiraIssueChangelogAPIGetDTO]:
+    async def _get_users_by_account_id(self, session: AsyncSession, history_events: List[JiraIssueHistoryModel]) -> Dict[str, JiraUserModel]:
+        """Lấy các user được tham chiếu trong history events (tác giả, assignee mới) bằng một truy vấn"""
+        account_ids: Set[str] = set()
+        for event in history_events:
+            if event.author_id:
+                account_ids.add(event.author_id)
+            if event.field_name == "assignee" and event.new_value:
+                account_ids.add(event.new_value)
+
+        if not account_ids:
+            return {}
+
+        users = await self.jira_user_db_service.get_users_by_jira_account_ids(
+            session=session,
+            jira_account_ids=list(account_ids)
+        )
+        return {user.jira_account_id: user for user in users if user.jira_account_id}
+
+    def _convert_to_changelog_dto(self, event: JiraIssueHistoryModel, users: Dict[str, JiraUserModel]) -> Optional[JiraIssueChangelogAPIGetDTO]:
         """Chuyển đổi dữ liệu từ database sang DTO"""
         try:
             # Chuyển đổi field name sang fieldId enum
@@ -164,14 +226,16 @@ class JiraIssueHistoryApplicationService:
                 return None
 
             # Lấy thông tin tác giả
-            author = await self._get_author_info(session, event.author_id)
-            if not author:
+            author_user = users.get(event.author_id) if event.author_id else None
+            if not author_user:
                 return None
+            author = JiraIssueChangelogAuthorAPIGetDTO.from_domain(author_user)
 
             # If field id is assignee, we need to get the avatar url from the user
             avatar_url = None
             if field_id == JiraIssueFieldId.ASSIGNEE:
-                avatar_url = await self._get_assignee_avatar_url(session=session, assignee_id=event.new_value)
+                assignee = users.get(event.new_value) if event.new_value else None
+                avatar_url = assignee.avatar_url if assignee else None
 
             # Tạo đối tượng DTO
             return JiraIssueChangelogAPIGetDTO(
@@ -187,19 +251,9 @@ class JiraIssueHistoryApplicationService:
 
     def _map_field_to_enum(self, field_name: str) -> Optional[JiraIssueFieldId]:
         """Map tên field từ database sang enum"""
-        field_mapping = {
-            "status": JiraIssueFieldId.STATUS,
-            "sprint": JiraIssueFieldId.SPRINT,
-            "assignee": JiraIssueFieldId.ASSIGNEE,
-            "story_points": JiraIssueFieldId.STORY_POINTS,
-            "summary": JiraIssueFieldId.SUMMARY,
-            "description": JiraIssueFieldId.DESCRIPTION,
-            "reporter": JiraIssueFieldId.REPORTER,
-        }
-
-        return field_mapping.get(field_name)
+        return self.CHANGELOG_FIELD_MAPPING.get(field_name)
 
-    def _create_changelog_data(self, display_value: str, value: str, avatar_url: Optional[str] = None) -> Optional[JiraIssueChangelogDataAPIGetDTO]:
+    def _create_changelog_data(self, display_value: Optional[str], value: Optional[str], avatar_url: Optional[str] = None) -> Optional[JiraIssueChangelogDataAPIGetDTO]:
         """Tạo đối tượng JiraIssueChangelogData"""
         if not display_value and not value:
             return None
@@ -209,29 +263,3 @@ class JiraIssueHistoryApplicationService:
             value=value,
             avatar_url=avatar_url
         )
-
-    async def _get_author_info(self, session: AsyncSession, author_id: str) -> Optional[JiraIssueChangelogAuthorAPIGetDTO]:
-        """Lấy thông tin tác giả từ database"""
-        try:
-            user = await self.jira_user_db_service.get_user_by_jira_account_id(
-                session=session,
-                jira_account_id=author_id
-            )
-            if not user:
-                return None
-
-            return JiraIssueChangelogAuthorAPIGetDTO.from_domain(user)
-
-        except Exception as e:
-            log.error(f"Error getting author info for {author_id}: {str(e)}")
-            return None
-
-    async def _get_assignee_avatar_url(self, session: AsyncSession, assignee_id: str) -> Optional[str]:
-        """Lấy avatar url của assignee"""
-        user = await self.jira_user_db_service.get_user_by_jira_account_id(
-            session=session,
-            jira_account_id=assignee_id
-        )
-        if not user:
-            return None
-        return user.avatar_url
@@ -1,6 +1,6 @@
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -31,6 +31,7 @@ from src.domain.repositories.jira_project_repository import IJiraProjectReposito
 from src.domain.repositories.jira_sprint_repository import IJiraSprintRepository
 from src.domain.repositories.jira_user_repository import IJiraUserRepository
 from src.domain.repositories.sync_log_repository import ISyncLogRepository
+from src.domain.services.jira_board_cache_service import IJiraBoardCacheService
 from src.domain.services.jira_issue_api_service import IJiraIssueAPIService
 from src.domain.services.jira_issue_database_service import IJiraIssueDatabaseService
 from src.domain.services.jira_project_api_service import IJiraProjectAPIService
@@ -54,7 +55,8 @@ class JiraProjectApplicationService:
         jira_issue_repository: IJiraIssueRepository,
         jira_sprint_repository: IJiraSprintRepository,
         jira_user_repository: IJiraUserRepository,
-        jira_issue_history_repository: IJiraIssueHistoryRepository
+        jira_issue_history_repository: IJiraIssueHistoryRepository,
+        board_cache_service: Optional[IJiraBoardCacheService] = None
     ):
         self.jira_project_api_service = jira_project_api_service
         self.jira_project_db_service = jira_project_db_service
@@ -68,6 +70,7 @@ class JiraProjectApplicationService:
         self.jira_sprint_repository = jira_sprint_repository
         self.jira_user_repository = jira_user_repository
         self.jira_issue_history_repository = jira_issue_history_repository
+        self.board_cache_service = board_cache_service
 
     async def get_project_issues(
         self,
@@ -78,9 +81,10 @@ class JiraProjectApplicationService:
         is_backlog: Optional[bool] = None,
         issue_type: Optional[JiraIssueType] = None,
         search: Optional[str] = None,
-        limit: int = 50
-    ) -> List[JiraIssueModel]:
-        return await self.jira_issue_db_service.get_project_issues(
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[JiraIssueModel], Optional[str]]:
+        return await self.jira_issue_db_service.get_project_issues_page(
             session=session,
             user_id=user_id,
             project_key=project_key,
@@ -88,7 +92,8 @@ class JiraProjectApplicationService:
             is_backlog=is_backlog,
             issue_type=issue_type,
             search=search,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
 
     async def get_accessible_projects(self, session: AsyncSession, user_id: int) -> List[JiraProjectModel]:
@@ -439,6 +444,13 @@ class JiraProjectApplicationService:
                 log.error(f"Error syncing sprint {sprint.jira_sprint_id}: {str(e)}")
                 continue
 
+        # Webhook sprint sau này tìm project key từ cache thay vì gọi lại Jira
+        if self.board_cache_service:
+            await self.board_cache_service.set_project_sprints(
+                project_key,
+                {sprint.jira_sprint_id: sprint.board_id for sprint in sprints if sprint.board_id}
+            )
+
         return sprint_id_mapping
 
     async def _sync_project_issues(
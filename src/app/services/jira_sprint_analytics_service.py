@@ -16,6 +16,7 @@ from src.app.schemas.responses.jira_sprint_analytics import (
     WorkloadResponse,
 )
 from src.configs.logger import log
+from src.configs.metrics import timed_computation
 from src.domain.models.apis.jira_user import JiraAssigneeResponse
 from src.domain.repositories.jira_issue_repository import IJiraIssueRepository
 from src.domain.repositories.jira_sprint_repository import IJiraSprintRepository
@@ -34,6 +35,7 @@ class JiraSprintAnalyticsApplicationService:
         """Làm tròn danh sách các số thập phân đến 2 chữ số"""
         return [round(value, 2) for value in float_list]
 
+    @timed_computation("analytics.sprint_burndown")
     async def get_sprint_burndown_chart(
         self,
         session: AsyncSession,
@@ -91,6 +93,7 @@ class JiraSprintAnalyticsApplicationService:
             log.error(f"Error getting sprint burndown chart: {str(e)}")
             raise
 
+    @timed_computation("analytics.sprint_burnup")
     async def get_sprint_burnup_chart(
         self,
         session: AsyncSession,
@@ -161,6 +164,7 @@ class JiraSprintAnalyticsApplicationService:
             log.error(f"Error getting sprint burnup chart: {str(e)}")
             raise
 
+    @timed_computation("analytics.sprint_goal")
     async def get_sprint_goal(
         self,
         session: AsyncSession,
@@ -203,6 +207,7 @@ class JiraSprintAnalyticsApplicationService:
             log.error(f"Error getting sprint goal: {str(e)}")
             raise
 
+    @timed_computation("analytics.bug_report")
     async def get_bug_report(
         self,
         session: AsyncSession,
@@ -270,6 +275,7 @@ class JiraSprintAnalyticsApplicationService:
             log.error(f"Error getting bug report: {str(e)}")
             raise
 
+    @timed_computation("analytics.team_workload")
     async def get_team_workload(
         self,
         session: AsyncSession,
@@ -299,6 +305,7 @@ class JiraSprintAnalyticsApplicationService:
             log.error(f"Error getting team workload: {str(e)}")
             raise
 
+    @timed_computation("analytics.gantt_chart_data")
     async def get_gantt_chart_data(
         self,
         session: AsyncSession,
@@ -3,7 +3,7 @@ from typing import Any, Dict
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.services.jira_webhook_handlers.jira_webhook_handler import JiraWebhookHandler
-from src.configs.logger import log
+from src.configs.logger import log, log_rate_limited
 from src.domain.constants.jira import JiraWebhookEvent
 from src.domain.constants.sync import EntityType, OperationType, SourceType
 from src.domain.models.database.sync_log import SyncLogDBCreateDTO
@@ -85,7 +85,7 @@ class IssueCreateWebhookHandler(JiraWebhookHandler):
             )
         )
 
-        log.info(f"Successfully created issue {issue_id} from webhook")
+        log_rate_limited("webhook.issue_created", "INFO", "Successfully created issue {} from webhook", issue_id)
 
         return {
             "issue_id": issue_id,
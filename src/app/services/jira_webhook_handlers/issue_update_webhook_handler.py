@@ -6,7 +6,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from src.app.services.jira_issue_history_service import JiraIssueHistoryApplicationService
 from src.app.services.jira_webhook_handlers.jira_webhook_handler import JiraWebhookHandler
 from src.app.services.nats_application_service import NATSApplicationService
-from src.configs.logger import log
+from src.configs.logger import log, log_rate_limited
 from src.domain.constants.jira import JiraIssueStatus, JiraWebhookEvent
 from src.domain.constants.sync import EntityType, OperationType, SourceType
 from src.domain.models.database.sync_log import SyncLogDBCreateDTO
@@ -76,7 +76,7 @@ class IssueUpdateWebhookHandler(JiraWebhookHandler):
         if self.issue_history_sync_service:
             try:
                 await self.issue_history_sync_service.sync_issue_history(session=session, issue_id=issue_id)
-                log.info(f"Successfully synced history for issue {issue_id} from Jira API")
+                log_rate_limited("webhook.issue_history_synced", "INFO", "Successfully synced history for issue {} from Jira API", issue_id)
             except Exception as e:
                 log.error(f"Error syncing history for issue {issue_id}: {str(e)}")
 
@@ -4,14 +4,17 @@ from typing import Any, Dict, Optional
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.configs.logger import log
+from src.configs.tracing import tracer
 from src.domain.models.jira.webhooks.jira_webhook import (
     BaseJiraWebhookDTO,
 )
 from src.domain.models.jira_issue import JiraIssueModel
+from src.domain.models.jira_sprint import JiraSprintModel
 from src.domain.models.jira_user import JiraUserModel
 from src.domain.repositories.jira_issue_repository import IJiraIssueRepository
 from src.domain.repositories.jira_user_repository import IJiraUserRepository
 from src.domain.repositories.sync_log_repository import ISyncLogRepository
+from src.domain.services.jira_board_cache_service import IJiraBoardCacheService
 from src.domain.services.jira_issue_api_service import IJiraIssueAPIService
 from src.domain.services.jira_issue_history_database_service import IJiraIssueHistoryDatabaseService
 from src.domain.services.jira_sprint_api_service import IJiraSprintAPIService
@@ -23,6 +26,9 @@ from src.domain.services.jira_user_database_service import IJiraUserDatabaseServ
 class JiraWebhookHandler(ABC):
     """Base class for Jira webhook handlers"""
 
+    # Các lớp con không gọi super().__init__: mặc định không dùng cache board / sprint
+    board_cache_service: Optional[IJiraBoardCacheService] = None
+
     # Hàm khởi tạo này sẽ được ghi đè bởi các lớp con
     def __init__(
         self,
@@ -34,7 +40,8 @@ class JiraWebhookHandler(ABC):
         jira_user_repository: Optional[IJiraUserRepository] = None,
         jira_user_api_service: Optional[IJiraUserAPIService] = None,
         user_database_service: Optional[IJiraUserDatabaseService] = None,
-        jira_issue_history_service: Optional[IJiraIssueHistoryDatabaseService] = None
+        jira_issue_history_service: Optional[IJiraIssueHistoryDatabaseService] = None,
+        board_cache_service: Optional[IJiraBoardCacheService] = None
     ):
         self.jira_issue_repository = jira_issue_repository
         self.sync_log_repository = sync_log_repository
@@ -45,6 +52,7 @@ class JiraWebhookHandler(ABC):
         self.jira_user_api_service = jira_user_api_service
         self.user_database_service = user_database_service
         self.jira_issue_history_service = jira_issue_history_service
+        self.board_cache_service = board_cache_service
 
     @abstractmethod
     async def can_handle(self, webhook_event: str) -> bool:
@@ -91,40 +99,72 @@ class JiraWebhookHandler(ABC):
             if not await self.can_handle(event_type):
                 return None
 
-            result = await self.handle(session, webhook_data)
+            with tracer.start_as_current_span(f"webhook.handler {type(self).__name__}") as span:
+                span.set_attribute("jira.webhook.event", event_type)
+                result = await self.handle(session, webhook_data)
             return result
 
         except Exception as e:
             log.error(f"Error processing webhook: {str(e)}")
             raise
 
-    async def get_project_key_for_sprint(self, sprint_id: int) -> Optional[str]:
-        """Get project key for a sprint by fetching board information"""
-        if not self.jira_sprint_api_service:
-            return None
+    async def get_project_key_for_sprint(self, sprint_id: int, sprint_data: Optional[JiraSprintModel] = None) -> Optional[str]:
+        """Get project key for a sprint from the sprint itself, the board cache, or by fetching sprint and board information
 
+        Args:
+            sprint_id: Jira sprint ID
+            sprint_data: Sprint already fetched by the caller (not fetched again)
+        """
+        board_cache = self.board_cache_service
         try:
-            # Lấy sprint data sử dụng admin auth
-            sprint_data = await self.jira_sprint_api_service.get_sprint_by_id_with_admin_auth(sprint_id)
-            if not sprint_data:
-                log.error(f"Could not find sprint data for {sprint_id}")
-                return None
-
             # Nếu sprint đã có project_key, dùng luôn
-            if sprint_data.project_key:
+            if sprint_data and sprint_data.project_key:
                 return sprint_data.project_key
 
-            # Nếu có origin_board_id, lấy board để lấy project_key
-            if not hasattr(sprint_data, 'board_id') or not sprint_data.board_id:
-                log.error(f"Sprint {sprint_id} does not have board_id")
+            board_id = sprint_data.board_id if sprint_data else None
+            # Mapping sprint -> board -> project gần như không đổi: xem cache trước khi gọi Jira
+            if board_cache:
+                if board_id is not None:
+                    # Sprint mới (create / start webhook): ghi lại board để các webhook sau không phải gọi Jira
+                    await board_cache.set_sprint_board(sprint_id, board_id)
+                elif sprint_data is None:
+                    board_id = await board_cache.get_sprint_board_id(sprint_id)
+                if board_id is not None:
+                    project_key = await board_cache.get_board_project_key(board_id)
+                    if project_key:
+                        return project_key
+
+            if not self.jira_sprint_api_service:
                 return None
 
+            if board_id is None:
+                if sprint_data is None:
+                    # Lấy sprint data sử dụng admin auth
+                    sprint_data = await self.jira_sprint_api_service.get_sprint_by_id_with_admin_auth(sprint_id)
+                    if not sprint_data:
+                        log.error(f"Could not find sprint data for {sprint_id}")
+                        return None
+
+                    # Nếu sprint đã có project_key, dùng luôn
+                    if sprint_data.project_key:
+                        return sprint_data.project_key
+
+                # Nếu có origin_board_id, lấy board để lấy project_key
+                if not sprint_data.board_id:
+                    log.error(f"Sprint {sprint_id} does not have board_id")
+                    return None
+                board_id = sprint_data.board_id
+                if board_cache:
+                    await board_cache.set_sprint_board(sprint_id, board_id)
+
             # Lấy board details để lấy project_key
-            board_data = await self.jira_sprint_api_service.get_board_by_id_with_admin_auth(sprint_data.board_id)
+            board_data = await self.jira_sprint_api_service.get_board_by_id_with_admin_auth(board_id)
             if not board_data:
-                log.error(f"Could not find board data for ID {sprint_data.board_id}")
+                log.error(f"Could not find board data for ID {board_id}")
                 return None
 
+            if board_cache and board_data.project_key:
+                await board_cache.set_board_project(board_id, board_data.project_key)
             return board_data.project_key
 
         except Exception as e:
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -11,6 +11,7 @@ from src.domain.models.database.jira_sprint import JiraSprintDBCreateDTO, JiraSp
 from src.domain.models.database.sync_log import SyncLogDBCreateDTO
 from src.domain.models.jira.webhooks.jira_webhook import JiraSprintWebhookDTO
 from src.domain.repositories.sync_log_repository import ISyncLogRepository
+from src.domain.services.jira_board_cache_service import IJiraBoardCacheService
 from src.domain.services.jira_sprint_api_service import IJiraSprintAPIService
 from src.domain.services.jira_sprint_database_service import IJiraSprintDatabaseService
 
@@ -22,11 +23,13 @@ class SprintStartWebhookHandler(JiraWebhookHandler):
         self,
         sprint_database_service: IJiraSprintDatabaseService,
         sync_log_repository: ISyncLogRepository,
-        jira_sprint_api_service: IJiraSprintAPIService
+        jira_sprint_api_service: IJiraSprintAPIService,
+        board_cache_service: Optional[IJiraBoardCacheService] = None
     ):
         self.sprint_database_service = sprint_database_service
         self.sync_log_repository = sync_log_repository
         self.jira_sprint_api_service = jira_sprint_api_service
+        self.board_cache_service = board_cache_service
 
     async def can_handle(self, webhook_event: str) -> bool:
         """Check if this handler can process the given webhook event"""
@@ -48,7 +51,7 @@ class SprintStartWebhookHandler(JiraWebhookHandler):
         try:
             if not existing_sprint:
                 # Cần project_key cho sprint mới
-                project_key = await self.get_project_key_for_sprint(sprint_id)
+                project_key = await self.get_project_key_for_sprint(sprint_id, sprint_data=sprint_data)
                 if not project_key:
                     log.error(f"Could not determine project key for sprint {sprint_id}")
                     return {"error": f"Could not determine project key for sprint {sprint_id}"}
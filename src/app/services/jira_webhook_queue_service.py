@@ -3,11 +3,24 @@ from contextlib import asynccontextmanager
 import time
 from typing import Dict, List, Optional, Set, Tuple
 
+from opentelemetry.context import Context
+from opentelemetry.trace import StatusCode
+
 from src.app.dependencies.container import DependencyContainer
 from src.app.services.jira_webhook_handlers.jira_webhook_handler import JiraWebhookHandler
 from src.configs.database import AsyncSessionManager
 from src.configs.logger import log
+from src.configs.metrics import (
+    WEBHOOK_DROPPED,
+    WEBHOOK_PROCESSING_SECONDS,
+    WEBHOOK_QUEUE_DEPTH,
+    WEBHOOK_QUEUE_WAIT_SECONDS,
+    WEBHOOK_RETRIES,
+)
+from src.configs.resource_pools import use_resource_class
+from src.configs.tracing import tracer
 from src.domain.constants.jira import JiraWebhookEvent
+from src.domain.constants.resource_pools import ResourceClass
 from src.domain.models.jira.webhooks.jira_webhook import (
     BaseJiraWebhookDTO,
 )
@@ -54,6 +67,12 @@ class JiraWebhookQueueService:
         self.RETRY_DELAYS = [5, 30, 300]  # Retry delays in seconds: 5s, 30s, 5min
         self.jira_issue_history_service = jira_issue_history_service
 
+        # Độ sâu hàng đợi được đọc khi Prometheus scrape
+        WEBHOOK_QUEUE_DEPTH.labels(queue="entity").set_function(
+            lambda: sum(queue.qsize() for queue in list(self.queues.values()))
+        )
+        WEBHOOK_QUEUE_DEPTH.labels(queue="retry").set_function(lambda: self.retry_queue.qsize())
+
     def _start_retry_worker(self) -> None:
         """Khởi động worker xử lý retry queue"""
         retry_task = asyncio.create_task(self._process_retry_queue())
@@ -170,13 +189,16 @@ class JiraWebhookQueueService:
 
         try:
             queue = self.queues[entity_id]
-            await asyncio.sleep(self.DEBOUNCE_TIME)
+            with tracer.start_as_current_span("webhook.debounce") as span:
+                span.set_attribute("jira.entity_id", entity_id)
+                await asyncio.sleep(self.DEBOUNCE_TIME)
 
             webhooks: List[BaseJiraWebhookDTO] = []
             highest_priority = float('inf')
 
             while not queue.empty():
-                priority, _, webhook = await queue.get()
+                priority, enqueued_at, webhook = await queue.get()
+                WEBHOOK_QUEUE_WAIT_SECONDS.labels(queue="entity").observe(time.time() - enqueued_at)
                 webhooks.append(webhook)
                 highest_priority = min(highest_priority, priority)
                 queue.task_done()
@@ -188,7 +210,10 @@ class JiraWebhookQueueService:
             last_webhook = webhooks[-1]
 
             # Process with a new session to avoid session conflicts
-            success = await self._process_webhook_with_new_session(last_webhook)
+            with tracer.start_as_current_span("webhook.queue.process") as span:
+                span.set_attribute("jira.entity_id", entity_id)
+                span.set_attribute("jira.webhook.coalesced", len(webhooks))
+                success = await self._process_webhook_with_new_session(last_webhook)
 
             if not success:
                 log.warning(f"Failed to process webhook for entity {entity_id}")
@@ -210,6 +235,7 @@ class JiraWebhookQueueService:
             try:
                 if not self.retry_queue.empty():
                     priority, timestamp, webhook = await self.retry_queue.get()
+                    WEBHOOK_QUEUE_WAIT_SECONDS.labels(queue="retry").observe(time.time() - timestamp)
 
                     # Get retry count for this webhook
                     webhook_key = self._get_webhook_key(webhook)
@@ -217,8 +243,10 @@ class JiraWebhookQueueService:
 
                     if retry_count < self.max_retries:
                         try:
-                            # Process with new session
-                            success = await self._process_webhook_with_new_session(webhook)
+                            # Process with new session; retry là trace riêng vì request gốc đã kết thúc từ lâu
+                            with tracer.start_as_current_span("webhook.retry", context=Context()) as span:
+                                span.set_attribute("jira.webhook.retry", retry_count + 1)
+                                success = await self._process_webhook_with_new_session(webhook)
 
                             if success:
                                 # Success - clear retry count
@@ -228,6 +256,7 @@ class JiraWebhookQueueService:
                                 # Failed - schedule next retry
                                 self.retry_counts[webhook_key] = retry_count + 1
                                 delay = self.RETRY_DELAYS[min(retry_count, len(self.RETRY_DELAYS) - 1)]
+                                WEBHOOK_RETRIES.labels(event=webhook.webhook_event).inc()
                                 await asyncio.sleep(delay)
                                 await self.retry_queue.put((priority + 1, time.time(), webhook))
                                 log.warning(
@@ -239,11 +268,13 @@ class JiraWebhookQueueService:
                             self.retry_counts[webhook_key] = retry_count + 1
                             if retry_count < self.max_retries - 1:
                                 delay = self.RETRY_DELAYS[retry_count]
+                                WEBHOOK_RETRIES.labels(event=webhook.webhook_event).inc()
                                 await asyncio.sleep(delay)
                                 await self.retry_queue.put((priority + 1, time.time(), webhook))
                                 log.warning(f"Scheduled retry #{retry_count + 2} for {webhook_key} in {delay}s")
                     else:
                         log.error(f"Failed to process webhook after {self.max_retries} retries: {webhook}")
+                        WEBHOOK_DROPPED.labels(event=webhook.webhook_event).inc()
                         # Clear retry count for failed webhook
                         self.retry_counts.pop(webhook_key, None)
 
@@ -302,12 +333,14 @@ class JiraWebhookQueueService:
                     new_priority = priority + retry_count + 1
 
                     # Schedule retry after delay
+                    WEBHOOK_RETRIES.labels(event=webhook.webhook_event).inc()
                     await asyncio.sleep(delay)
                     await self.retry_queue.put((new_priority, time.time(), webhook))
 
                     log.info(f"Scheduled retry #{retry_count + 1} for webhook {webhook_key} after {delay}s")
                 else:
                     log.error(f"Failed to process webhook {webhook_key} after {self.max_retries} retries")
+                    WEBHOOK_DROPPED.labels(event=webhook.webhook_event).inc()
                     # Clear retry count
                     self.retry_counts.pop(webhook_key, None)
             except Exception as e:
@@ -356,23 +389,35 @@ class JiraWebhookQueueService:
 
     async def _process_webhook_with_new_session(self, webhook_data: BaseJiraWebhookDTO) -> bool:
         """Xử lý webhook với một session database mới và độc lập"""
+        started_at = time.perf_counter()
+        outcome = "error"
         try:
             # Sử dụng context manager để đảm bảo session được đóng đúng cách
-            async with self._get_webhook_service() as (webhook_service, session):
-                # Xử lý webhook, passing the session explicitly
-                result = await webhook_service.handle_webhook(session, webhook_data)
-
-                # Kiểm tra kết quả
-                if result and "error" in result:
-                    log.warning(f"Error in webhook processing: {result['error']}")
-                    return False
-
-                return True
+            # DB session và Jira request tính vào ngân sách của webhook, không chiếm của UI
+            with tracer.start_as_current_span("webhook.handle") as span, use_resource_class(ResourceClass.WEBHOOK):
+                span.set_attribute("jira.webhook.event", webhook_data.webhook_event)
+                async with self._get_webhook_service() as (webhook_service, session):
+                    # Xử lý webhook, passing the session explicitly
+                    result = await webhook_service.handle_webhook(session, webhook_data)
+
+                    # Kiểm tra kết quả
+                    if result and "error" in result:
+                        log.warning(f"Error in webhook processing: {result['error']}")
+                        span.set_status(StatusCode.ERROR, str(result['error']))
+                        outcome = "failed"
+                        return False
+
+                    outcome = "success"
+                    return True
 
         except Exception as e:
             log.error(f"Exception processing webhook: {str(e)}")
             # Don't try to close the session here as it's managed by the context manager
             return False
+        finally:
+            WEBHOOK_PROCESSING_SECONDS.labels(event=webhook_data.webhook_event, outcome=outcome).observe(
+                time.perf_counter() - started_at
+            )
 
     # Cleanup method để xóa các retry counts cũ
     async def cleanup_retry_counts(self) -> None:
@@ -1,22 +1,33 @@
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Mapping, Optional
 
 from src.configs.database import AsyncSessionManager
 from src.configs.logger import log
+from src.configs.metrics import track_nats_handler
+from src.configs.resource_pools import use_resource_class
+from src.domain.constants.resource_pools import ResourceClass
 from src.domain.services.nats_event_service import INATSEventService
 from src.domain.services.nats_message_handler import INATSMessageHandler, INATSRequestHandler
 from src.domain.services.nats_service import INATSService
 
 
 class NATSEventService(INATSEventService):
+    """Subscribes the NATS handlers, each running under the resource class of its subject
+
+    Subjects missing from ``resource_classes`` run as INTERACTIVE: the caller is waiting for
+    the reply (or the message is a small user/login update).
+    """
+
     def __init__(
         self,
         nats_service: INATSService,
         message_handlers: Mapping[str, INATSMessageHandler],
-        request_handlers: Mapping[str, INATSRequestHandler]
+        request_handlers: Mapping[str, INATSRequestHandler],
+        resource_classes: Optional[Mapping[str, ResourceClass]] = None
     ):
         self.nats_service = nats_service
         self.message_handlers = message_handlers
         self.request_handlers = request_handlers
+        self.resource_classes = resource_classes or {}
 
     async def start(self) -> None:
         """Start all message and request handlers"""
@@ -32,15 +43,19 @@ class NATSEventService(INATSEventService):
         handler: INATSMessageHandler
     ) -> None:
         """Register a message handler for a subject"""
+        registered_subject = subject
+        resource_class = self.resource_classes.get(subject, ResourceClass.INTERACTIVE)
+
         async def message_callback(subject: str, data: Dict[str, Any]) -> None:
             # Use the centralized session manager
-            async with AsyncSessionManager.session() as session:
-                try:
-                    # Process message with handler
-                    await handler.handle(subject, data, session)
-                except Exception as e:
-                    log.error(f"Error handling message for {subject}: {str(e)}")
-                    raise
+            with track_nats_handler(registered_subject, "message"), use_resource_class(resource_class):
+                async with AsyncSessionManager.session() as session:
+                    try:
+                        # Process message with handler
+                        await handler.handle(subject, data, session)
+                    except Exception as e:
+                        log.error(f"Error handling message for {subject}: {str(e)}")
+                        raise
 
         await self.nats_service.subscribe(subject, message_callback)
         log.info(f"Registered message handler for {subject}")
@@ -51,17 +66,21 @@ class NATSEventService(INATSEventService):
         handler: INATSRequestHandler
     ) -> None:
         """Register a request handler for a subject"""
+        registered_subject = subject
+        resource_class = self.resource_classes.get(subject, ResourceClass.INTERACTIVE)
+
         async def request_callback(subject: str, data: Dict[str, Any]) -> Dict[str, Any]:
             try:
                 # Use the centralized session manager
-                async with AsyncSessionManager.session() as session:
-                    # Process request with handler
-                    result = await handler.handle(subject, data, session)
+                with track_nats_handler(registered_subject, "request"), use_resource_class(resource_class):
+                    async with AsyncSessionManager.session() as session:
+                        # Process request with handler
+                        result = await handler.handle(subject, data, session)
 
-                    return {
-                        "success": True,
-                        "data": result
-                    }
+                        return {
+                            "success": True,
+                            "data": result
+                        }
             except Exception as e:
                 log.error(f"Error handling request for {subject}: {str(e)}")
                 return {
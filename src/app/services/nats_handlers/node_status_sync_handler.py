@@ -65,10 +65,21 @@ class NodeStatusSyncHandler(INATSRequestHandler):
             log.info(
                 f"[NodeStatusSyncHandler] Nhận request cập nhật trạng thái, transaction_id={request.transaction_id}, jira_key={request.jira_key}, status={request.status}")
 
+            # Trạng thái hiện tại trong DB giúp lấy transition ID từ cache, bỏ qua 1 lần gọi Jira
+            current_issue = None
+            try:
+                current_issue = await self.jira_issue_repository.get_by_jira_issue_key(
+                    session=session,
+                    jira_issue_key=request.jira_key
+                )
+            except Exception as e:
+                log.warning(f"[NodeStatusSyncHandler] Không lấy được issue {request.jira_key} từ DB: {str(e)}")
+
             # Cập nhật trạng thái issue trong Jira sử dụng admin auth để tránh vấn đề về quyền
             success = await self.jira_issue_api_service.transition_issue_with_admin_auth(
                 issue_id=request.jira_key,
-                status=self._parse_status(request.status)
+                status=self._parse_status(request.status),
+                current_issue=current_issue
             )
 
             if not success:
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -8,6 +9,7 @@ from src.domain.constants.jira import JiraActionType, JiraIssueType
 from src.domain.models.database.jira_issue import JiraIssueDBUpdateDTO
 from src.domain.models.jira.apis.requests.jira_issue import JiraIssueAPICreateRequestDTO, JiraIssueAPIUpdateRequestDTO
 from src.domain.models.jira_issue import JiraIssueModel
+from src.domain.models.jira_sprint import JiraSprintModel
 from src.domain.models.nats.replies.workflow_sync import WorkflowSyncReply, WorkflowSyncReplyIssue
 from src.domain.models.nats.requests.workflow_sync import WorkflowSyncConnection, WorkflowSyncIssue, WorkflowSyncRequest
 from src.domain.repositories.jira_issue_repository import IJiraIssueRepository
@@ -31,6 +33,8 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
         self.jira_sprint_repository = jira_sprint_repository
         self.redis_service = redis_service
         self.jira_issue_repository = jira_issue_repository
+        # Số lượng request tạo issue link chạy song song tối đa
+        self.link_concurrency_limit = 5
 
     async def handle(self, subject: str, message: Dict[str, Any], session: AsyncSession) -> Dict[str, Any]:
         """Handle workflow sync requests"""
@@ -113,53 +117,117 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
             }
 
     async def _process_issues(self, session: AsyncSession, request: WorkflowSyncRequest) -> List[WorkflowSyncReplyIssue]:
-        """Process all issues in the request"""
-        result_issues = []
+        """Process all issues in the request, in request order
+
+        Consecutive create actions are sent to Jira together through the bulk create API.
+        """
+        result_issues: List[WorkflowSyncReplyIssue] = []
+        pending_creates: List[WorkflowSyncIssue] = []
 
         for issue in request.issues:
+            if issue.action.lower() == JiraActionType.CREATE.value:
+                # Gom các issue cần tạo liên tiếp để tạo bằng bulk API
+                pending_creates.append(issue)
+                continue
+
+            # Tạo các issue đang chờ trước để giữ nguyên thứ tự của request
+            result_issues.extend(await self._process_pending_creates(session=session, request=request, issues=pending_creates))
+            pending_creates = []
+
+            if issue.action.lower() != JiraActionType.UPDATE.value:
+                continue
+
             try:
-                # Check action type
-                if issue.action.lower() == JiraActionType.CREATE.value:
-                    # Create new issue
-                    jira_issue = await self._create_issue(session=session, issue=issue, project_key=request.project_key, sprint_id=request.sprint_id)
-                    if jira_issue:
-                        result_issues.append(WorkflowSyncReplyIssue(
-                            node_id=issue.node_id,
-                            jira_key=jira_issue.key,
-                            jira_link_url=jira_issue.link_url
-                        ))
-                        log.info(f"Created Jira issue: {jira_issue.key} for node: {issue.node_id}")
-
-                elif issue.action.lower() == JiraActionType.UPDATE.value:
-                    # Update existing issue
-                    if not issue.jira_key:
-                        log.error(f"Cannot update issue without jira_key: {issue.node_id}")
-                        continue
-
-                    jira_issue = await self._update_issue(session=session, issue=issue, project_key=request.project_key, sprint_id=request.sprint_id)
-                    if jira_issue:
-                        result_issues.append(WorkflowSyncReplyIssue(
-                            node_id=issue.node_id,
-                            jira_key=jira_issue.key,
-                            jira_link_url=jira_issue.link_url
-                        ))
-                        log.info(f"Updated Jira issue: {jira_issue.key} for node: {issue.node_id}")
+                # Update existing issue
+                if not issue.jira_key:
+                    log.error(f"Cannot update issue without jira_key: {issue.node_id}")
+                    continue
+
+                jira_issue = await self._update_issue(session=session, issue=issue, project_key=request.project_key, sprint_id=request.sprint_id)
+                if jira_issue:
+                    result_issues.append(WorkflowSyncReplyIssue(
+                        node_id=issue.node_id,
+                        jira_key=jira_issue.key,
+                        jira_link_url=jira_issue.link_url
+                    ))
+                    log.info(f"Updated Jira issue: {jira_issue.key} for node: {issue.node_id}")
 
             except Exception as e:
                 raise Exception(f"Error processing issue {issue.node_id}: {str(e)}") from e
 
+        result_issues.extend(await self._process_pending_creates(session=session, request=request, issues=pending_creates))
         return result_issues
 
-    async def _create_issue(self, session: AsyncSession, issue: WorkflowSyncIssue, project_key: str, sprint_id: Optional[int]) -> JiraIssueModel:
-        """Create a new issue in Jira"""
-        # Map issue type to Jira issue type
-        issue_type = self._map_issue_type(issue.type)
+    async def _process_pending_creates(
+        self,
+        session: AsyncSession,
+        request: WorkflowSyncRequest,
+        issues: List[WorkflowSyncIssue]
+    ) -> List[WorkflowSyncReplyIssue]:
+        """Create a run of consecutive create actions in one bulk call"""
+        if not issues:
+            return []
+
+        result_issues: List[WorkflowSyncReplyIssue] = []
+        created_issues = await self._create_issues(
+            session=session,
+            issues=issues,
+            project_key=request.project_key,
+            sprint_id=request.sprint_id
+        )
+        for issue, jira_issue in zip(issues, created_issues, strict=True):
+            if not jira_issue:
+                raise Exception(f"Error processing issue {issue.node_id}: failed to create Jira issue")
+            result_issues.append(WorkflowSyncReplyIssue(
+                node_id=issue.node_id,
+                jira_key=jira_issue.key,
+                jira_link_url=jira_issue.link_url
+            ))
+            log.info(f"Created Jira issue: {jira_issue.key} for node: {issue.node_id}")
 
-        # Tìm Jira sprint ID tương ứng từ sprint ID của DB nếu có
-        jira_sprint_id = await self._get_jira_sprint_id(session=session, project_key=project_key, sprint_id=sprint_id)
-        if not jira_sprint_id:
+        return result_issues
+
+    async def _create_issues(
+        self,
+        session: AsyncSession,
+        issues: List[WorkflowSyncIssue],
+        project_key: str,
+        sprint_id: Optional[int]
+    ) -> List[Optional[JiraIssueModel]]:
+        """Create new issues in Jira in bulk, result is aligned with issues"""
+        # Tìm Jira sprint tương ứng từ sprint ID của DB nếu có
+        jira_sprint = await self._get_jira_sprint(session=session, project_key=project_key, sprint_id=sprint_id)
+        if not jira_sprint or not jira_sprint.jira_sprint_id:
             raise Exception(f"Jira sprint ID not found for sprint ID {sprint_id}")
 
+        create_dtos = [
+            self._build_create_dto(
+                issue=issue,
+                project_key=project_key,
+                jira_sprint_id=jira_sprint.jira_sprint_id,
+                board_id=jira_sprint.board_id
+            )
+            for issue in issues
+        ]
+
+        # Sử dụng admin auth để tạo issues
+        return await self.jira_issue_service.jira_issue_api_service.bulk_create_issues_with_admin_auth(
+            session=session,
+            issues_data=create_dtos,
+            lightweight=True
+        )
+
+    def _build_create_dto(
+        self,
+        issue: WorkflowSyncIssue,
+        project_key: str,
+        jira_sprint_id: int,
+        board_id: Optional[int]
+    ) -> JiraIssueAPICreateRequestDTO:
+        """Build the Jira create request for a workflow node"""
+        # Map issue type to Jira issue type
+        issue_type = self._map_issue_type(issue.type)
+
         # Create issue data
         create_dto = JiraIssueAPICreateRequestDTO(
             jira_issue_id="",
@@ -169,18 +237,13 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
             type=issue_type,
             assignee_id=str(issue.assignee_id),
             sprint_id=jira_sprint_id,  # Sử dụng Jira sprint ID đã được map
+            board_id=board_id,
         )
 
         if issue.estimate_point:
             create_dto.estimate_point = issue.estimate_point
 
-        # Sử dụng admin auth để tạo issue
-        jira_issue = await self.jira_issue_service.jira_issue_api_service.create_issue_with_admin_auth(
-            session=session,
-            issue_data=create_dto
-        )
-
-        return jira_issue
+        return create_dto
 
     async def _update_issue(self, session: AsyncSession, issue: WorkflowSyncIssue, project_key: str, sprint_id: Optional[int]) -> JiraIssueModel:
         """Update an existing issue in Jira"""
@@ -192,6 +255,13 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
         if not jira_sprint_id:
             raise Exception(f"Jira sprint ID not found for sprint ID {sprint_id}")
 
+        # Issue hiện tại trong DB. Sprint luôn được gửi (DB có thể chưa khớp Jira) nên issue
+        # vẫn được đọc lại từ Jira sau khi update
+        current_issue = await self.jira_issue_repository.get_by_jira_issue_key(
+            session=session,
+            jira_issue_key=issue.jira_key
+        )
+
         # Create update data
         update_dto = JiraIssueAPIUpdateRequestDTO(
             summary=issue.title,
@@ -206,12 +276,14 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
         jira_issue = await self.jira_issue_service.jira_issue_api_service.update_issue_with_admin_auth(
             session=session,
             issue_id=issue.jira_key,
-            update=update_dto
+            update=update_dto,
+            current_issue=current_issue,
+            lightweight=True
         )
         # Sau khi update, đảm bảo issue được đánh dấu là system linked trong DB
         try:
             # Kiểm tra xem issue đã được đánh dấu là system linked chưa
-            existing_issue = await self.jira_issue_repository.get_by_jira_issue_id(
+            existing_issue = current_issue or await self.jira_issue_repository.get_by_jira_issue_id(
                 session=session,
                 jira_issue_id=jira_issue.jira_issue_id
             )
@@ -240,12 +312,12 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
         node_to_jira_key_map: Dict[str, str]
     ):
         """Process all connections between issues"""
-        connection_results = []
-
         # Log mapping để dễ debug
         log.debug(f"Node to Jira key mapping: {node_to_jira_key_map}")
 
-        for connection in connections:
+        semaphore = asyncio.Semaphore(self.link_concurrency_limit)
+
+        async def _create_link(connection: WorkflowSyncConnection) -> bool:
             try:
                 # Lấy Jira key từ node ID
                 source_key = node_to_jira_key_map.get(connection.from_issue_key)
@@ -254,32 +326,32 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
                 # Kiểm tra xem đã có jira_key cho cả source và target chưa
                 if not source_key:
                     log.error(f"Missing Jira key for source node ID: {connection.from_issue_key}")
-                    connection_results.append(False)
-                    continue
+                    return False
 
                 if not target_key:
                     log.error(f"Missing Jira key for target node ID: {connection.to_issue_key}")
-                    connection_results.append(False)
-                    continue
+                    return False
 
                 # Create "relates to" link between issues using admin auth
-                success = await self.jira_issue_service.jira_issue_api_service.create_issue_link_with_admin_auth(
-                    source_issue_id=source_key,
-                    target_issue_id=target_key,
-                    relationship="Relates"  # Always using "relates to" as requested
-                )
+                async with semaphore:
+                    success = await self.jira_issue_service.jira_issue_api_service.create_issue_link_with_admin_auth(
+                        source_issue_id=source_key,
+                        target_issue_id=target_key,
+                        relationship="Relates"  # Always using "relates to" as requested
+                    )
 
                 if success:
                     log.info(f"Created link between {source_key} and {target_key}")
-                    connection_results.append(True)
                 else:
                     log.error(f"Failed to create link between {source_key} and {target_key}")
-                    connection_results.append(False)
+                return success
 
             except Exception as e:
                 log.error(
                     f"Error creating link between {connection.from_issue_key} and {connection.to_issue_key}: {str(e)}")
-                connection_results.append(False)
+                return False
+
+        connection_results = await asyncio.gather(*[_create_link(connection) for connection in connections])
 
         # Nếu không có connection nào thành công, raise exception
         if connections and not any(connection_results):
@@ -318,13 +390,16 @@ class WorkflowSyncRequestHandler(INATSRequestHandler):
 
     async def _get_jira_sprint_id(self, session: AsyncSession, project_key: str, sprint_id: Optional[int]) -> Optional[int]:
         """Lấy Jira sprint ID từ sprint ID của DB"""
+        sprint = await self._get_jira_sprint(session=session, project_key=project_key, sprint_id=sprint_id)
+        return sprint.jira_sprint_id if sprint else None
+
+    async def _get_jira_sprint(self, session: AsyncSession, project_key: str, sprint_id: Optional[int]) -> Optional[JiraSprintModel]:
+        """Lấy sprint từ sprint ID của DB, hoặc sprint hiện tại nếu không có sprint ID"""
         try:
             if sprint_id is None:
                 # Get current sprint
-                current_sprint = await self.jira_sprint_repository.get_current_sprint(session=session, project_key=project_key)
-                return current_sprint.jira_sprint_id if current_sprint else None
+                return await self.jira_sprint_repository.get_current_sprint(session=session, project_key=project_key)
 
-            sprint = await self.jira_sprint_repository.get_sprint_by_id(session=session, sprint_id=sprint_id)
-            return sprint.jira_sprint_id if sprint else None
+            return await self.jira_sprint_repository.get_sprint_by_id(session=session, sprint_id=sprint_id)
         except Exception as e:
             raise Exception(f"Error getting Jira sprint ID for sprint ID {sprint_id}: {str(e)}") from e
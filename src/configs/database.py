@@ -1,26 +1,83 @@
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Callable
+from typing import Any, AsyncGenerator, Callable, Dict, Optional
+import uuid
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.configs.logger import log
+from src.configs.metrics import DatabasePoolCollector
+from src.configs.resource_pools import acquire_resource
+from src.configs.tracing import instrument_engine
+from src.domain.constants.resource_pools import ResourceKind
 
 from .settings import settings
 
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    echo=settings.DEBUG,
-    pool_size=40,
-    max_overflow=40,
-    pool_timeout=60,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    isolation_level="READ COMMITTED"
+
+def build_engine_options(pool_size: Optional[int] = None, max_overflow: Optional[int] = None) -> Dict[str, Any]:
+    """Build create_async_engine keyword arguments from the pool / PgBouncer settings
+
+    ``pool_size`` and ``max_overflow`` default to the primary pool settings.
+    """
+    pool_size = settings.DATABASE_POOL_SIZE if pool_size is None else pool_size
+    max_overflow = settings.DATABASE_MAX_OVERFLOW if max_overflow is None else max_overflow
+    options: Dict[str, Any] = {
+        "echo": settings.DEBUG,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "isolation_level": "READ COMMITTED"
+    }
+
+    if pool_size > 0:
+        options.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=60,
+            pool_recycle=3600
+        )
+    else:
+        # Mỗi session mở kết nối mới và đóng ngay khi xong, để PgBouncer quản lý pool
+        options["poolclass"] = NullPool
+
+    if settings.DATABASE_PGBOUNCER_MODE:
+        # PgBouncer transaction pooling đổi server connection giữa các transaction nên prepared
+        # statement đã cache có thể không tồn tại (hoặc trùng tên) trên connection hiện tại
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__"
+        }
+
+    return options
+
+
+def _create_engine(url: str, pool_size: Optional[int] = None, max_overflow: Optional[int] = None) -> AsyncEngine:
+    async_engine = create_async_engine(url, **build_engine_options(pool_size, max_overflow))
+    if settings.TRACING_ENABLED:
+        instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+
+engine = _create_engine(str(settings.DATABASE_URL))
+
+# Engine của read replica, None nếu không cấu hình. Pool riêng, nhỏ hơn primary vì chỉ phục vụ analytics/list
+replica_engine: Optional[AsyncEngine] = (
+    _create_engine(
+        str(settings.DATABASE_READ_REPLICA_URL),
+        pool_size=settings.DATABASE_READ_REPLICA_POOL_SIZE,
+        max_overflow=settings.DATABASE_READ_REPLICA_MAX_OVERFLOW
+    )
+    if settings.DATABASE_READ_REPLICA_URL else None
 )
 
+# Trạng thái pool (checked out / overflow) được đọc khi Prometheus scrape /metrics
+REGISTRY.register(DatabasePoolCollector({"primary": engine, "replica": replica_engine}))
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -28,8 +85,107 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=True
 )
 
+# Session cho request chỉ đọc: không autoflush, không expire object sau khi kết thúc
+AsyncReadOnlySessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
 Base = declarative_base()
 
+# Độ trễ (giây) của replica; 0 khi đã replay hết WAL nhận được hoặc không ở chế độ recovery
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+class ReadReplicaRouter:
+    """Chooses the engine for replica-eligible reads (analytics, list endpoints)
+
+    A background task started with ``start()`` checks the replica lag every
+    ``check_interval_seconds``; requests only read the cached result. Reads go to the
+    primary until the first check passes and while the replica is unreachable or lags
+    more than ``max_lag_seconds``.
+    """
+
+    def __init__(
+        self,
+        primary_engine: AsyncEngine,
+        replica_engine: Optional[AsyncEngine],
+        max_lag_seconds: float,
+        check_interval_seconds: float
+    ):
+        self.primary_engine = primary_engine
+        self.replica_engine = replica_engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._replica_usable = False
+        self._checked = False
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def get_read_engine(self) -> AsyncEngine:
+        if self.replica_engine is not None and self._replica_usable:
+            return self.replica_engine
+        return self.primary_engine
+
+    async def start(self) -> None:
+        """Start checking the replica lag periodically (no-op without a replica)"""
+        if self.replica_engine is not None and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background check and route reads back to the primary"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._replica_usable = False
+
+    async def _run(self) -> None:
+        while True:
+            self._replica_usable = await self._check_replica()
+            self._checked = True
+            await asyncio.sleep(self.check_interval_seconds)
+
+    async def _check_replica(self) -> bool:
+        assert self.replica_engine is not None
+        try:
+            lag = await asyncio.wait_for(self._get_replica_lag(), timeout=self.check_interval_seconds)
+        except Exception as e:
+            if self._replica_usable or not self._checked:
+                log.warning(f"Read replica unavailable, falling back to primary: {str(e)}")
+            return False
+
+        usable = lag <= self.max_lag_seconds
+        if not usable and self._replica_usable:
+            log.warning(f"Read replica lag {lag:.1f}s exceeds {self.max_lag_seconds}s, falling back to primary")
+        elif usable and not self._replica_usable:
+            log.info(f"Routing reads to replica (lag {lag:.1f}s)")
+        return usable
+
+    async def _get_replica_lag(self) -> float:
+        assert self.replica_engine is not None
+        async with self.replica_engine.connect() as conn:
+            result = await conn.execute(REPLICA_LAG_QUERY)
+            return float(result.scalar() or 0)
+
+
+read_replica_router = ReadReplicaRouter(
+    primary_engine=engine,
+    replica_engine=replica_engine,
+    max_lag_seconds=settings.DATABASE_READ_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS
+)
+
 
 class AsyncSessionManager:
     """Centralized session management utility for consistent transaction handling"""
@@ -39,6 +195,8 @@ class AsyncSessionManager:
     async def session(cls, *, auto_commit: bool = True):
         """Get a session with automatic transaction management.
 
+        Waits for a DB session slot of the current resource class (see resource_pools).
+
         Args:
             auto_commit (bool, optional): Whether to automatically commit successful transactions. Defaults to True.
 
@@ -47,37 +205,72 @@ class AsyncSessionManager:
                 # Use session for database operations
                 # Automatically commits on success or rolls back on error
         """
-        session = AsyncSessionLocal()
-        transaction_begun = False
-        try:
-            # Begin transaction explicitly
-            await session.begin()
-            transaction_begun = True
-
-            yield session
-
-            # Commit if requested and no exceptions occurred
-            if auto_commit and session.is_active:
-                await session.commit()
-        except Exception:
-            # Rollback on error if transaction was started
-            if transaction_begun and session.is_active:
+        async with acquire_resource(ResourceKind.DB_SESSION):
+            session = AsyncSessionLocal()
+            transaction_begun = False
+            try:
+                # Begin transaction explicitly
+                await session.begin()
+                transaction_begun = True
+
+                yield session
+
+                # Commit if requested and no exceptions occurred
+                if auto_commit and session.is_active:
+                    await session.commit()
+            except Exception:
+                # Rollback on error if transaction was started
+                if transaction_begun and session.is_active:
+                    try:
+                        await session.rollback()
+                    except Exception as rollback_error:
+                        log.error(f"Error during session rollback: {str(rollback_error)}")
+                # Re-raise the original exception
+                raise
+            finally:
+                # Always close the session, but only if it's not in an active transaction
                 try:
-                    await session.rollback()
-                except Exception as rollback_error:
-                    log.error(f"Error during session rollback: {str(rollback_error)}")
-            # Re-raise the original exception
-            raise
-        finally:
-            # Always close the session, but only if it's not in an active transaction
+                    if session.is_active:
+                        # If we have an active transaction that wasn't committed,
+                        # we need to roll it back before closing
+                        await session.rollback()
+                    await session.close()
+                except Exception as close_error:
+                    log.error(f"Error closing database session: {str(close_error)}")
+
+    @classmethod
+    @asynccontextmanager
+    async def read_only_session(cls, *, use_replica: bool = False):
+        """Get a session for pure reads.
+
+        No explicit begin/commit: the transaction is started lazily by the first query
+        and simply released (rolled back) when the session is closed. If
+        DATABASE_READ_ONLY_ENFORCE is enabled the transaction is also marked READ ONLY,
+        so an accidental write fails instead of being silently discarded.
+
+        Args:
+            use_replica (bool, optional): Read from the replica when it is configured and
+                not lagging. Only for reads that tolerate slightly stale data. Defaults to False.
+
+        Usage:
+            async with AsyncSessionManager.read_only_session() as session:
+                # Only run SELECT queries here, nothing is committed
+        """
+        async with acquire_resource(ResourceKind.DB_SESSION):
+            if use_replica:
+                session = AsyncReadOnlySessionLocal(bind=read_replica_router.get_read_engine())
+            else:
+                session = AsyncReadOnlySessionLocal()
             try:
-                if session.is_active:
-                    # If we have an active transaction that wasn't committed,
-                    # we need to roll it back before closing
-                    await session.rollback()
-                await session.close()
-            except Exception as close_error:
-                log.error(f"Error closing database session: {str(close_error)}")
+                if settings.DATABASE_READ_ONLY_ENFORCE:
+                    await session.execute(text("SET TRANSACTION READ ONLY"))
+
+                yield session
+            finally:
+                try:
+                    await session.close()
+                except Exception as close_error:
+                    log.error(f"Error closing read-only database session: {str(close_error)}")
 
 
 def sqlmodel_session_maker(engine) -> Callable[[], AsyncSession]:
@@ -103,6 +296,35 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Create a read-only database session for each GET request.
+
+    Yields:
+        AsyncSession: a new read-only database session
+    """
+    async with AsyncSessionManager.read_only_session() as session:
+        yield session
+
+
+async def get_replica_db() -> AsyncGenerator[AsyncSession, None]:
+    """Create a read-only session on the read replica (primary as fallback) for each request.
+
+    For analytics and list endpoints that tolerate replication lag.
+
+    Yields:
+        AsyncSession: a new read-only database session
+    """
+    async with AsyncSessionManager.read_only_session(use_replica=True) as session:
+        yield session
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections of the primary and replica engines"""
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
 async def create_session() -> AsyncSession:
     """Create a new database session without context manager.
 
@@ -0,0 +1,260 @@
+from abc import ABC, abstractmethod
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import gzip
+import hashlib
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import aiohttp
+
+from src.configs.logger import log
+from src.configs.settings import settings
+from src.domain.constants.http_transport import HTTPTransportMode
+
+# Số response ghi được giữ trong bộ nhớ trước khi ghi xuống cassette
+_RECORD_FLUSH_SIZE = 100
+
+
+@dataclass
+class HTTPTransportResponse:
+    status: int
+    text: str
+    # Thời gian gửi request (ms), dùng để replay với độ trễ đã ghi
+    elapsed_ms: float = 0.0
+
+    def json(self) -> Any:
+        return json.loads(self.text) if self.text else {}
+
+
+class HTTPCassetteMissError(LookupError):
+    """Raised in replay mode when the cassette has no response for a request"""
+    pass
+
+
+class HTTPTransport(ABC):
+    """Sends the HTTP requests of an API client (Jira, Microsoft Graph)"""
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
+        timeout: float = 30
+    ) -> HTTPTransportResponse:
+        """Send a request and read the whole response body"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release resources, e.g. write recorded responses"""
+        pass
+
+
+class AiohttpTransport(HTTPTransport):
+    """Sends requests to the real API, one aiohttp session per request"""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
+        timeout: float = 30
+    ) -> HTTPTransportResponse:
+        started_at = time.perf_counter()
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as http_session:
+            async with http_session.request(method.upper(), url, headers=headers, params=params, json=json_data) as response:
+                text = await response.text()
+                return HTTPTransportResponse(response.status, text, (time.perf_counter() - started_at) * 1000)
+
+    async def close(self) -> None:
+        pass
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None, json_data: Optional[Any] = None) -> str:
+    """Key of a request in a cassette: method, path, sorted query and a hash of the JSON body
+
+    Host and headers are left out, so cassettes hold no credentials and work for any user.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(str(name), str(value)) for name, value in (params or {}).items() if value is not None]
+    key = f"{method.upper()} {parts.path}"
+    if query:
+        key += f"?{urlencode(sorted(query))}"
+    if json_data is not None:
+        body = json.dumps(json_data, sort_keys=True, separators=(",", ":"), default=str)
+        key += f" #{hashlib.sha1(body.encode()).hexdigest()[:16]}"
+    return key
+
+
+class HTTPCassette:
+    """Recorded responses stored as gzip JSON lines: {"k": key, "s": status, "b": body, "t": elapsed ms}
+
+    Responses of the same request are replayed in recorded order, the last one is repeated.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._responses: Dict[str, List[HTTPTransportResponse]] = {}
+        self._positions: Counter[str] = Counter()
+        self._pending: List[Dict[str, Any]] = []
+
+    def load(self) -> None:
+        if not os.path.exists(self.file_path):
+            log.warning(f"HTTP cassette {self.file_path} does not exist, every request will miss")
+            return
+
+        with gzip.open(self.file_path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    entry = json.loads(line)
+                    response = HTTPTransportResponse(entry["s"], entry["b"], entry.get("t", 0.0))
+                    self._responses.setdefault(entry["k"], []).append(response)
+        log.info(f"Loaded {sum(len(responses) for responses in self._responses.values())} responses from {self.file_path}")
+
+    def next_response(self, key: str) -> Optional[HTTPTransportResponse]:
+        responses = self._responses.get(key)
+        if not responses:
+            return None
+        position = self._positions[key]
+        self._positions[key] += 1
+        return responses[min(position, len(responses) - 1)]
+
+    def add(self, key: str, response: HTTPTransportResponse) -> int:
+        """Queue a response for writing, returns the number of queued responses"""
+        self._pending.append({"k": key, "s": response.status, "b": response.text, "t": round(response.elapsed_ms, 1)})
+        return len(self._pending)
+
+    def save(self) -> None:
+        """Append queued responses to the file (a new gzip member, read back as one stream)"""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        with gzip.open(self.file_path, "at", encoding="utf-8") as file:
+            for entry in pending:
+                file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+class RecordingTransport(HTTPTransport):
+    """Sends requests through another transport and records every response"""
+
+    def __init__(self, transport: HTTPTransport, cassette: HTTPCassette):
+        self.transport = transport
+        self.cassette = cassette
+        self._save_lock = asyncio.Lock()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
+        timeout: float = 30
+    ) -> HTTPTransportResponse:
+        response = await self.transport.request(method, url, headers, params, json_data, timeout)
+        if self.cassette.add(request_key(method, url, params, json_data), response) >= _RECORD_FLUSH_SIZE:
+            await self._save()
+        return response
+
+    async def _save(self) -> None:
+        async with self._save_lock:
+            await asyncio.to_thread(self.cassette.save)
+
+    async def close(self) -> None:
+        await self._save()
+        await self.transport.close()
+
+
+class ReplayTransport(HTTPTransport):
+    """Answers requests from a cassette with simulated latency, without network access"""
+
+    def __init__(
+        self,
+        cassette: HTTPCassette,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        use_recorded_latency: bool = False
+    ):
+        self.cassette = cassette
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.use_recorded_latency = use_recorded_latency
+        self._random = random.Random()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
+        timeout: float = 30
+    ) -> HTTPTransportResponse:
+        key = request_key(method, url, params, json_data)
+        response = self.cassette.next_response(key)
+        if response is None:
+            raise HTTPCassetteMissError(f"No recorded response for {key} in {self.cassette.file_path}")
+
+        latency_ms = response.elapsed_ms if self.use_recorded_latency else self.latency_ms
+        latency_ms += self._random.uniform(0, self.jitter_ms)
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+        return response
+
+    async def close(self) -> None:
+        pass
+
+
+_transports: Dict[str, HTTPTransport] = {}
+
+
+def _create_transport(name: str) -> Tuple[HTTPTransport, HTTPTransportMode]:
+    mode = HTTPTransportMode(settings.HTTP_TRANSPORT_MODE)
+    if mode == HTTPTransportMode.LIVE:
+        return AiohttpTransport(), mode
+
+    cassette = HTTPCassette(os.path.join(settings.HTTP_CASSETTE_DIR, f"{name}.jsonl.gz"))
+    if mode == HTTPTransportMode.RECORD:
+        return RecordingTransport(AiohttpTransport(), cassette), mode
+
+    cassette.load()
+    return ReplayTransport(
+        cassette,
+        latency_ms=settings.HTTP_REPLAY_LATENCY_MS,
+        jitter_ms=settings.HTTP_REPLAY_JITTER_MS,
+        use_recorded_latency=settings.HTTP_REPLAY_USE_RECORDED_LATENCY
+    ), mode
+
+
+def get_http_transport(name: str) -> HTTPTransport:
+    """Process-wide transport of an API (e.g. "jira", "microsoft_graph") for HTTP_TRANSPORT_MODE"""
+    transport = _transports.get(name)
+    if transport is None:
+        transport, mode = _create_transport(name)
+        _transports[name] = transport
+        if mode != HTTPTransportMode.LIVE:
+            log.info(f"HTTP transport of {name} in {mode.value} mode")
+    return transport
+
+
+async def close_http_transports() -> None:
+    """Close all transports, writing responses still buffered by recording transports"""
+    for name, transport in list(_transports.items()):
+        try:
+            await transport.close()
+        except Exception as e:
+            log.warning(f"Error closing HTTP transport of {name}: {str(e)}")
+    _transports.clear()
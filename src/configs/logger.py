@@ -1,23 +1,54 @@
 import logging
 import sys
+from threading import Lock
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from loguru import logger
 
+from src.configs.settings import settings
+
+if TYPE_CHECKING:
+    import loguru
+
+CONSOLE_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# Mức log mặc định và mức riêng của từng module (module con kế thừa mức của module cha)
+LEVEL_FILTER: Dict[Optional[str], Union[str, int, bool]] = {
+    "": settings.LOG_LEVEL.upper(),
+    **{module: level.upper() for module, level in settings.LOG_MODULE_LEVELS.items()},
+}
+# Sink nhận mọi mức có trong filter, filter quyết định theo module
+SINK_LEVEL = min(logger.level(str(level)).no for level in LEVEL_FILTER.values())
+
+
+def _truncate_message(record: "loguru.Record") -> None:
+    message = record["message"]
+    if len(message) > settings.LOG_MAX_MESSAGE_LENGTH:
+        record["message"] = f"{message[:settings.LOG_MAX_MESSAGE_LENGTH]}... [{len(message)} chars]"
+
+
 # Configure logger
 logger.remove()  # Remove the default handler
+logger.configure(patcher=_truncate_message)
 logger.add(
     sys.stdout,
     colorize=True,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="DEBUG",
+    format=CONSOLE_FORMAT,
+    level=SINK_LEVEL,
+    filter=LEVEL_FILTER,
+    enqueue=settings.LOG_ENQUEUE,
 )
 logger.add(
     "logs/app.log",
     rotation="500 MB",
     retention="10 days",
     compression="zip",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
+    format=FILE_FORMAT,
+    level=SINK_LEVEL,
+    filter=LEVEL_FILTER,
+    enqueue=settings.LOG_ENQUEUE,
 )
 
 # Disable all SQLAlchemy logging except ERROR
@@ -32,5 +63,73 @@ logging.getLogger("sqlalchemy").propagate = False
 logging.disable(logging.WARNING)
 
 
+class _Truncated:
+    """Defers str() and truncation of a logged value until the message is actually formatted"""
+
+    __slots__ = ("value", "max_length")
+
+    def __init__(self, value: Any, max_length: int):
+        self.value = value
+        self.max_length = max_length
+
+    def __str__(self) -> str:
+        text = str(self.value)
+        if len(text) <= self.max_length:
+            return text
+        return f"{text[:self.max_length]}... [{len(text)} chars]"
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+def truncated(value: Any, max_length: Optional[int] = None) -> Any:
+    """Wrap a payload / response for logging with ``{}`` placeholders
+
+    Usage:
+        log.debug("Response data when get issue: {}", truncated(response_data))
+    """
+    return _Truncated(value, max_length or settings.LOG_PAYLOAD_MAX_LENGTH)
+
+
+class _LogRateLimiter:
+    """Lets at most ``limit`` messages per key through in each window and counts the rest"""
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._lock = Lock()
+
+    def allow(self, key: str) -> Tuple[bool, int]:
+        """Whether to log now, and how many messages of the previous window were suppressed"""
+        now = time.monotonic()
+        with self._lock:
+            started_at, count = self._windows.get(key, (now, 0))
+            suppressed = 0
+            if now - started_at >= self.window_seconds:
+                suppressed = max(count - self.limit, 0)
+                started_at, count = now, 0
+            count += 1
+            self._windows[key] = (started_at, count)
+            return count <= self.limit, suppressed
+
+
+_rate_limiter = _LogRateLimiter(settings.LOG_RATE_LIMIT_COUNT, settings.LOG_RATE_LIMIT_WINDOW_SECONDS)
+
+
+def log_rate_limited(key: str, level: str, message: str, *args: Any) -> None:
+    """Log a per-event message at most LOG_RATE_LIMIT_COUNT times per window for the given key
+
+    Usage:
+        log_rate_limited("webhook.received", "INFO", "Processing webhook event: {}", event_type)
+    """
+    allowed, suppressed = _rate_limiter.allow(key)
+    if not allowed:
+        return
+    if suppressed:
+        message = f"{message} ({suppressed} similar messages suppressed)"
+    logger.opt(depth=1).log(level, message, *args)
+
+
 # Export the logger
 log = logger
@@ -0,0 +1,183 @@
+from contextlib import contextmanager
+import functools
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+R = TypeVar("R")
+
+# Jira API (outbound)
+JIRA_REQUEST_SECONDS = Histogram(
+    "jira_request_duration_seconds",
+    "Latency of one Jira API attempt",
+    ["method", "endpoint", "status"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+)
+JIRA_REQUEST_RETRIES = Counter(
+    "jira_request_retries_total",
+    "Jira API attempts retried after a connection or server error",
+    ["method", "endpoint"]
+)
+JIRA_RATE_LIMITED = Counter(
+    "jira_request_rate_limited_total",
+    "Jira API responses with status 429",
+    ["method", "endpoint"]
+)
+JIRA_REQUESTS_COALESCED = Counter(
+    "jira_request_coalesced_total",
+    "Jira GET calls served by an identical in-flight request or the short response cache",
+    ["endpoint", "source"]
+)
+
+# Webhook queue
+WEBHOOK_QUEUE_DEPTH = Gauge(
+    "webhook_queue_depth",
+    "Webhooks waiting in the in-memory queues",
+    ["queue"]
+)
+WEBHOOK_QUEUE_WAIT_SECONDS = Histogram(
+    "webhook_queue_wait_seconds",
+    "Time a webhook spent in the queue before being processed",
+    ["queue"],
+    buckets=(0.5, 1, 2, 5, 10, 30, 60, 300, 900)
+)
+WEBHOOK_PROCESSING_SECONDS = Histogram(
+    "webhook_processing_duration_seconds",
+    "Time to process one webhook",
+    ["event", "outcome"]
+)
+WEBHOOK_RETRIES = Counter(
+    "webhook_retries_total",
+    "Webhook retries scheduled",
+    ["event"]
+)
+WEBHOOK_DROPPED = Counter(
+    "webhook_dropped_total",
+    "Webhooks given up after the maximum number of retries",
+    ["event"]
+)
+
+# NATS handlers
+NATS_HANDLER_SECONDS = Histogram(
+    "nats_handler_duration_seconds",
+    "Time to handle one NATS message or request",
+    ["subject", "kind", "outcome"]
+)
+NATS_HANDLER_IN_FLIGHT = Gauge(
+    "nats_handler_in_flight",
+    "NATS messages or requests being handled",
+    ["subject", "kind"]
+)
+
+# Gantt / analytics
+COMPUTATION_SECONDS = Histogram(
+    "computation_duration_seconds",
+    "Time spent in Gantt chart and analytics computations",
+    ["operation", "outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+)
+
+# Số, issue key (PROJ-123), project key (PROJ) và account id trong path được thay bằng placeholder
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+_ISSUE_KEY_SEGMENT = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+_PROJECT_KEY_SEGMENT = re.compile(r"^[A-Z][A-Z0-9_]+$")
+_OPAQUE_ID_SEGMENT = re.compile(r"^(?=.*\d)[\w:-]{16,}$")
+
+
+def endpoint_template(url: str) -> str:
+    """Path of a Jira URL with ids replaced, e.g. /rest/api/2/issue/PROJ-1/comment -> /rest/api/2/issue/{key}/comment"""
+    segments: List[str] = []
+    for segment in urlsplit(url).path.split("/"):
+        # Giữ nguyên version của API (/rest/api/2, /rest/agile/1.0)
+        if segments and segments[-1] in ("api", "agile"):
+            segments.append(segment)
+        elif _NUMERIC_SEGMENT.match(segment) or _OPAQUE_ID_SEGMENT.match(segment):
+            segments.append("{id}")
+        elif _ISSUE_KEY_SEGMENT.match(segment) or _PROJECT_KEY_SEGMENT.match(segment):
+            segments.append("{key}")
+        else:
+            segments.append(segment)
+    return "/".join(segments)
+
+
+def observe_jira_request(method: str, endpoint: str, status: Optional[int], started_at: float) -> None:
+    """Record one Jira API attempt, status None when no response was received"""
+    method = method.upper()
+    JIRA_REQUEST_SECONDS.labels(
+        method=method,
+        endpoint=endpoint,
+        status=str(status) if status is not None else "error"
+    ).observe(time.perf_counter() - started_at)
+    if status == 429:
+        JIRA_RATE_LIMITED.labels(method=method, endpoint=endpoint).inc()
+
+
+@contextmanager
+def track_nats_handler(subject: str, kind: str) -> Iterator[None]:
+    """Count in-flight NATS handlers and observe their latency per registered subject"""
+    in_flight = NATS_HANDLER_IN_FLIGHT.labels(subject=subject, kind=kind)
+    in_flight.inc()
+    started_at = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        in_flight.dec()
+        NATS_HANDLER_SECONDS.labels(subject=subject, kind=kind, outcome=outcome).observe(time.perf_counter() - started_at)
+
+
+def timed_computation(operation: str) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+    """Observe the duration of an async Gantt / analytics method
+
+    Usage:
+        @timed_computation("gantt.calculate_schedule")
+        async def calculate_schedule(self, ...): ...
+    """
+    def decorator(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> R:
+            started_at = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                COMPUTATION_SECONDS.labels(operation=operation, outcome=outcome).observe(
+                    time.perf_counter() - started_at
+                )
+        return wrapper
+    return decorator
+
+
+class DatabasePoolCollector(Collector):
+    """Reads SQLAlchemy pool state of each engine at scrape time"""
+
+    def __init__(self, engines: Dict[str, Optional[AsyncEngine]]):
+        self.engines = engines
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        size = GaugeMetricFamily("db_pool_size", "Configured pool size", labels=["engine"])
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections checked out of the pool", labels=["engine"])
+        checked_in = GaugeMetricFamily("db_pool_checked_in", "Idle connections in the pool", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "Connections opened above the pool size", labels=["engine"])
+
+        for name, engine in self.engines.items():
+            pool = engine.sync_engine.pool if engine is not None else None
+            # NullPool (PgBouncer / DATABASE_POOL_SIZE=0) không có các số liệu này
+            if not isinstance(pool, QueuePool):
+                continue
+            size.add_metric([name], pool.size())
+            checked_out.add_metric([name], pool.checkedout())
+            checked_in.add_metric([name], pool.checkedin())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+
+        return [size, checked_out, checked_in, overflow]
@@ -0,0 +1,147 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import Context, ContextVar, copy_context
+import time
+from typing import Any, AsyncIterator, Coroutine, Dict, FrozenSet, Iterator, Optional, Tuple
+
+from prometheus_client import Gauge, Histogram
+
+from src.configs.settings import settings
+from src.domain.constants.resource_pools import ResourceClass, ResourceKind
+
+# Loại workload của context hiện tại, mặc định là request từ UI (routers)
+_current_resource_class: ContextVar[ResourceClass] = ContextVar("resource_class", default=ResourceClass.INTERACTIVE)
+# Các tài nguyên mà context hiện tại đang giữ slot, để session lồng nhau không tự chờ chính nó
+_held_resources: ContextVar[FrozenSet[ResourceKind]] = ContextVar("held_resources", default=frozenset())
+
+RESOURCE_POOL_LIMIT = Gauge(
+    "resource_pool_limit",
+    "Concurrency limit per resource class (0 = unlimited)",
+    ["resource_class", "resource"]
+)
+RESOURCE_POOL_IN_USE = Gauge(
+    "resource_pool_in_use",
+    "Slots currently held per resource class",
+    ["resource_class", "resource"]
+)
+RESOURCE_POOL_WAITING = Gauge(
+    "resource_pool_waiting",
+    "Callers waiting for a slot per resource class",
+    ["resource_class", "resource"]
+)
+RESOURCE_POOL_WAIT_SECONDS = Histogram(
+    "resource_pool_wait_seconds",
+    "Time spent waiting for a slot per resource class",
+    ["resource_class", "resource"]
+)
+
+
+class ResourceLimiter:
+    """Concurrency budget of one resource kind for one resource class"""
+
+    def __init__(self, resource_class: ResourceClass, kind: ResourceKind, limit: int):
+        self.resource_class = resource_class
+        self.kind = kind
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+        labels = {"resource_class": resource_class.value, "resource": kind.value}
+        RESOURCE_POOL_LIMIT.labels(**labels).set(limit)
+        self._in_use = RESOURCE_POOL_IN_USE.labels(**labels)
+        self._waiting = RESOURCE_POOL_WAITING.labels(**labels)
+        self._wait_seconds = RESOURCE_POOL_WAIT_SECONDS.labels(**labels)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        if self._semaphore is not None:
+            started_at = time.perf_counter()
+            self._waiting.inc()
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self._waiting.dec()
+            self._wait_seconds.observe(time.perf_counter() - started_at)
+
+        self._in_use.inc()
+        try:
+            yield
+        finally:
+            self._in_use.dec()
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+_LIMITS: Dict[Tuple[ResourceClass, ResourceKind], int] = {
+    (ResourceClass.INTERACTIVE, ResourceKind.DB_SESSION): settings.RESOURCE_INTERACTIVE_DB_SESSIONS,
+    (ResourceClass.WEBHOOK, ResourceKind.DB_SESSION): settings.RESOURCE_WEBHOOK_DB_SESSIONS,
+    (ResourceClass.SYNC, ResourceKind.DB_SESSION): settings.RESOURCE_SYNC_DB_SESSIONS,
+    (ResourceClass.INTERACTIVE, ResourceKind.JIRA_REQUEST): settings.RESOURCE_INTERACTIVE_JIRA_REQUESTS,
+    (ResourceClass.WEBHOOK, ResourceKind.JIRA_REQUEST): settings.RESOURCE_WEBHOOK_JIRA_REQUESTS,
+    (ResourceClass.SYNC, ResourceKind.JIRA_REQUEST): settings.RESOURCE_SYNC_JIRA_REQUESTS,
+}
+
+_limiters: Dict[Tuple[ResourceClass, ResourceKind], ResourceLimiter] = {
+    key: ResourceLimiter(key[0], key[1], limit) for key, limit in _LIMITS.items()
+}
+
+
+def get_resource_class() -> ResourceClass:
+    """Resource class of the current context"""
+    return _current_resource_class.get()
+
+
+@contextmanager
+def use_resource_class(resource_class: ResourceClass) -> Iterator[None]:
+    """Run the enclosed code (and tasks created inside it) under the given resource class
+
+    Usage:
+        with use_resource_class(ResourceClass.WEBHOOK):
+            await webhook_service.handle_webhook(session, webhook_data)
+    """
+    previous = _current_resource_class.get()
+    _current_resource_class.set(resource_class)
+    try:
+        yield
+    finally:
+        _current_resource_class.set(previous)
+
+
+@asynccontextmanager
+async def acquire_resource(kind: ResourceKind) -> AsyncIterator[None]:
+    """Wait for a slot of ``kind`` in the budget of the current resource class
+
+    Re-entrant: nested acquisitions of the same kind in one context reuse the outer slot.
+    """
+    held = _held_resources.get()
+    if kind in held:
+        yield
+        return
+
+    async with _limiters[(get_resource_class(), kind)].acquire():
+        # Dùng set() thay vì reset(token): FastAPI có thể dọn dependency ở context khác
+        _held_resources.set(held | {kind})
+        try:
+            yield
+        finally:
+            _held_resources.set(held)
+
+
+def _resource_task_factory(
+    loop: asyncio.AbstractEventLoop,
+    coro: Coroutine[Any, Any, Any],
+    context: Optional[Context] = None,
+    **kwargs: Any
+) -> "asyncio.Task[Any]":
+    # Task con kế thừa bản copy context của task cha, kể cả _held_resources; bỏ đi để task con
+    # không dùng chung slot mà task cha đang giữ và vẫn phải chờ limiter
+    task_context = context.copy() if context is not None else copy_context()
+    task_context.run(_held_resources.set, frozenset())
+    return asyncio.Task(coro, loop=loop, context=task_context, **kwargs)
+
+
+def install_resource_task_factory(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Make tasks spawned on ``loop`` (create_task, gather, ...) start without held resource slots
+
+    The resource class is still inherited, only the re-entrancy of acquire_resource is per task.
+    """
+    (loop or asyncio.get_running_loop()).set_task_factory(_resource_task_factory)
@@ -14,6 +14,31 @@ class Settings(BaseSettings):
 
     # Database settings
     DATABASE_URL: PostgresDsn
+    # Pool kết nối của mỗi engine trong mỗi process (DATABASE_POOL_SIZE=0: NullPool, không giữ kết nối)
+    DATABASE_POOL_SIZE: int = 40
+    DATABASE_MAX_OVERFLOW: int = 40
+    DATABASE_POOL_PRE_PING: bool = True
+    # Chạy sau PgBouncer (transaction pooling): tắt cache prepared statement của asyncpg
+    DATABASE_PGBOUNCER_MODE: bool = False
+
+    # Giới hạn đồng thời theo loại workload (0: không giới hạn), tránh để sync chiếm hết pool của UI
+    RESOURCE_INTERACTIVE_DB_SESSIONS: int = 40
+    RESOURCE_WEBHOOK_DB_SESSIONS: int = 20
+    RESOURCE_SYNC_DB_SESSIONS: int = 10
+    RESOURCE_INTERACTIVE_JIRA_REQUESTS: int = 20
+    RESOURCE_WEBHOOK_JIRA_REQUESTS: int = 10
+    RESOURCE_SYNC_JIRA_REQUESTS: int = 5
+    # Session chỉ đọc (GET endpoints) có gửi SET TRANSACTION READ ONLY hay không (tốn thêm 1 round-trip)
+    DATABASE_READ_ONLY_ENFORCE: bool = False
+    # Read replica (tùy chọn) cho analytics và list endpoints
+    DATABASE_READ_REPLICA_URL: PostgresDsn | None = None
+    # Pool riêng của replica trong mỗi process (0: NullPool)
+    DATABASE_READ_REPLICA_POOL_SIZE: int = 10
+    DATABASE_READ_REPLICA_MAX_OVERFLOW: int = 10
+    # Replica trễ quá ngưỡng này (giây) thì đọc từ primary
+    DATABASE_READ_REPLICA_MAX_LAG_SECONDS: float = 10.0
+    # Khoảng thời gian (giây) giữa các lần kiểm tra độ trễ replica
+    DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
 
     # Application settings
     APP_NAME: str = "zODC Backend"
@@ -24,6 +49,25 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "DEBUG"
+    # Mức log riêng theo module (JSON), vd. {"src.infrastructure.services.nats_service": "WARNING"}
+    LOG_MODULE_LEVELS: dict[str, str] = {}
+    # Ghi log qua queue ở thread riêng, không chặn event loop khi ghi stdout / file
+    LOG_ENQUEUE: bool = True
+    # Độ dài tối đa của một message và của payload / response được log
+    LOG_MAX_MESSAGE_LENGTH: int = 10000
+    LOG_PAYLOAD_MAX_LENGTH: int = 1000
+    # Số log tối đa cho mỗi loại sự kiện lặp lại trong một cửa sổ thời gian
+    LOG_RATE_LIMIT_COUNT: int = 20
+    LOG_RATE_LIMIT_WINDOW_SECONDS: float = 60.0
+
+    # Tracing (OpenTelemetry)
+    TRACING_ENABLED: bool = False
+    # file, memory, console hoặc "module:Class" của một SpanExporter bất kỳ
+    TRACING_EXPORTER: str = "file"
+    TRACING_FILE_PATH: str = "logs/traces.jsonl"
+    # Tỉ lệ trace gốc được ghi (0-1), trace con theo quyết định của trace cha
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_SERVICE_NAME: str | None = None
 
     # Port
     PORT: int = 8001
@@ -62,6 +106,48 @@ class Settings(BaseSettings):
     AUTH_SERVICE_URL: str = "http://localhost:8081"
     JIRA_CLIENT_ID: str = ""
     JIRA_CLIENT_SECRET: str = ""
+    # Thời gian (giây) giữ Jira access token trong bộ nhớ process trước khi đọc lại từ Redis
+    JIRA_TOKEN_LOCAL_CACHE_TTL_SECONDS: int = 30
+    # TTL (giây) của Redis lock khi refresh token, tránh nhiều replica cùng rotate refresh token
+    JIRA_TOKEN_REFRESH_LOCK_TTL_SECONDS: int = 30
+    # Gộp các GET Jira giống hệt nhau (URL, params, danh tính auth) đang chạy đồng thời thành một request
+    JIRA_GET_COALESCING_ENABLED: bool = True
+    # Giữ response GET trong bộ nhớ process thêm vài giây (0: chỉ gộp request đang chạy)
+    JIRA_GET_CACHE_TTL_SECONDS: float = 0.0
+    JIRA_GET_CACHE_MAX_ENTRIES: int = 1000
+    # Số user được refresh token đồng thời trong job định kỳ
+    TOKEN_REFRESH_JOB_CONCURRENCY: int = 5
+
+    # Bầu leader chạy scheduled jobs qua Redis lease (giây)
+    SCHEDULER_LEADER_LEASE_SECONDS: int = 15
+    SCHEDULER_LEADER_RENEW_INTERVAL_SECONDS: int = 5
+
+    # Ghi sync_logs bất đồng bộ theo lô
+    SYNC_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    SYNC_LOG_BATCH_SIZE: int = 200
+    SYNC_LOG_QUEUE_MAX_SIZE: int = 10000
+    # Payload lớn hơn ngưỡng này (bytes JSON) sẽ được rút gọn
+    SYNC_LOG_MAX_PAYLOAD_BYTES: int = 8192
+    # Tỉ lệ giữ lại log của thao tác thành công (0-1), log lỗi luôn được ghi
+    SYNC_LOG_SUCCESS_SAMPLE_RATE: float = 1.0
+
+    # Phân vùng theo tháng của sync_logs / jira_issue_histories
+    PARTITION_PREMAKE_MONTHS: int = 3
+    # Số tháng dữ liệu được giữ lại, 0 = giữ vĩnh viễn
+    SYNC_LOG_RETENTION_MONTHS: int = 6
+    JIRA_ISSUE_HISTORY_RETENTION_MONTHS: int = 0
+    # Nếu đặt, partition hết hạn được detach và chuyển sang schema này thay vì bị xóa
+    PARTITION_ARCHIVE_SCHEMA: str | None = None
+    PARTITION_MAINTENANCE_LOCK_TIMEOUT_SECONDS: int = 5
+
+    # Transport HTTP của Jira / Microsoft Graph: live, record (gọi thật và ghi lại) hoặc replay (đọc từ cassette)
+    HTTP_TRANSPORT_MODE: str = "live"
+    # Thư mục chứa cassette, mỗi API một file <tên>.jsonl.gz
+    HTTP_CASSETTE_DIR: str = "cassettes"
+    # Độ trễ giả lập khi replay (ms): cố định + ngẫu nhiên 0..jitter, hoặc dùng độ trễ đã ghi
+    HTTP_REPLAY_LATENCY_MS: float = 0.0
+    HTTP_REPLAY_JITTER_MS: float = 0.0
+    HTTP_REPLAY_USE_RECORDED_LATENCY: bool = False
 
     # Jira dashboard URL
     JIRA_DASHBOARD_URL: str = "https://vphoa.atlassian.net"
@@ -70,6 +156,13 @@ class Settings(BaseSettings):
     JIRA_ADMIN_USERNAME: str = "1234567890"
     JIRA_ADMIN_PASSWORD: str = "1234567890"
 
+    # Số user tối đa giữ trong identity map (LRU) của mỗi process
+    USER_IDENTITY_MAP_MAX_SIZE: int = 10000
+    # Thời gian sống của một user trong identity map, giới hạn độ trễ nếu bỏ lỡ invalidation
+    USER_IDENTITY_MAP_TTL_SECONDS: int = 300
+    # Chu kỳ kiểm tra version key trên Redis để biết process khác đã ghi user
+    USER_IDENTITY_MAP_VERSION_CHECK_SECONDS: float = 1.0
+
     # Azure Blob Storage settings
     AZURE_STORAGE_ACCOUNT_CONTAINER_NAME: str = "media-files"
 
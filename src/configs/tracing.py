@@ -0,0 +1,140 @@
+import importlib
+import json
+from threading import Lock
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from opentelemetry import propagate, trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.configs.logger import log
+from src.configs.settings import settings
+
+# Tracer dùng chung; khi tracing tắt đây là no-op tracer của opentelemetry-api
+tracer = trace.get_tracer("zodc.integration")
+
+_provider: Optional[TracerProvider] = None
+_exporter: Optional[SpanExporter] = None
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends finished spans as JSON lines to a local file, usable without a collector"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._lock = Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = [json.dumps(json.loads(span.to_json()), separators=(",", ":")) for span in spans]
+        try:
+            with self._lock, open(self.file_path, "a", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        except OSError as e:
+            log.warning(f"Error writing spans to {self.file_path}: {str(e)}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _create_exporter(name: str) -> SpanExporter:
+    """Build the exporter from TRACING_EXPORTER: file, memory, console or "module:Class" of any SpanExporter"""
+    if name == "file":
+        return FileSpanExporter(settings.TRACING_FILE_PATH)
+    if name == "memory":
+        return InMemorySpanExporter()
+    if name == "console":
+        return ConsoleSpanExporter()
+
+    # Exporter tùy chỉnh, vd. "opentelemetry.exporter.otlp.proto.grpc.trace_exporter:OTLPSpanExporter"
+    module_name, _, class_name = name.partition(":")
+    exporter_class = getattr(importlib.import_module(module_name), class_name)
+    exporter: SpanExporter = exporter_class()
+    return exporter
+
+
+def configure_tracing() -> None:
+    """Install the SDK tracer provider and exporter when TRACING_ENABLED is set"""
+    global _provider, _exporter
+    if not settings.TRACING_ENABLED or _provider is not None:
+        return
+
+    _exporter = _create_exporter(settings.TRACING_EXPORTER)
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME or settings.APP_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO))
+    )
+    # Exporter trong bộ nhớ cần span ngay khi kết thúc, các exporter khác xuất theo lô ở thread nền
+    processor = SimpleSpanProcessor(_exporter) if isinstance(_exporter, InMemorySpanExporter) else BatchSpanProcessor(_exporter)
+    _provider.add_span_processor(processor)
+    trace.set_tracer_provider(_provider)
+    log.info(f"Tracing enabled with {settings.TRACING_EXPORTER} exporter")
+
+
+def shutdown_tracing() -> None:
+    """Flush and close the exporter"""
+    if _provider is not None:
+        _provider.shutdown()
+
+
+def get_span_exporter() -> Optional[SpanExporter]:
+    """Exporter in use, e.g. to read finished spans from the in-memory exporter"""
+    return _exporter
+
+
+def inject_trace_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Add W3C trace context of the current span to message headers"""
+    headers = dict(headers or {})
+    propagate.inject(headers)
+    return headers
+
+
+def extract_trace_context(headers: Optional[Mapping[str, str]]) -> Context:
+    """Trace context carried by message headers (empty context if none)"""
+    return propagate.extract(dict(headers or {}))
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Create a span for every SQL statement executed on the engine"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query_span(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if context is None:
+            return
+        operation = statement.lstrip().split(" ", 1)[0].upper()
+        span = tracer.start_span(f"db.{operation.lower()}", kind=trace.SpanKind.CLIENT)
+        if span.is_recording():
+            span.set_attribute("db.system", "postgresql")
+            span.set_attribute("db.operation", operation)
+            span.set_attribute("db.statement", statement[:500])
+        context._trace_span = span
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end_query_span(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            span.end()
+            context._trace_span = None
+
+    @event.listens_for(engine, "handle_error")
+    def _fail_query_span(exception_context: Any) -> None:
+        context = exception_context.execution_context
+        span = getattr(context, "_trace_span", None) if context is not None else None
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+            span.end()
+            context._trace_span = None
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class HTTPTransportMode(str, Enum):
+    """Cách client Jira / Microsoft Graph gửi request"""
+    LIVE = "live"  # Gọi API thật
+    RECORD = "record"  # Gọi API thật và ghi response vào cassette
+    REPLAY = "replay"  # Chỉ trả response từ cassette, không cần mạng
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class PartitionedTable(str, Enum):
+    """Tables range-partitioned by month on created_at"""
+    SYNC_LOGS = "sync_logs"
+    JIRA_ISSUE_HISTORIES = "jira_issue_histories"
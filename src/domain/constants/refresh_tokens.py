@@ -1,6 +1,17 @@
 from enum import Enum
 
+# Redis lock khi refresh token của một user, dùng chung giữa JiraAPIClient và job refresh định kỳ
+JIRA_TOKEN_REFRESH_LOCK_KEY = "jira_token_refresh_lock:{user_id}"
+
 
 class TokenType(Enum):
     MICROSOFT = "microsoft"
     JIRA = "jira"
+
+
+class TokenRefreshResult(Enum):
+    """Kết quả kiểm tra refresh token của một user"""
+    SKIPPED = "skipped"  # Chưa đến hạn
+    REFRESHED = "refreshed"
+    ROTATED = "rotated"
+    FAILED = "failed"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class ResourceClass(str, Enum):
+    """Loại workload, mỗi loại có giới hạn DB session và Jira request riêng"""
+    INTERACTIVE = "interactive"  # API request từ UI, NATS request/reply có người đang chờ
+    WEBHOOK = "webhook"  # Xử lý webhook từ Jira
+    SYNC = "sync"  # Sync project qua NATS, scheduled jobs, ghi sync log nền
+
+
+class ResourceKind(str, Enum):
+    DB_SESSION = "db_session"
+    JIRA_REQUEST = "jira_request"
@@ -61,6 +61,8 @@ class JiraIssueHistoryAPIGetDTO(BaseModel):
     key: str
     created_at: str
     changelogs: List[JiraIssueChangelogAPIGetDTO]
+    total: int = 0  # Tổng số changelog (sau khi lọc), không phụ thuộc limit/offset
+    has_more: bool = False
 
     class Config:
         populate_by_name = True
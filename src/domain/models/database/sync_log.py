@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -13,3 +14,5 @@ class SyncLogDBCreateDTO(BaseModel):
     response_status: Optional[int] = None
     response_body: Dict[str, Any] = Field(default_factory=dict)
     error_message: Optional[str] = None
+    # Thời điểm xảy ra thao tác (khi log được ghi trễ theo lô), mặc định là lúc insert
+    created_at: Optional[datetime] = None
@@ -42,7 +42,7 @@ class JiraIssueMapper:
             )
 
     @staticmethod
-    def _convert_adf_to_html(adf_data: Union[str, Dict[str, Any], None]) -> Optional[str]:
+    def convert_adf_to_html(adf_data: Union[str, Dict[str, Any], None]) -> Optional[str]:
         """Convert Atlassian Document Format to HTML"""
         if adf_data is None:
             return None
@@ -190,6 +190,13 @@ class JiraIssueMapper:
             log.error(f"Error converting ADF to HTML: {str(e)}")
             return None
 
+    @staticmethod
+    def build_link_url(project_key: str, board_id: Optional[int], issue_key: str) -> Optional[str]:
+        """Build the board link of an issue, None when the issue is not on a board"""
+        if not board_id:
+            return None
+        return f"{settings.JIRA_DASHBOARD_URL}/jira/software/projects/{project_key}/boards/{board_id}?selectedIssue={issue_key}"
+
     @staticmethod
     def to_domain(api_response: JiraIssueAPIGetResponseDTO) -> Optional[JiraIssueModel]:
         try:
@@ -201,7 +208,7 @@ class JiraIssueMapper:
             description: Optional[str] = api_response.rendered_fields.get(
                 "description", None) if api_response.rendered_fields else None
             if description is None:
-                description = JiraIssueMapper._convert_adf_to_html(fields.description)
+                description = JiraIssueMapper.convert_adf_to_html(fields.description)
 
             # Map user data
             assignee = None
@@ -225,9 +232,7 @@ class JiraIssueMapper:
             # Create link URL
             # project_key = api_response.key.split("-")[0]
             board_id = sprints[0].board_id if sprints else None
-            link_url: Optional[str] = None
-            if board_id:
-                link_url = f"{settings.JIRA_DASHBOARD_URL}/jira/software/projects/{project_key}/boards/{board_id}?selectedIssue={api_response.key}"
+            link_url = JiraIssueMapper.build_link_url(project_key, board_id, api_response.key)
 
             # Map issue type
             # if issue type is subtask or epic, ignore it
@@ -81,6 +81,7 @@ class JiraIssueAPICreateRequestDTO(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: Optional[datetime] = Field(default_factory=datetime.now)
     sprint_id: Optional[int] = None
+    board_id: Optional[int] = None  # Board của sprint, dùng để dựng link_url khi không đọc lại issue
     link_url: Optional[str] = None
 
     @classmethod
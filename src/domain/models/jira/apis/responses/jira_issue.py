@@ -57,3 +57,20 @@ class JiraIssueAPIGetResponseDTO(JiraAPIResponseBase):
 
 class JiraIssueBulkFetchAPIGetResponseDTO(JiraAPIResponseBase):
     issues: List[JiraIssueAPIGetResponseDTO]
+
+
+class JiraIssueCreateAPIResponseDTO(JiraAPIResponseBase):
+    id: str
+    key: str
+    self: str
+
+
+class JiraIssueBulkCreateAPIErrorDTO(JiraAPIResponseBase):
+    status: Optional[int] = None
+    element_errors: Dict[str, Any] = Field(default_factory=dict, alias="elementErrors")
+    failed_element_number: int = Field(alias="failedElementNumber")
+
+
+class JiraIssueBulkCreateAPIResponseDTO(JiraAPIResponseBase):
+    issues: List[JiraIssueCreateAPIResponseDTO] = Field(default_factory=list)
+    errors: List[JiraIssueBulkCreateAPIErrorDTO] = Field(default_factory=list)
@@ -0,0 +1,12 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class PartitionMaintenanceResultModel(BaseModel):
+    """Changes made to the partitions of one table by a maintenance run"""
+    table: str
+    created: List[str] = []
+    dropped: List[str] = []
+    archived: List[str] = []
+    default_rows_deleted: int = 0
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SchedulerLeaderStatusModel(BaseModel):
+    """Leader election state of the scheduled jobs, seen from the current process"""
+    instance_id: str
+    is_leader: bool
+    leader_id: Optional[str] = None
+    lease_seconds: int
+    acquired_at: Optional[datetime] = None
+    last_renewed_at: Optional[datetime] = None
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -43,6 +43,22 @@ class IJiraIssueRepository(ABC):
     ) -> List[JiraIssueModel]:
         pass
 
+    @abstractmethod
+    async def get_project_issues_page(
+        self,
+        session: AsyncSession,
+        project_key: str,
+        sprint_id: Optional[int] = None,
+        is_backlog: Optional[bool] = None,
+        issue_type: Optional[JiraIssueType] = None,
+        search: Optional[str] = None,
+        include_deleted: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[JiraIssueModel], Optional[str]]:
+        """Get one page of project issues and the cursor of the next page (None if last page)"""
+        pass
+
     @abstractmethod
     async def get_by_jira_issue_key(self, session: AsyncSession, jira_issue_key: str) -> Optional[JiraIssueModel]:
         pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class IPartitionRepository(ABC):
+    """Manages the monthly range partitions of a partitioned table"""
+
+    @abstractmethod
+    async def set_lock_timeout(self, session: AsyncSession, seconds: int) -> None:
+        """Limit how long DDL in the current transaction waits for table locks"""
+        pass
+
+    @abstractmethod
+    async def get_monthly_partitions(self, session: AsyncSession, table: str) -> Dict[date, str]:
+        """Get the monthly partitions attached to a table, keyed by first day of the month"""
+        pass
+
+    @abstractmethod
+    async def create_monthly_partition(self, session: AsyncSession, table: str, month: date) -> str:
+        """Create the partition of a month and return its name"""
+        pass
+
+    @abstractmethod
+    async def drop_partition(self, session: AsyncSession, table: str, partition: str) -> None:
+        """Drop a partition and its rows"""
+        pass
+
+    @abstractmethod
+    async def archive_partition(self, session: AsyncSession, table: str, partition: str, archive_schema: str) -> None:
+        """Detach a partition and move it to the archive schema"""
+        pass
+
+    @abstractmethod
+    async def delete_default_partition_rows(self, session: AsyncSession, table: str, created_before: datetime) -> int:
+        """Delete rows older than created_before from the DEFAULT partition"""
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -33,3 +34,8 @@ class IRefreshTokenRepository(ABC):
     async def revoke_tokens_by_user_and_type(self, session: AsyncSession, user_id: int, token_type: TokenType) -> None:
         """Revoke all tokens of a specific type for a user"""
         pass
+
+    @abstractmethod
+    async def get_latest_tokens_expiring_before(self, session: AsyncSession, expires_before: datetime) -> List[RefreshTokenModel]:
+        """Get the latest token of each user and token type that expires before the given time"""
+        pass
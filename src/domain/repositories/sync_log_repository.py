@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -8,7 +9,13 @@ from src.domain.models.sync_log import SyncLogModel
 
 class ISyncLogRepository(ABC):
     @abstractmethod
-    async def create_sync_log(self, session: AsyncSession, sync_log: SyncLogDBCreateDTO) -> SyncLogModel:
+    async def create_sync_log(self, session: AsyncSession, sync_log: SyncLogDBCreateDTO) -> Optional[SyncLogModel]:
+        """Create a sync log, None if the log is written asynchronously (or sampled out)"""
+        pass
+
+    @abstractmethod
+    async def create_sync_logs(self, session: AsyncSession, sync_logs: List[SyncLogDBCreateDTO]) -> None:
+        """Insert multiple sync logs in one statement"""
         pass
 
     @abstractmethod
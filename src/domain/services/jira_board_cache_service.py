@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+
+class IJiraBoardCacheService(ABC):
+    """Cache of the sprint -> board and board -> project key mappings of Jira"""
+
+    @abstractmethod
+    async def get_sprint_board_id(self, sprint_id: int) -> Optional[int]:
+        """Get the cached board ID of a sprint, None if not cached"""
+        pass
+
+    @abstractmethod
+    async def get_board_project_key(self, board_id: int) -> Optional[str]:
+        """Get the cached project key of a board, None if not cached"""
+        pass
+
+    @abstractmethod
+    async def get_project_key_for_sprint(self, sprint_id: int) -> Optional[str]:
+        """Get the project key of a sprint through its cached board, None if either is not cached"""
+        pass
+
+    @abstractmethod
+    async def set_sprint_board(self, sprint_id: int, board_id: int) -> None:
+        """Cache the board ID of a sprint"""
+        pass
+
+    @abstractmethod
+    async def set_board_project(self, board_id: int, project_key: str) -> None:
+        """Cache the project key of a board"""
+        pass
+
+    @abstractmethod
+    async def set_project_sprints(self, project_key: str, sprint_boards: Dict[int, int]) -> None:
+        """Cache {sprint_id: board_id} of a project and the project key of those boards"""
+        pass
@@ -16,11 +16,27 @@ from src.domain.models.jira_issue_link import JiraIssueLinkModel
 
 class IJiraIssueAPIService(ABC):
     @abstractmethod
-    async def create_issue(self, session: AsyncSession, user_id: int, issue_data: JiraIssueAPICreateRequestDTO) -> JiraIssueModel:
+    async def create_issue(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        issue_data: JiraIssueAPICreateRequestDTO,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
+        """Create new issue, lightweight skips reading the issue back from Jira"""
         pass
 
     @abstractmethod
-    async def update_issue(self, session: AsyncSession, user_id: int, issue_id: str, update: JiraIssueAPIUpdateRequestDTO) -> JiraIssueModel:
+    async def update_issue(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        issue_id: str,
+        update: JiraIssueAPIUpdateRequestDTO,
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
+        """Update issue, lightweight applies the update to current_issue instead of reading it back from Jira"""
         pass
 
     @abstractmethod
@@ -33,12 +49,34 @@ class IJiraIssueAPIService(ABC):
         pass
 
     @abstractmethod
-    async def create_issue_with_admin_auth(self, session: AsyncSession, issue_data: JiraIssueAPICreateRequestDTO) -> JiraIssueModel:
+    async def create_issue_with_admin_auth(
+        self,
+        session: AsyncSession,
+        issue_data: JiraIssueAPICreateRequestDTO,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
         """Create new issue using admin auth"""
         pass
 
     @abstractmethod
-    async def update_issue_with_admin_auth(self, session: AsyncSession, issue_id: str, update: JiraIssueAPIUpdateRequestDTO) -> JiraIssueModel:
+    async def bulk_create_issues_with_admin_auth(
+        self,
+        session: AsyncSession,
+        issues_data: List[JiraIssueAPICreateRequestDTO],
+        lightweight: bool = False
+    ) -> List[Optional[JiraIssueModel]]:
+        """Create multiple issues using admin auth, result is aligned with issues_data (None on failure)"""
+        pass
+
+    @abstractmethod
+    async def update_issue_with_admin_auth(
+        self,
+        session: AsyncSession,
+        issue_id: str,
+        update: JiraIssueAPIUpdateRequestDTO,
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
         """Update issue using admin auth"""
         pass
 
@@ -61,8 +99,18 @@ class IJiraIssueAPIService(ABC):
         pass
 
     @abstractmethod
-    async def transition_issue_with_admin_auth(self, issue_id: str, status: Union[JiraIssueStatus, str]) -> bool:
-        """Transition issue using admin auth"""
+    async def transition_issue_with_admin_auth(
+        self,
+        issue_id: str,
+        status: Union[JiraIssueStatus, str],
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> bool:
+        """Transition issue using admin auth
+
+        current_issue (project, type and current status) lets the transition ID be served from cache.
+        lightweight skips the verification GET after the transition.
+        """
         pass
 
     @abstractmethod
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -31,6 +31,22 @@ class IJiraIssueDatabaseService(ABC):
         """Get project issues from database"""
         pass
 
+    @abstractmethod
+    async def get_project_issues_page(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        project_key: str,
+        sprint_id: Optional[int] = None,
+        is_backlog: Optional[bool] = None,
+        issue_type: Optional[JiraIssueType] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[JiraIssueModel], Optional[str]]:
+        """Get one page of project issues from database and the cursor of the next page"""
+        pass
+
     @abstractmethod
     async def get_issue_by_key(self, session: AsyncSession, issue_key: str) -> Optional[JiraIssueModel]:
         """Get issue by key from database"""
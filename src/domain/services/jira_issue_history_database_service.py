@@ -15,9 +15,27 @@ class IJiraIssueHistoryDatabaseService(ABC):
     async def get_issue_history(
         self,
         session: AsyncSession,
-        jira_issue_id: str
+        jira_issue_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        field_names: Optional[List[str]] = None,
+        with_known_author: bool = False
     ) -> List[JiraIssueHistoryModel]:
-        """Lấy toàn bộ lịch sử thay đổi của một issue"""
+        """Lấy lịch sử thay đổi của một issue (toàn bộ nếu không truyền limit)
+
+        ``field_names`` và ``with_known_author`` lọc trước khi áp dụng offset/limit.
+        """
+        pass
+
+    @abstractmethod
+    async def count_issue_history(
+        self,
+        session: AsyncSession,
+        jira_issue_id: str,
+        field_names: Optional[List[str]] = None,
+        with_known_author: bool = False
+    ) -> int:
+        """Đếm số history event của một issue với cùng bộ lọc như get_issue_history"""
         pass
 
     @abstractmethod
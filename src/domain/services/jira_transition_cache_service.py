@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+
+class IJiraTransitionCacheService(ABC):
+    """Cache of Jira transition IDs keyed by (project_key, issue_type, from_status)"""
+
+    @abstractmethod
+    async def get_transitions(self, project_key: str, issue_type: str, from_status: str) -> Optional[Dict[str, str]]:
+        """Get cached {target_status: transition_id} mapping, None if not cached"""
+        pass
+
+    @abstractmethod
+    async def get_transition_id(self, project_key: str, issue_type: str, from_status: str, to_status: str) -> Optional[str]:
+        """Get cached transition ID from from_status to to_status"""
+        pass
+
+    @abstractmethod
+    async def set_transitions(self, project_key: str, issue_type: str, from_status: str, transitions: Dict[str, str]) -> None:
+        """Cache {target_status: transition_id} mapping"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, project_key: str, issue_type: str, from_status: str) -> None:
+        """Remove cached transitions, e.g. when Jira rejects a cached transition ID"""
+        pass
@@ -28,6 +28,11 @@ class IJiraUserDatabaseService(ABC):
     async def get_user_by_jira_account_id(self, session: AsyncSession, jira_account_id: str) -> Optional[JiraUserModel]:
         pass
 
+    @abstractmethod
+    async def get_users_by_jira_account_ids(self, session: AsyncSession, jira_account_ids: List[str]) -> List[JiraUserModel]:
+        """Get users by Jira account IDs in a single query"""
+        pass
+
     @abstractmethod
     async def get_users_by_project(self, session: AsyncSession, project_key: str) -> List[JiraUserModel]:
         pass
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.domain.models.jira_user import JiraUserModel
+
+
+class IJiraUserIdentityMapService(ABC):
+    """In-process identity map of Jira users (user_id <-> jira_account_id <-> name/avatar)
+
+    Entries expire after a TTL; cross-process invalidation is handled by the repository using it.
+    """
+
+    @abstractmethod
+    def get_by_user_id(self, user_id: int) -> Optional[JiraUserModel]:
+        """Get cached user by internal user ID, None if not cached"""
+        pass
+
+    @abstractmethod
+    def get_by_jira_account_id(self, jira_account_id: str) -> Optional[JiraUserModel]:
+        """Get cached user by Jira account ID, None if not cached"""
+        pass
+
+    @abstractmethod
+    def put(self, user: JiraUserModel) -> None:
+        """Add or refresh a user"""
+        pass
+
+    @abstractmethod
+    def put_many(self, users: List[JiraUserModel]) -> None:
+        """Add or refresh multiple users, e.g. when warming up at startup"""
+        pass
+
+    @abstractmethod
+    def evict(self, user_id: Optional[int] = None, jira_account_id: Optional[str] = None) -> None:
+        """Remove a user by internal user ID and/or Jira account ID"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.constants.partitions import PartitionedTable
+from src.domain.models.partition import PartitionMaintenanceResultModel
+
+
+class IPartitionMaintenanceService(ABC):
+    """Creates upcoming monthly partitions and expires old ones by retention"""
+
+    @abstractmethod
+    def get_partitioned_tables(self) -> List[PartitionedTable]:
+        pass
+
+    @abstractmethod
+    async def maintain_partitions(self, session: AsyncSession, table: PartitionedTable) -> PartitionMaintenanceResultModel:
+        """Create missing future partitions of a table and drop or archive expired ones"""
+        pass
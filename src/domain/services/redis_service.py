@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class IRedisService(ABC):
@@ -13,6 +13,16 @@ class IRedisService(ABC):
         """Set a value in Redis with an expiry time."""
         pass
 
+    @abstractmethod
+    async def set_many(self, values: Dict[str, str], expiry: Optional[int] = None) -> None:
+        """Set several values with the same expiry time in one round-trip."""
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer value, returns the new value."""
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete a key from Redis."""
@@ -28,6 +38,31 @@ class IRedisService(ABC):
         """Get Jira access token from cache if exists."""
         pass
 
+    @abstractmethod
+    async def get_cached_jira_token_with_last_check(self, user_id: int) -> Tuple[str, bool]:
+        """Get cached Jira access token and whether its refresh was checked recently, in one round-trip."""
+        pass
+
+    @abstractmethod
+    async def mark_jira_token_checked(self, user_id: int, expiry: int = 600) -> None:
+        """Remember that the Jira token refresh of a user was checked."""
+        pass
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, expiry: int, owner_token: Optional[str] = None) -> Optional[str]:
+        """Try to acquire a lock shared across replicas, returns the owner token or None if already held."""
+        pass
+
+    @abstractmethod
+    async def extend_lock(self, key: str, owner_token: str, expiry: int) -> bool:
+        """Reset the expiry of a lock only if it is still held by owner_token."""
+        pass
+
+    @abstractmethod
+    async def release_lock(self, key: str, owner_token: str) -> bool:
+        """Release a lock only if it is still held by owner_token."""
+        pass
+
     @abstractmethod
     async def cache_microsoft_token(self, user_id: int, access_token: str, expiry: int = 3600) -> None:
         """Cache microsoft access token with expiry."""
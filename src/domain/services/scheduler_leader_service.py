@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.scheduler_leader import SchedulerLeaderStatusModel
+
+
+class ISchedulerLeaderService(ABC):
+    """Elects one process across workers and replicas to run the scheduled jobs"""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start competing for leadership in the background"""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop competing and hand over leadership if held"""
+        pass
+
+    @abstractmethod
+    def is_leader(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_status(self) -> SchedulerLeaderStatusModel:
+        """Get current leader and lease state"""
+        pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.database.sync_log import SyncLogDBCreateDTO
+
+
+class ISyncLogWriterService(ABC):
+    """Writes sync logs in the background, off the request path"""
+
+    @abstractmethod
+    def enqueue(self, sync_log: SyncLogDBCreateDTO) -> bool:
+        """Queue a sync log for writing, False if it was sampled out or dropped"""
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start flushing queued logs periodically"""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop the background flush and write the remaining logs"""
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Write all queued logs now"""
+        pass
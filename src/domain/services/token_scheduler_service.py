@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.domain.constants.refresh_tokens import TokenType
+from src.domain.constants.refresh_tokens import TokenRefreshResult, TokenType
+from src.domain.models.refresh_token import RefreshTokenModel
 
 
 class ITokenSchedulerService(ABC):
@@ -12,6 +14,26 @@ class ITokenSchedulerService(ABC):
         pass
 
     @abstractmethod
-    async def refresh_token_chain(self, session: AsyncSession, user_id: int, token_type: TokenType) -> None:
-        """Refresh both access and refresh tokens"""
+    async def get_tokens_due_for_refresh(self, session: AsyncSession) -> List[RefreshTokenModel]:
+        """Get the latest token of each user and token type that needs a refresh or rotation"""
+        pass
+
+    @abstractmethod
+    async def refresh_token_if_due(self, session: AsyncSession, token: RefreshTokenModel) -> TokenRefreshResult:
+        """Refresh the access token or rotate the refresh token if it is close to expiry"""
+        pass
+
+    @abstractmethod
+    async def refresh_user_tokens_if_due(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        tokens: List[RefreshTokenModel]
+    ) -> List[TokenRefreshResult]:
+        """Refresh or rotate the due tokens of one user while holding the user's token refresh lock"""
+        pass
+
+    @abstractmethod
+    async def refresh_token_chain(self, session: AsyncSession, user_id: int, token_type: TokenType) -> bool:
+        """Refresh both access and refresh tokens, returns whether the refresh succeeded"""
         pass
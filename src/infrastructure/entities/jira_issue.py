@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Computed, Index, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Column, DateTime, Field, Relationship, SQLModel
 
 from src.infrastructure.entities.jira_issue_history import JiraIssueHistoryEntity
@@ -11,9 +13,38 @@ if TYPE_CHECKING:
     from src.infrastructure.entities.jira_sprint import JiraSprintEntity
     from src.infrastructure.entities.jira_user import JiraUserEntity
 
+# Full-text search document: summary (weight A) + description không có thẻ HTML (weight B).
+# Dùng cấu hình 'simple' vì nội dung có cả tiếng Việt và tiếng Anh.
+ISSUE_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'A') || "
+    "setweight(to_tsvector('simple', regexp_replace(coalesce(description, ''), '<[^>]+>', ' ', 'g')), 'B')"
+)
+
 
 class JiraIssueEntity(SQLModel, table=True):
     __tablename__ = "jira_issues"
+    __table_args__ = (
+        Index("ix_jira_issues_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_jira_issues_summary_trgm",
+            "summary",
+            postgresql_using="gin",
+            postgresql_ops={"summary": "gin_trgm_ops"}
+        ),
+        # Listing theo project (keyset theo updated_at, id), chỉ các issue chưa xóa
+        Index(
+            "ix_jira_issues_project_key_updated_at_active",
+            "project_key",
+            "updated_at",
+            "id",
+            postgresql_where=text("is_deleted = false")
+        ),
+        Index("ix_jira_issues_project_key", "project_key"),
+        Index("ix_jira_issues_assignee_id", "assignee_id"),
+        Index("ix_jira_issues_story_id", "story_id", postgresql_where=text("story_id IS NOT NULL")),
+    )
+    # search_vector do Postgres tự tính khi ghi, không load vào entity
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     jira_issue_id: str = Field(index=True, unique=True)
@@ -45,7 +76,17 @@ class JiraIssueEntity(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True)),
         default_factory=lambda: datetime.now(timezone.utc)
     )
-    updated_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    # NOT NULL vì là khóa sắp xếp của keyset pagination
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    # Generated column phục vụ full-text search (xem ISSUE_SEARCH_VECTOR_EXPRESSION)
+    search_vector: Optional[str] = Field(
+        default=None,
+        sa_column=Column(TSVECTOR, Computed(ISSUE_SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True)
+    )
 
     project: "JiraProjectEntity" = Relationship(
         back_populates="jira_issues", sa_relationship_kwargs={'lazy': 'selectin'})
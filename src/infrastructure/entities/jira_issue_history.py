@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Column, DateTime, Field, ForeignKey, Relationship, String, Text, UniqueConstraint
+from sqlmodel import Column, DateTime, Field, ForeignKey, Index, Relationship, String, Text, UniqueConstraint
 
 from src.infrastructure.entities.base import BaseEntity
 
@@ -14,7 +14,8 @@ class JiraIssueHistoryEntity(BaseEntity, table=True):
     """Entity để lưu trữ lịch sử thay đổi của Jira issue"""
     __tablename__ = "jira_issue_histories"  # Chú ý tên bảng số nhiều
 
-    id: int = Field(default=None, primary_key=True)
+    # Bảng phân vùng theo tháng trên created_at nên khóa chính gồm cả created_at
+    id: int = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     # Chú ý đây là string, không phải integer
     jira_issue_id: str = Field(
         sa_column=Column(String, ForeignKey("jira_issues.jira_issue_id", name="fk_jira_issues"), nullable=False)
@@ -30,7 +31,7 @@ class JiraIssueHistoryEntity(BaseEntity, table=True):
         sa_column=Column(String, ForeignKey("jira_users.jira_account_id", name="fk_jira_users"), nullable=True)
     )
     jira_change_id: Optional[str] = Field(max_length=100, nullable=False)  # This field is not unique
-    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), default=datetime.now))
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), primary_key=True, default=datetime.now))
 
     # Định nghĩa mối quan hệ với JiraIssueEntity và JiraUserEntity
     issue: Optional["JiraIssueEntity"] = Relationship(
@@ -44,8 +45,17 @@ class JiraIssueHistoryEntity(BaseEntity, table=True):
     )
 
     # Define a unique constraint for jira_change_id and field_name combination
+    # (unique trên bảng phân vùng phải chứa khóa phân vùng created_at)
     __table_args__ = (
-        UniqueConstraint('jira_change_id', 'field_name', name='uq_jira_issue_history_jira_change_id_field_name'),
+        UniqueConstraint(
+            'jira_change_id', 'field_name', 'created_at',
+            name='uq_jira_issue_history_jira_change_id_field_name'
+        ),
+        # get_issue_field_history / get_issues_field_history
+        Index('ix_jira_issue_histories_issue_field_created', 'jira_issue_id', 'field_name', 'created_at'),
+        # get_issue_history (changelog của một issue, có phân trang)
+        Index('ix_jira_issue_histories_issue_created', 'jira_issue_id', 'created_at', 'id'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
     # def __repr__(self):
     #     """String representation of the JiraIssueHistoryEntity"""
@@ -1,10 +1,14 @@
 from datetime import datetime, timezone
 
-from sqlmodel import Column, DateTime, Field, SQLModel
+from sqlmodel import Column, DateTime, Field, Index, SQLModel
 
 
 class JiraIssueSprintEntity(SQLModel, table=True):
     __tablename__ = "jira_issue_sprints"
+    __table_args__ = (
+        # Primary key bắt đầu bằng jira_issue_id, index này phục vụ truy vấn issue theo sprint
+        Index("ix_jira_issue_sprints_sprint_issue", "jira_sprint_id", "jira_issue_id"),
+    )
 
     jira_issue_id: str = Field(foreign_key="jira_issues.jira_issue_id", primary_key=True)
     jira_sprint_id: int = Field(foreign_key="jira_sprints.jira_sprint_id", primary_key=True)
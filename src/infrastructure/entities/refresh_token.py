@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlmodel import Column, DateTime, Field, SQLModel
+from sqlmodel import Column, DateTime, Field, Index, SQLModel
 
 from src.domain.constants.refresh_tokens import TokenType
 
@@ -22,3 +22,8 @@ class RefreshTokenEntity(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True)),
         default_factory=lambda: datetime.now(timezone.utc)
     )
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_expires_at", "expires_at"),
+        Index("ix_refresh_tokens_user_id_token_type_created_at", "user_id", "token_type", "created_at"),
+    )
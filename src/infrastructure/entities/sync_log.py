@@ -1,13 +1,14 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from sqlmodel import JSON, CheckConstraint, Column, DateTime, Field, SQLModel
+from sqlmodel import JSON, CheckConstraint, Column, DateTime, Field, Index, SQLModel
 
 
 class SyncLogEntity(SQLModel, table=True):
     __tablename__ = "sync_logs"
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    # Bảng phân vùng theo tháng trên created_at nên khóa chính gồm cả created_at
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     entity_type: str
     entity_id: str
     operation: str
@@ -27,7 +28,7 @@ class SyncLogEntity(SQLModel, table=True):
 
     # Timestamps
     created_at: datetime = Field(
-        sa_column=Column(DateTime(timezone=True)),
+        sa_column=Column(DateTime(timezone=True), primary_key=True),
         default_factory=lambda: datetime.now(timezone.utc)
     )
     updated_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
@@ -45,4 +46,6 @@ class SyncLogEntity(SQLModel, table=True):
             "source IN ('NATS', 'WEBHOOK', 'MANUAL')",
             name="valid_source"
         ),
+        Index("ix_sync_logs_entity_id_created_at", "entity_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
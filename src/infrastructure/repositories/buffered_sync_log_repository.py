@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.domain.models.database.sync_log import SyncLogDBCreateDTO
+from src.domain.models.sync_log import SyncLogModel
+from src.domain.repositories.sync_log_repository import ISyncLogRepository
+from src.domain.services.sync_log_writer_service import ISyncLogWriterService
+
+
+class BufferedSyncLogRepository(ISyncLogRepository):
+    """Sync log repository that hands new logs to the background writer instead of inserting inline
+
+    The log no longer shares the caller's transaction: it is kept even if the caller rolls back.
+    """
+
+    def __init__(self, sync_log_repository: ISyncLogRepository, sync_log_writer: ISyncLogWriterService):
+        self.sync_log_repository = sync_log_repository
+        self.sync_log_writer = sync_log_writer
+
+    async def create_sync_log(self, session: AsyncSession, sync_log: SyncLogDBCreateDTO) -> Optional[SyncLogModel]:
+        self.sync_log_writer.enqueue(sync_log)
+        return None
+
+    async def create_sync_logs(self, session: AsyncSession, sync_logs: List[SyncLogDBCreateDTO]) -> None:
+        for sync_log in sync_logs:
+            self.sync_log_writer.enqueue(sync_log)
+
+    async def update_sync_log(self, session: AsyncSession, sync_log_id: int, **kwargs) -> None:
+        await self.sync_log_repository.update_sync_log(session, sync_log_id, **kwargs)
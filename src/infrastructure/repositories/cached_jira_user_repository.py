@@ -0,0 +1,198 @@
+import asyncio
+import time
+from typing import Any, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.configs.logger import log
+from src.domain.models.database.jira_user import JiraUserDBCreateDTO, JiraUserDBUpdateDTO
+from src.domain.models.jira_user import JiraUserModel
+from src.domain.repositories.jira_user_repository import IJiraUserRepository
+from src.domain.services.jira_user_identity_map_service import IJiraUserIdentityMapService
+from src.domain.services.redis_service import IRedisService
+
+# Version key tăng mỗi khi một process ghi user, các process khác thấy version đổi sẽ xóa identity map của mình
+IDENTITY_MAP_VERSION_KEY = "jira_user_identity_map:version"
+# Key trong session.info giữ các user đã ghi nhưng chưa commit
+PENDING_USERS_INFO_KEY = "jira_user_identity_map:pending"
+
+
+class CachedJiraUserRepository(IJiraUserRepository):
+    """Jira user repository that serves single-user lookups from the in-process identity map
+
+    Lookups by user_id / jira_account_id read through the identity map; every write goes to
+    the wrapped repository and refreshes the map with the returned user once the caller's
+    transaction commits (a rollback only evicts). After a commit the shared version key in
+    Redis is bumped; every process compares it at most once per ``version_check_interval``
+    and drops its map when another process has written users.
+    """
+
+    def __init__(
+        self,
+        user_repository: IJiraUserRepository,
+        identity_map: IJiraUserIdentityMapService,
+        redis_service: Optional[IRedisService] = None,
+        version_check_interval: float = 1.0
+    ):
+        self.user_repository = user_repository
+        self.identity_map = identity_map
+        self.redis_service = redis_service
+        self.version_check_interval = version_check_interval
+        self._seen_version: Optional[int] = None
+        self._next_version_check = 0.0
+        self._publish_tasks: Set["asyncio.Task[None]"] = set()
+
+    async def create_user(self, session: AsyncSession, user_data: JiraUserDBCreateDTO) -> JiraUserModel:
+        user = await self.user_repository.create_user(session=session, user_data=user_data)
+        self._put_after_commit(session, user)
+        return user
+
+    async def update_user(self, session: AsyncSession, user_id: int, user_data: JiraUserDBUpdateDTO) -> JiraUserModel:
+        try:
+            user = await self.user_repository.update_user(session=session, user_id=user_id, user_data=user_data)
+        finally:
+            self.identity_map.evict(user_id=user_id)
+        self._put_after_commit(session, user)
+        return user
+
+    async def update_user_by_jira_account_id(self, session: AsyncSession, jira_account_id: str, user_data: JiraUserDBUpdateDTO) -> JiraUserModel:
+        try:
+            user = await self.user_repository.update_user_by_jira_account_id(
+                session=session,
+                jira_account_id=jira_account_id,
+                user_data=user_data
+            )
+        finally:
+            self.identity_map.evict(jira_account_id=jira_account_id)
+        self._put_after_commit(session, user)
+        return user
+
+    def _put_after_commit(self, session: AsyncSession, user: JiraUserModel) -> None:
+        """Chỉ đưa user vào identity map sau khi transaction của caller commit"""
+        self.identity_map.evict(user_id=user.user_id, jira_account_id=user.jira_account_id)
+
+        sync_session = session.sync_session
+        if PENDING_USERS_INFO_KEY not in sync_session.info:
+            # Listener sống cùng session, mỗi lần commit/rollback chỉ xử lý các user đang chờ
+            sync_session.info[PENDING_USERS_INFO_KEY] = []
+            event.listen(sync_session, "after_commit", self._on_commit)
+            event.listen(sync_session, "after_rollback", self._on_rollback)
+        sync_session.info[PENDING_USERS_INFO_KEY].append(user)
+
+    def _on_commit(self, sync_session: Session) -> None:
+        users: List[JiraUserModel] = sync_session.info.get(PENDING_USERS_INFO_KEY, [])
+        if not users:
+            return
+        sync_session.info[PENDING_USERS_INFO_KEY] = []
+        self.identity_map.put_many(users)
+        self._schedule_publish_invalidation()
+
+    def _on_rollback(self, sync_session: Session) -> None:
+        users: List[JiraUserModel] = sync_session.info.get(PENDING_USERS_INFO_KEY, [])
+        sync_session.info[PENDING_USERS_INFO_KEY] = []
+        for user in users:
+            self.identity_map.evict(user_id=user.user_id, jira_account_id=user.jira_account_id)
+
+    def _schedule_publish_invalidation(self) -> None:
+        if not self.redis_service:
+            return
+        try:
+            # after_commit chạy đồng bộ bên trong event loop của AsyncSession
+            task = asyncio.get_running_loop().create_task(self._publish_invalidation())
+        except RuntimeError:
+            log.warning("No running event loop, skip publishing user identity map invalidation")
+            return
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    async def _publish_invalidation(self) -> None:
+        """Tăng version key để các process khác xóa identity map"""
+        assert self.redis_service is not None
+        try:
+            version = await self.redis_service.incr(IDENTITY_MAP_VERSION_KEY)
+        except Exception as e:
+            log.warning(f"Error publishing user identity map invalidation: {str(e)}")
+            return
+
+        if self._seen_version is not None and version != self._seen_version + 1:
+            # Process khác cũng đã ghi user kể từ lần kiểm tra trước
+            self.identity_map.clear()
+        self._seen_version = version
+
+    async def _sync_version(self) -> None:
+        """Xóa identity map nếu process khác đã ghi user, kiểm tra tối đa một lần mỗi version_check_interval"""
+        if not self.redis_service:
+            return
+        now = time.monotonic()
+        if now < self._next_version_check:
+            return
+        self._next_version_check = now + self.version_check_interval
+
+        try:
+            value: Any = await self.redis_service.get(IDENTITY_MAP_VERSION_KEY)
+            version = int(value) if value else 0
+        except Exception as e:
+            # Redis lỗi thì chỉ dựa vào TTL của identity map
+            log.warning(f"Error checking user identity map version: {str(e)}")
+            return
+
+        if self._seen_version is not None and version != self._seen_version:
+            log.debug(f"User identity map version changed {self._seen_version} -> {version}, clearing")
+            self.identity_map.clear()
+        self._seen_version = version
+
+    async def get_user_by_id(self, session: AsyncSession, user_id: int) -> Optional[JiraUserModel]:
+        await self._sync_version()
+        cached_user = self.identity_map.get_by_user_id(user_id)
+        if cached_user:
+            return cached_user
+
+        user = await self.user_repository.get_user_by_id(session=session, user_id=user_id)
+        if user:
+            self.identity_map.put(user)
+        return user
+
+    async def get_user_by_jira_account_id(self, session: AsyncSession, jira_account_id: str) -> Optional[JiraUserModel]:
+        await self._sync_version()
+        cached_user = self.identity_map.get_by_jira_account_id(jira_account_id)
+        if cached_user:
+            return cached_user
+
+        user = await self.user_repository.get_user_by_jira_account_id(session=session, jira_account_id=jira_account_id)
+        if user:
+            self.identity_map.put(user)
+        return user
+
+    async def get_users_by_jira_account_ids(self, session: AsyncSession, jira_account_ids: List[str]) -> List[JiraUserModel]:
+        await self._sync_version()
+        users: List[JiraUserModel] = []
+        missing_account_ids: List[str] = []
+        for jira_account_id in dict.fromkeys(jira_account_ids):
+            cached_user = self.identity_map.get_by_jira_account_id(jira_account_id)
+            if cached_user:
+                users.append(cached_user)
+            else:
+                missing_account_ids.append(jira_account_id)
+
+        if missing_account_ids:
+            loaded_users = await self.user_repository.get_users_by_jira_account_ids(
+                session=session,
+                jira_account_ids=missing_account_ids
+            )
+            self.identity_map.put_many(loaded_users)
+            users.extend(loaded_users)
+
+        return users
+
+    async def get_users_by_project(self, session: AsyncSession, project_key: str) -> List[JiraUserModel]:
+        return await self.user_repository.get_users_by_project(session=session, project_key=project_key)
+
+    async def search_users(self, session: AsyncSession, search_term: str) -> List[JiraUserModel]:
+        return await self.user_repository.search_users(session=session, search_term=search_term)
+
+    async def get_all_users(self, session: AsyncSession) -> List[JiraUserModel]:
+        users = await self.user_repository.get_all_users(session=session)
+        self.identity_map.put_many(users)
+        return users
@@ -1,6 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import exists, func
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -11,6 +12,7 @@ from src.domain.repositories.jira_issue_history_repository import IJiraIssueHist
 from src.infrastructure.entities.jira_issue import JiraIssueEntity
 from src.infrastructure.entities.jira_issue_history import JiraIssueHistoryEntity
 from src.infrastructure.entities.jira_issue_sprint import JiraIssueSprintEntity
+from src.infrastructure.entities.jira_user import JiraUserEntity
 
 
 class SQLAlchemyJiraIssueHistoryRepository(IJiraIssueHistoryRepository):
@@ -52,13 +54,25 @@ class SQLAlchemyJiraIssueHistoryRepository(IJiraIssueHistoryRepository):
     async def get_issue_history(
         self,
         session: AsyncSession,
-        jira_issue_id: str
+        jira_issue_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        field_names: Optional[List[str]] = None,
+        with_known_author: bool = False
     ) -> List[JiraIssueHistoryModel]:
-        """Lấy toàn bộ lịch sử thay đổi của một issue"""
+        """Lấy lịch sử thay đổi của một issue (toàn bộ nếu không truyền limit)
+
+        ``field_names`` và ``with_known_author`` lọc trước khi áp dụng offset/limit.
+        """
         try:
             stmt = select(JiraIssueHistoryEntity).where(
-                col(JiraIssueHistoryEntity.jira_issue_id) == jira_issue_id
-            ).order_by(col(JiraIssueHistoryEntity.created_at))
+                *self._issue_history_conditions(jira_issue_id, field_names, with_known_author)
+            ).order_by(col(JiraIssueHistoryEntity.created_at), col(JiraIssueHistoryEntity.id))
+
+            if offset:
+                stmt = stmt.offset(offset)
+            if limit is not None:
+                stmt = stmt.limit(limit)
 
             result = await session.exec(stmt)
             history_items = result.all()
@@ -68,6 +82,40 @@ class SQLAlchemyJiraIssueHistoryRepository(IJiraIssueHistoryRepository):
             log.error(f"Error getting issue history: {str(e)}")
             return []
 
+    async def count_issue_history(
+        self,
+        session: AsyncSession,
+        jira_issue_id: str,
+        field_names: Optional[List[str]] = None,
+        with_known_author: bool = False
+    ) -> int:
+        """Đếm số history event của một issue với cùng bộ lọc như get_issue_history"""
+        try:
+            stmt = select(func.count()).select_from(JiraIssueHistoryEntity).where(
+                *self._issue_history_conditions(jira_issue_id, field_names, with_known_author)
+            )
+            result = await session.exec(stmt)
+            return int(result.one())
+        except Exception as e:
+            log.error(f"Error counting issue history: {str(e)}")
+            return 0
+
+    def _issue_history_conditions(
+        self,
+        jira_issue_id: str,
+        field_names: Optional[List[str]],
+        with_known_author: bool
+    ) -> List[Any]:
+        conditions: List[Any] = [col(JiraIssueHistoryEntity.jira_issue_id) == jira_issue_id]
+        if field_names is not None:
+            conditions.append(col(JiraIssueHistoryEntity.field_name).in_(field_names))
+        if with_known_author:
+            # Chỉ giữ event có tác giả tồn tại trong jira_users
+            conditions.append(
+                exists().where(col(JiraUserEntity.jira_account_id) == col(JiraIssueHistoryEntity.author_id))
+            )
+        return conditions
+
     async def get_issue_field_history(
         self,
         session: AsyncSession,
@@ -126,7 +174,10 @@ class SQLAlchemyJiraIssueHistoryRepository(IJiraIssueHistoryRepository):
                         .where(
                             col(JiraIssueHistoryEntity.jira_issue_id) == event.jira_issue_id,
                             col(JiraIssueHistoryEntity.jira_change_id) == event.jira_change_id,
-                            col(JiraIssueHistoryEntity.field_name) == change.field
+                            col(JiraIssueHistoryEntity.field_name) == change.field,
+                            # Giới hạn created_at để chỉ quét partition của tháng thay đổi
+                            col(JiraIssueHistoryEntity.created_at) >= event.created_at - timedelta(days=1),
+                            col(JiraIssueHistoryEntity.created_at) <= event.created_at + timedelta(days=1)
                         )
                     )
 
@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from sqlalchemy import ColumnElement, func, inspect, tuple_
+from sqlalchemy.orm import Mapped
 from sqlmodel import and_, col, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.configs.logger import log
 from src.domain.constants.jira import JiraIssueStatus, JiraIssueType
+from src.domain.exceptions.pagination_exceptions import InvalidCursorError
 from src.domain.models.database.jira_issue import JiraIssueDBCreateDTO, JiraIssueDBUpdateDTO
 from src.domain.models.jira_issue import JiraIssueModel
 from src.domain.models.jira_sprint import JiraSprintModel
@@ -15,6 +18,8 @@ from src.infrastructure.entities.jira_issue import JiraIssueEntity
 from src.infrastructure.entities.jira_issue_sprint import JiraIssueSprintEntity
 from src.infrastructure.entities.jira_sprint import JiraSprintEntity
 from src.infrastructure.entities.jira_user import JiraUserEntity
+from src.utils.pagination_utils import decode_cursor, encode_cursor
+from src.utils.string_utils import build_prefix_tsquery
 
 
 class SQLAlchemyJiraIssueRepository(IJiraIssueRepository):
@@ -316,74 +321,21 @@ class SQLAlchemyJiraIssueRepository(IJiraIssueRepository):
     ) -> List[JiraIssueModel]:
         """Get project issues with filters"""
         try:
-            # Base query with user join
-            query = (
-                select(JiraIssueEntity)
-                .outerjoin(JiraUserEntity, col(JiraIssueEntity.assignee_id) == col(JiraUserEntity.jira_account_id))
-                .where(col(JiraIssueEntity.project_key) == project_key)
+            query, search_rank = self._build_project_issues_query(
+                project_key=project_key,
+                sprint_id=sprint_id,
+                is_backlog=is_backlog,
+                issue_type=issue_type,
+                search=search,
+                include_deleted=include_deleted
             )
 
-            # Filter out deleted issues unless explicitly requested
-            if not include_deleted:
-                query = query.where(col(JiraIssueEntity.is_deleted) == False)  # noqa: E712
-
-            # Add sprint filter
-            if sprint_id or is_backlog is not None:
-                if sprint_id:
-                    # Join with issue_sprint table to filter by sprint_id
-                    query = query.join(
-                        JiraIssueSprintEntity,
-                        col(JiraIssueEntity.jira_issue_id) == col(JiraIssueSprintEntity.jira_issue_id)
-                    ).join(
-                        JiraSprintEntity,
-                        col(JiraIssueSprintEntity.jira_sprint_id) == col(JiraSprintEntity.jira_sprint_id)
-                    ).where(col(JiraSprintEntity.id) == sprint_id)
-                elif is_backlog:
-                    # Issues with no sprints or all sprints are closed but task is not done yet, are backlog
-                    subquery = select(JiraIssueEntity.jira_issue_id).outerjoin(
-                        JiraIssueSprintEntity,
-                        col(JiraIssueEntity.jira_issue_id) == col(JiraIssueSprintEntity.jira_issue_id)
-                    ).outerjoin(
-                        JiraSprintEntity,
-                        col(JiraIssueSprintEntity.jira_sprint_id) == col(JiraSprintEntity.jira_sprint_id)
-                    ).where(
-                        or_(
-                            # No sprints
-                            col(JiraIssueSprintEntity.jira_sprint_id).is_(None),
-                            # All sprints are closed but task not done
-                            and_(
-                                col(JiraSprintEntity.state).not_in(['active', 'future']),
-                                col(JiraIssueEntity.status) != JiraIssueStatus.DONE.value
-                            )
-                        )
-                    )
-
-                    query = query.where(
-                        col(JiraIssueEntity.jira_issue_id).in_(subquery)
-                    )
-
-            else:
-                log.info("No sprint ID or is_backlog provided")
-                query = query.join(
-                    JiraIssueSprintEntity,
-                    col(JiraIssueEntity.jira_issue_id) == col(JiraIssueSprintEntity.jira_issue_id)
-                )
-            # Add issue type filter
-            if issue_type:
-                query = query.where(col(JiraIssueEntity.type) == issue_type.value)
-
-            # Add search filter
-            if search:
-                search_pattern = f"%{search}%"
-                query = query.where(
-                    (col(JiraIssueEntity.summary).ilike(search_pattern)) |
-                    (col(JiraIssueEntity.description).ilike(search_pattern))
-                )
-
             # Add limit
             query = query.limit(limit)
 
-            # Order by created_at desc to get newest issues first
+            # Khi search thì xếp theo độ liên quan trước, sau đó newest issues first
+            if search_rank is not None:
+                query = query.order_by(search_rank.desc())
             query = query.order_by(col(JiraIssueEntity.created_at).desc())
 
             # Execute query
@@ -397,6 +349,181 @@ class SQLAlchemyJiraIssueRepository(IJiraIssueRepository):
             log.error(f"Error fetching project issues: {str(e)}")
             raise
 
+    async def get_project_issues_page(
+        self,
+        session: AsyncSession,
+        project_key: str,
+        sprint_id: Optional[int] = None,
+        is_backlog: Optional[bool] = None,
+        issue_type: Optional[JiraIssueType] = None,
+        search: Optional[str] = None,
+        include_deleted: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[JiraIssueModel], Optional[str]]:
+        """Get one page of project issues with filters, ordered by (updated_at, id) desc
+
+        Keyset pagination: ``cursor`` is the ``next_cursor`` returned with the previous page,
+        so the cost of a page does not depend on how deep into the list it is. When searching,
+        results are ordered by search rank first and the rank is part of the cursor.
+        """
+        try:
+            query, search_rank = self._build_project_issues_query(
+                project_key=project_key,
+                sprint_id=sprint_id,
+                is_backlog=is_backlog,
+                issue_type=issue_type,
+                search=search,
+                include_deleted=include_deleted
+            )
+
+            # Keyset: (rank,) updated_at, id giảm dần
+            sort_keys: List[Union[ColumnElement[Any], Mapped[Any]]] = [col(JiraIssueEntity.updated_at), col(JiraIssueEntity.id)]
+            if search_rank is not None:
+                sort_keys.insert(0, search_rank)
+                query = query.add_columns(search_rank.label("search_rank"))
+
+            if cursor:
+                query = query.where(tuple_(*sort_keys) < tuple_(*self._decode_issue_cursor(cursor, search_rank is not None)))
+
+            # Lấy dư 1 bản ghi để biết còn trang sau hay không
+            query = query.order_by(*[sort_key.desc() for sort_key in sort_keys]).limit(limit + 1)
+
+            # Execute query
+            result = await session.exec(query)
+            rows = list(result.all())
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+            if search_rank is not None:
+                entities = [row[0] for row in rows]
+                ranks: List[Optional[float]] = [row[1] for row in rows]
+            else:
+                entities = rows
+                ranks = [None] * len(rows)
+
+            next_cursor = None
+            if has_more and entities:
+                next_cursor = self._encode_issue_cursor(entities[-1], ranks[-1])
+
+            # Convert to domain models with user info
+            return [self._to_domain(entity) for entity in entities], next_cursor
+
+        except Exception as e:
+            log.error(f"Error fetching project issues: {str(e)}")
+            raise
+
+    def _encode_issue_cursor(self, entity: JiraIssueEntity, rank: Optional[float]) -> str:
+        """Encode keyset values of the last issue in a page"""
+        values: Dict[str, Any] = {"updated_at": entity.updated_at.isoformat(), "id": entity.id}
+        if rank is not None:
+            values["rank"] = rank
+        return encode_cursor(values)
+
+    def _decode_issue_cursor(self, cursor: str, with_rank: bool) -> List[Any]:
+        """Decode cursor into keyset values in sort order"""
+        values = decode_cursor(cursor)
+        try:
+            keyset: List[Any] = [datetime.fromisoformat(values["updated_at"]), int(values["id"])]
+            if with_rank:
+                keyset.insert(0, float(values["rank"]))
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+        return keyset
+
+    def _build_project_issues_query(
+        self,
+        project_key: str,
+        sprint_id: Optional[int],
+        is_backlog: Optional[bool],
+        issue_type: Optional[JiraIssueType],
+        search: Optional[str],
+        include_deleted: bool
+    ) -> Tuple[Any, Optional[ColumnElement[float]]]:
+        """Build the filtered project issues query, returns (query, search rank expression)"""
+        # Base query with user join
+        query = (
+            select(JiraIssueEntity)
+            .outerjoin(JiraUserEntity, col(JiraIssueEntity.assignee_id) == col(JiraUserEntity.jira_account_id))
+            .where(col(JiraIssueEntity.project_key) == project_key)
+        )
+
+        # Filter out deleted issues unless explicitly requested
+        if not include_deleted:
+            query = query.where(col(JiraIssueEntity.is_deleted) == False)  # noqa: E712
+
+        # Add sprint filter
+        if sprint_id or is_backlog is not None:
+            if sprint_id:
+                # Join with issue_sprint table to filter by sprint_id
+                query = query.join(
+                    JiraIssueSprintEntity,
+                    col(JiraIssueEntity.jira_issue_id) == col(JiraIssueSprintEntity.jira_issue_id)
+                ).join(
+                    JiraSprintEntity,
+                    col(JiraIssueSprintEntity.jira_sprint_id) == col(JiraSprintEntity.jira_sprint_id)
+                ).where(col(JiraSprintEntity.id) == sprint_id)
+            elif is_backlog:
+                # Issues with no sprints or all sprints are closed but task is not done yet, are backlog
+                subquery = select(JiraIssueEntity.jira_issue_id).outerjoin(
+                    JiraIssueSprintEntity,
+                    col(JiraIssueEntity.jira_issue_id) == col(JiraIssueSprintEntity.jira_issue_id)
+                ).outerjoin(
+                    JiraSprintEntity,
+                    col(JiraIssueSprintEntity.jira_sprint_id) == col(JiraSprintEntity.jira_sprint_id)
+                ).where(
+                    or_(
+                        # No sprints
+                        col(JiraIssueSprintEntity.jira_sprint_id).is_(None),
+                        # All sprints are closed but task not done
+                        and_(
+                            col(JiraSprintEntity.state).not_in(['active', 'future']),
+                            col(JiraIssueEntity.status) != JiraIssueStatus.DONE.value
+                        )
+                    )
+                )
+
+                query = query.where(
+                    col(JiraIssueEntity.jira_issue_id).in_(subquery)
+                )
+
+        else:
+            log.info("No sprint ID or is_backlog provided")
+            query = query.join(
+                JiraIssueSprintEntity,
+                col(JiraIssueEntity.jira_issue_id) == col(JiraIssueSprintEntity.jira_issue_id)
+            )
+        # Add issue type filter
+        if issue_type:
+            query = query.where(col(JiraIssueEntity.type) == issue_type.value)
+
+        # Add search filter (full-text trên search_vector + trigram trên summary, đều có GIN index)
+        search_rank = None
+        if search:
+            search_condition, search_rank = self._build_search_filter(search)
+            query = query.where(search_condition)
+
+        return query, search_rank
+
+    def _build_search_filter(self, search: str) -> Tuple[ColumnElement[bool], Optional[ColumnElement[float]]]:
+        """Build search condition and rank expression for issue search
+
+        - search_vector (generated tsvector của summary + description) khớp prefix từng từ: 'log err' -> 'log:* & err:*'
+        - summary ILIKE '%term%' dùng trigram index để vẫn tìm được chuỗi nằm giữa từ
+        """
+        search_vector = inspect(JiraIssueEntity).local_table.c.search_vector
+        summary_condition = col(JiraIssueEntity.summary).ilike(f"%{search}%")
+
+        prefix_query = build_prefix_tsquery(search)
+        if not prefix_query:
+            return summary_condition, None
+
+        ts_query = func.to_tsquery("simple", prefix_query)
+        search_condition = or_(search_vector.op("@@")(ts_query), summary_condition)
+        search_rank = func.ts_rank(search_vector, ts_query)
+        return search_condition, search_rank
+
     async def get_by_jira_issue_key(self, session: AsyncSession, jira_issue_key: str) -> Optional[JiraIssueModel]:
         """Get issue by key from database"""
         query = select(JiraIssueEntity).where(col(JiraIssueEntity.key) == jira_issue_key)
@@ -407,7 +534,8 @@ class SQLAlchemyJiraIssueRepository(IJiraIssueRepository):
     async def update_by_key(self, session: AsyncSession, jira_issue_key: str, issue_update: JiraIssueDBUpdateDTO) -> JiraIssueModel:
         """Update issue by key"""
         log.info(f"[REPOSITORY] Updating issue with key {jira_issue_key}")
-        log.debug(f"[REPOSITORY] Update data: {issue_update.model_dump(exclude_none=True)}")
+        # lazy: chỉ dump model khi mức DEBUG đang bật
+        log.opt(lazy=True).debug("[REPOSITORY] Update data: {}", lambda: issue_update.model_dump(exclude_none=True))
 
         query = select(JiraIssueEntity).where(col(JiraIssueEntity.key) == jira_issue_key)
         result = await session.exec(query)
@@ -173,6 +173,22 @@ class SQLAlchemyJiraUserRepository(IJiraUserRepository):
             log.error(f"Error getting user by account ID: {str(e)}")
             return None
 
+    async def get_users_by_jira_account_ids(self, session: AsyncSession, jira_account_ids: List[str]) -> List[JiraUserModel]:
+        """Get users by Jira account IDs in a single query"""
+        if not jira_account_ids:
+            return []
+
+        try:
+            result = await session.exec(
+                select(JiraUserEntity).where(col(JiraUserEntity.jira_account_id).in_(set(jira_account_ids)))
+            )
+            user_entities = result.all()
+
+            return [JiraUserModel.model_validate(user) for user in user_entities]
+        except Exception as e:
+            log.error(f"Error getting users by account IDs: {str(e)}")
+            return []
+
     async def get_users_by_project(self, session: AsyncSession, project_key: str) -> List[JiraUserModel]:
         """Get users associated with a project"""
         try:
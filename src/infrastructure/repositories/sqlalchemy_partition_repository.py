@@ -0,0 +1,65 @@
+from datetime import date, datetime
+import re
+from typing import Dict
+
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.configs.logger import log
+from src.domain.repositories.partition_repository import IPartitionRepository
+
+GET_PARTITIONS_QUERY = text("""
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = to_regclass(:table)
+""")
+
+
+class SQLAlchemyPartitionRepository(IPartitionRepository):
+    """Monthly partitions named ``<table>_pYYYYMM`` with UTC month bounds, plus ``<table>_default``"""
+
+    def __init__(self):
+        pass
+
+    async def set_lock_timeout(self, session: AsyncSession, seconds: int) -> None:
+        # DDL trên partition khóa cả bảng cha: không để ghi sync_logs / history xếp hàng sau job
+        await session.exec(text(f"SET LOCAL lock_timeout = '{int(seconds)}s'"))  # type: ignore
+
+    async def get_monthly_partitions(self, session: AsyncSession, table: str) -> Dict[date, str]:
+        result = await session.exec(GET_PARTITIONS_QUERY.bindparams(table=table))  # type: ignore
+        pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+
+        partitions: Dict[date, str] = {}
+        for (name,) in result.all():
+            match = pattern.match(name)
+            if match:
+                partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+        return partitions
+
+    async def create_monthly_partition(self, session: AsyncSession, table: str, month: date) -> str:
+        name = f"{table}_p{month:%Y%m}"
+        next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        await session.exec(text(  # type: ignore
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{next_month.isoformat()} 00:00:00+00')"
+        ))
+        log.info(f"Created partition {name}")
+        return name
+
+    async def drop_partition(self, session: AsyncSession, table: str, partition: str) -> None:
+        await session.exec(text(f'DROP TABLE IF EXISTS "{partition}"'))  # type: ignore
+        log.info(f"Dropped partition {partition} of {table}")
+
+    async def archive_partition(self, session: AsyncSession, table: str, partition: str, archive_schema: str) -> None:
+        await session.exec(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))  # type: ignore
+        await session.exec(text(f'ALTER TABLE "{table}" DETACH PARTITION "{partition}"'))  # type: ignore
+        await session.exec(text(f'ALTER TABLE "{partition}" SET SCHEMA "{archive_schema}"'))  # type: ignore
+        log.info(f"Archived partition {partition} of {table} to schema {archive_schema}")
+
+    async def delete_default_partition_rows(self, session: AsyncSession, table: str, created_before: datetime) -> int:
+        stmt = text(f'DELETE FROM "{table}_default" WHERE created_at < :created_before').bindparams(
+            created_before=created_before
+        )
+        result = await session.exec(stmt)  # type: ignore
+        return result.rowcount or 0
@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
+from sqlalchemy import exists
+from sqlalchemy.orm import aliased
 from sqlmodel import and_, col, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -88,6 +90,28 @@ class SQLAlchemyRefreshTokenRepository(IRefreshTokenRepository):
         db_token = result.first()
         return self._to_domain(db_token) if db_token else None
 
+    async def get_latest_tokens_expiring_before(self, session: AsyncSession, expires_before: datetime) -> List[RefreshTokenModel]:
+        """Get the latest token of each user and token type that expires before the given time"""
+        expires_before_utc = expires_before.astimezone(timezone.utc).replace(tzinfo=None)
+        newer_token = aliased(RefreshTokenEntity)
+        # Token cũ hơn của cùng user / token type bị loại bằng NOT EXISTS (dùng index user_id, token_type, created_at)
+        has_newer_token = exists().where(
+            and_(
+                col(newer_token.user_id) == col(RefreshTokenEntity.user_id),
+                col(newer_token.token_type) == col(RefreshTokenEntity.token_type),
+                col(newer_token.created_at) > col(RefreshTokenEntity.created_at)
+            )
+        )
+        result = await session.exec(
+            select(RefreshTokenEntity).where(
+                and_(
+                    col(RefreshTokenEntity.expires_at) <= expires_before_utc,
+                    ~has_newer_token
+                )
+            ).order_by(col(RefreshTokenEntity.expires_at))
+        )
+        return [self._to_domain(db_token) for db_token in result.all()]
+
     async def revoke_tokens_by_user_and_type(self, session: AsyncSession, user_id: int, token_type: TokenType) -> None:
         """Revoke all tokens of a specific type for a user"""
         stmt = (
@@ -1,3 +1,7 @@
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import insert
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.domain.models.database.sync_log import SyncLogDBCreateDTO
@@ -33,5 +37,28 @@ class SQLAlchemySyncLogRepository(ISyncLogRepository):
 
         return SyncLogModel.from_entity(sync_log_entity)
 
+    async def create_sync_logs(self, session: AsyncSession, sync_logs: List[SyncLogDBCreateDTO]) -> None:
+        """Insert multiple sync logs in one multi-row INSERT, without loading them back"""
+        if not sync_logs:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "entity_type": sync_log.entity_type,
+                "entity_id": sync_log.entity_id,
+                "operation": sync_log.operation,
+                "request_payload": sync_log.request_payload,
+                "response_status": sync_log.response_status,
+                "response_body": sync_log.response_body,
+                "source": sync_log.source,
+                "sender": sync_log.sender,
+                "error_message": sync_log.error_message,
+                "created_at": sync_log.created_at or now,
+            }
+            for sync_log in sync_logs
+        ]
+        await session.exec(insert(SyncLogEntity).values(rows))  # type: ignore
+
     async def update_sync_log(self, session: AsyncSession, sync_log_id: int, **kwargs) -> None:
         pass
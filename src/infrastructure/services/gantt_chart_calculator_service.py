@@ -2,6 +2,7 @@ from datetime import datetime, time, timedelta
 from typing import Dict, List, Tuple
 
 from src.configs.logger import log
+from src.configs.metrics import timed_computation
 from src.domain.models.gantt_chart import (
     GanttChartConnectionModel,
     GanttChartJiraIssueModel,
@@ -14,6 +15,7 @@ from src.domain.services.gantt_chart_calculator_service import IGanttChartCalcul
 class GanttChartCalculatorService(IGanttChartCalculatorService):
     """Service for calculating Gantt chart schedule"""
 
+    @timed_computation("gantt.calculate_schedule")
     async def calculate_schedule(
         self,
         sprint_start_date: datetime,
@@ -0,0 +1,72 @@
+from typing import Dict, Optional
+
+from src.configs.logger import log
+from src.domain.services.jira_board_cache_service import IJiraBoardCacheService
+from src.domain.services.redis_service import IRedisService
+
+
+class JiraBoardCacheService(IJiraBoardCacheService):
+    """Redis-backed cache of the sprint -> board and board -> project key mappings
+
+    A sprint never leaves its origin board and boards are rarely moved to another project,
+    so entries are kept for ``ttl`` seconds (a week by default). They are written by the
+    project sync and by sprint webhooks after looking the mapping up in Jira.
+    """
+
+    def __init__(self, redis_service: IRedisService, ttl: int = 7 * 24 * 3600):
+        self.redis_service = redis_service
+        self.ttl = ttl
+
+    def _get_sprint_key(self, sprint_id: int) -> str:
+        return f"jira_sprint_board:{sprint_id}"
+
+    def _get_board_key(self, board_id: int) -> str:
+        return f"jira_board_project:{board_id}"
+
+    async def get_sprint_board_id(self, sprint_id: int) -> Optional[int]:
+        """Get the cached board ID of a sprint, None if not cached"""
+        try:
+            cached = await self.redis_service.get(self._get_sprint_key(sprint_id))
+            return int(cached) if cached else None
+        except Exception as e:
+            # Cache lỗi thì fallback về gọi Jira API
+            log.warning(f"Error reading cached board of sprint {sprint_id}: {str(e)}")
+            return None
+
+    async def get_board_project_key(self, board_id: int) -> Optional[str]:
+        """Get the cached project key of a board, None if not cached"""
+        try:
+            return await self.redis_service.get(self._get_board_key(board_id))
+        except Exception as e:
+            log.warning(f"Error reading cached project of board {board_id}: {str(e)}")
+            return None
+
+    async def get_project_key_for_sprint(self, sprint_id: int) -> Optional[str]:
+        """Get the project key of a sprint through its cached board, None if either is not cached"""
+        board_id = await self.get_sprint_board_id(sprint_id)
+        if board_id is None:
+            return None
+        return await self.get_board_project_key(board_id)
+
+    async def set_sprint_board(self, sprint_id: int, board_id: int) -> None:
+        """Cache the board ID of a sprint"""
+        try:
+            await self.redis_service.set(self._get_sprint_key(sprint_id), str(board_id), self.ttl)
+        except Exception as e:
+            log.warning(f"Error caching board of sprint {sprint_id}: {str(e)}")
+
+    async def set_board_project(self, board_id: int, project_key: str) -> None:
+        """Cache the project key of a board"""
+        try:
+            await self.redis_service.set(self._get_board_key(board_id), project_key, self.ttl)
+        except Exception as e:
+            log.warning(f"Error caching project of board {board_id}: {str(e)}")
+
+    async def set_project_sprints(self, project_key: str, sprint_boards: Dict[int, int]) -> None:
+        """Cache {sprint_id: board_id} of a project and the project key of those boards"""
+        values = {self._get_sprint_key(sprint_id): str(board_id) for sprint_id, board_id in sprint_boards.items()}
+        values.update({self._get_board_key(board_id): project_key for board_id in set(sprint_boards.values())})
+        try:
+            await self.redis_service.set_many(values, self.ttl)
+        except Exception as e:
+            log.warning(f"Error caching sprints and boards of project {project_key}: {str(e)}")
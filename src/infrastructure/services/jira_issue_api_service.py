@@ -1,10 +1,11 @@
 
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.configs.logger import log
+from src.configs.logger import log, truncated
 from src.domain.constants.jira import JiraIssueStatus, JiraIssueType
 from src.domain.exceptions.jira_exceptions import JiraRequestError
 from src.domain.models.jira.apis.mappers.jira_issue import JiraIssueMapper
@@ -17,7 +18,9 @@ from src.domain.models.jira.apis.responses.jira_changelog import (
 )
 from src.domain.models.jira.apis.responses.jira_issue import (
     JiraIssueAPIGetResponseDTO,
+    JiraIssueBulkCreateAPIResponseDTO,
     JiraIssueBulkFetchAPIGetResponseDTO,
+    JiraIssueCreateAPIResponseDTO,
 )
 from src.domain.models.jira.apis.responses.jira_issue_comment import JiraIssueCommentAPIGetResponseDTO
 from src.domain.models.jira.apis.responses.jira_issue_link import JiraIssueLinksResponseDTO
@@ -26,6 +29,7 @@ from src.domain.models.jira_issue_comment import JiraIssueCommentModel
 from src.domain.models.jira_issue_link import JiraIssueLinkModel
 from src.domain.repositories.jira_user_repository import IJiraUserRepository
 from src.domain.services.jira_issue_api_service import IJiraIssueAPIService
+from src.domain.services.jira_transition_cache_service import IJiraTransitionCacheService
 from src.infrastructure.services.jira_service import JiraAPIClient
 from src.utils.jira_utils import convert_html_to_adf
 
@@ -37,13 +41,20 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         self,
         client: JiraAPIClient,
         user_repository: IJiraUserRepository,
-        admin_client: Optional[JiraAPIClient] = None  # Thêm admin client
+        admin_client: Optional[JiraAPIClient] = None,  # Thêm admin client
+        transition_cache: Optional[IJiraTransitionCacheService] = None
     ):
         self.client = client
         self.user_repository = user_repository
         self.admin_client = admin_client
+        self.transition_cache = transition_cache
         self.retry_attempts = 3
         self.retry_delay = 1  # seconds
+        # Jira Cloud limits for bulk endpoints
+        self.bulk_create_chunk_size = 50
+        self.bulk_fetch_chunk_size = 100
+        # Max concurrent transition calls after a bulk create
+        self.bulk_transition_concurrency = 5
 
     async def get_issue_with_admin_auth(self, issue_id: str) -> Optional[JiraIssueModel]:
         """Get issue using admin auth"""
@@ -117,7 +128,7 @@ class JiraIssueAPIService(IJiraIssueAPIService):
                     error_msg=f"Error fetching issue {issue_id}"
                 )
 
-                log.debug(f"Response data when get issue: {response_data}")
+                log.debug("Response data when get issue: {}", truncated(response_data))
 
                 # Map response to domain model
                 issue: JiraIssueModel = await self.client.map_to_domain(
@@ -146,11 +157,67 @@ class JiraIssueAPIService(IJiraIssueAPIService):
 
         return None
 
-    async def create_issue(self, session: AsyncSession, user_id: int, issue_data: JiraIssueAPICreateRequestDTO) -> JiraIssueModel:
-        """Create new issue in Jira"""
+    async def create_issue(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        issue_data: JiraIssueAPICreateRequestDTO,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
+        """Create new issue in Jira
+
+        With ``lightweight`` the result is built from the request payload and the create
+        response instead of being read back from Jira; the issue webhook that follows
+        brings the local copy up to date.
+        """
         log.debug(f"Creating issue with data: {issue_data}")
 
         # Prepare payload
+        payload = await self._build_create_issue_payload(session=session, issue_data=issue_data)
+
+        log.debug("Creating issue with payload: {}", truncated(payload))
+        response_data = await self.client.post(
+            session=session,
+            endpoint="/rest/api/3/issue",
+            user_id=user_id,
+            data=payload,
+            error_msg="Error when creating issue"
+        )
+
+        # Handle error
+        if response_data.get("errorMessages"):
+            log.error(f"Error when creating issue: {response_data.get('errorMessages')}")
+            raise Exception(f"Error when creating issue: {response_data.get('errorMessages')}")
+
+        created = JiraIssueCreateAPIResponseDTO.model_validate(response_data)
+        created_issue_id: str = created.id
+
+        # Handle initial status if specified
+        transitioned = False
+        if issue_data.status:
+            log.debug(f"Setting initial status to {issue_data.status}")
+            transitioned = await self.transition_issue(
+                session=session,
+                user_id=user_id,
+                issue_id=created_issue_id,
+                status=issue_data.status,
+                lightweight=lightweight
+            )
+
+        if lightweight:
+            return self._build_issue_from_create_payload(issue_data, payload, created, transitioned)
+
+        # Get new created issue
+        created_issue = await self.get_issue(session=session, user_id=user_id, issue_id=created_issue_id)
+
+        if created_issue:
+            return created_issue
+        else:
+            log.error(f"Failed to get issue {created_issue_id} after create")
+            raise Exception(f"Failed to get issue {created_issue_id} after create")
+
+    async def _build_create_issue_payload(self, session: AsyncSession, issue_data: JiraIssueAPICreateRequestDTO) -> Dict[str, Any]:
+        """Build the Jira create payload (``{"fields": {...}}``) for an issue"""
         payload: Dict[str, Any] = {
             "fields": {
                 "project": {"key": issue_data.project_key},
@@ -179,35 +246,7 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         if issue_data.estimate_point is not None:
             payload["fields"]["customfield_10016"] = issue_data.estimate_point
 
-        log.debug(f"Creating issue with payload: {payload}")
-        response_data = await self.client.post(
-            session=session,
-            endpoint="/rest/api/3/issue",
-            user_id=user_id,
-            data=payload,
-            error_msg="Error when creating issue"
-        )
-
-        # Handle error
-        if response_data.get("errorMessages"):
-            log.error(f"Error when creating issue: {response_data.get('errorMessages')}")
-            raise Exception(f"Error when creating issue: {response_data.get('errorMessages')}")
-
-        # Get new created issue
-        created_issue_id: str = response_data.get("id")
-        created_issue = await self.get_issue(session=session, user_id=user_id, issue_id=created_issue_id)
-
-        # Handle initial status if specified
-        if issue_data.status:
-            log.debug(f"Setting initial status to {issue_data.status}")
-            await self.transition_issue(session=session, user_id=user_id, issue_id=created_issue_id, status=issue_data.status)
-            created_issue = await self.get_issue(session=session, user_id=user_id, issue_id=created_issue_id)
-
-        if created_issue:
-            return created_issue
-        else:
-            log.error(f"Failed to get issue {created_issue_id} after create")
-            raise Exception(f"Failed to get issue {created_issue_id} after create")
+        return payload
 
     def _get_issue_type_payload(self, issue_type: Union[JiraIssueType, str, None]) -> Dict[str, Any]:
         """Get issue type payload for Jira API"""
@@ -230,8 +269,20 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Using name
         return {"name": converted_issue_type.value}
 
-    async def update_issue(self, session: AsyncSession, user_id: int, issue_id: str, update: JiraIssueAPIUpdateRequestDTO) -> JiraIssueModel:
-        """Update issue in Jira"""
+    async def update_issue(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        issue_id: str,
+        update: JiraIssueAPIUpdateRequestDTO,
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
+        """Update issue in Jira
+
+        With ``lightweight`` and a known ``current_issue`` the result is built by applying the
+        update to ``current_issue`` instead of reading the issue back from Jira.
+        """
         # Prepare payload for fields
         payload: Dict[str, Any] = {"fields": {}}
 
@@ -258,7 +309,7 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         if update.estimate_point is not None:
             payload["fields"]["customfield_10016"] = update.estimate_point
 
-        log.debug(f"Updating issue {issue_id} with payload: {payload}")
+        log.debug("Updating issue {} with payload: {}", issue_id, truncated(payload))
 
         # Only send request if there is a field to update
         if payload["fields"]:
@@ -279,7 +330,14 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Update status if provided
         if status_to_update is not None:
             log.debug(f"Attempting to update status to {status_to_update}")
-            status_success = await self.transition_issue(session=session, user_id=user_id, issue_id=issue_id, status=status_to_update)
+            status_success = await self.transition_issue(
+                session=session,
+                user_id=user_id,
+                issue_id=issue_id,
+                status=status_to_update,
+                current_issue=current_issue,
+                lightweight=lightweight
+            )
             if status_success:
                 update_result["messages"].append(f"Successfully transitioned to {status_to_update}")
             else:
@@ -289,6 +347,9 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Log kết quả cập nhật
         log.debug(f"Update result for issue {issue_id}: {update_result}")
 
+        if lightweight and current_issue and self._can_skip_update_read_back(update, payload, update_result):
+            return self._build_issue_from_update_payload(current_issue, payload, status_to_update)
+
         # Return issue after update
         updated_issue = await self.get_issue(session=session, user_id=user_id, issue_id=issue_id)
         if updated_issue:
@@ -345,7 +406,15 @@ class JiraIssueAPIService(IJiraIssueAPIService):
 
         return response_data.get("transitions", [])
 
-    async def transition_issue(self, session: AsyncSession, user_id: int, issue_id: str, status: Union[JiraIssueStatus, str]) -> bool:
+    async def transition_issue(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        issue_id: str,
+        status: Union[JiraIssueStatus, str],
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> bool:
         """Chuyển trạng thái của issue
 
         Args:
@@ -353,6 +422,8 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             user_id: ID của người dùng thực hiện hành động
             issue_id: ID của issue cần chuyển trạng thái
             status: Trạng thái mới (JiraIssueStatus enum hoặc string)
+            current_issue: Trạng thái hiện tại của issue (nếu có), dùng để tra transition ID từ cache
+            lightweight: Không đọc lại issue để kiểm tra trạng thái sau khi transition
 
         Returns:
             True nếu chuyển trạng thái thành công, False nếu không
@@ -370,64 +441,77 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Lấy giá trị chuỗi của status để sử dụng trong so sánh
         status_value = status_enum.value
 
-        # 1. Lấy danh sách transitions có thể thực hiện
-        log.debug(f"Getting transitions for issue {issue_id}")
-        transitions = await self.get_issue_transitions(session=session, user_id=user_id, issue_id=issue_id)
-
-        # 2. Tìm transition ID tương ứng với status mong muốn
-        transition_id = None
-        matching_transitions = []
+        # 0. Thử dùng transition ID đã cache để bỏ qua bước lấy danh sách transitions
+        cache_context = self._get_transition_cache_context(current_issue)
+        transition_id = await self._get_cached_transition_id(cache_context, status_value)
+        transitioned = False
+        if cache_context and transition_id:
+            try:
+                log.debug(f"Transitioning issue {issue_id} to {status_value} using cached transition ID {transition_id}")
+                await self.client.post(
+                    session=session,
+                    endpoint=f"/rest/api/3/issue/{issue_id}/transitions",
+                    user_id=user_id,
+                    data={"transition": {"id": transition_id}},
+                    error_msg=f"Error when transitioning issue {issue_id} to {status_value}"
+                )
+                transitioned = True
+            except JiraRequestError as e:
+                # Transition ID không còn hợp lệ (workflow đã thay đổi hoặc status trong DB đã cũ) -> xoá cache và thử lại một lần
+                log.warning(f"Cached transition {transition_id} rejected for issue {issue_id}: {str(e)}")
+                await self._invalidate_cached_transitions(cache_context)
+                transition_id = None
+
+        if not transitioned:
+            # 1. Lấy danh sách transitions có thể thực hiện
+            log.debug(f"Getting transitions for issue {issue_id}")
+            if self.transition_cache:
+                transitions, fetched_context = await self._get_transitions_with_cache_context(
+                    client=self.client, session=session, user_id=user_id, issue_id=issue_id
+                )
+                await self._cache_transitions(fetched_context, transitions)
+            else:
+                transitions = await self.get_issue_transitions(session=session, user_id=user_id, issue_id=issue_id)
 
-        # Log tất cả transitions có sẵn để debug
-        for t in transitions:
-            to_name = t.get('to', {}).get('name')
-            transition_name = t.get('name')
-            transition_id_str = t.get('id')
+            # 2. Tìm transition ID tương ứng với status mong muốn
+            transition_id = self._find_transition_id(transitions, status_value)
 
-            log.debug(f"Available transition: {transition_id_str} - {transition_name} -> {to_name}")
+            # 3. Nếu không tìm thấy transition phù hợp
+            if not transition_id:
+                log.warning(f"No transition found for status {status_value} of issue {issue_id}")
 
-            # So sánh cả name và to.name với status value
-            if (transition_name == status_value or to_name == status_value):
-                matching_transitions.append(t)
-                break
-
-        if matching_transitions:
-            # Lấy transition đầu tiên khớp
-            transition_id = matching_transitions[0].get('id')
-            log.debug(f"Found matching transition: {transition_id} for status {status_value}")
-
-        # 3. Nếu không tìm thấy transition phù hợp
-        if not transition_id:
-            log.warning(f"No transition found for status {status_value} of issue {issue_id}")
-
-            # 3.1. Kiểm tra xem issue có đã ở trạng thái mong muốn chưa
-            current_issue = await self.get_issue(session=session, user_id=user_id, issue_id=issue_id)
-            if not current_issue:
-                log.error(f"Issue {issue_id} not found")
-                return False
+                # 3.1. Kiểm tra xem issue có đã ở trạng thái mong muốn chưa
+                current_issue = await self.get_issue(session=session, user_id=user_id, issue_id=issue_id)
+                if not current_issue:
+                    log.error(f"Issue {issue_id} not found")
+                    return False
 
-            current_status_value = current_issue.status.value
-            log.debug(f"Current status of issue {issue_id} is {current_status_value}, wanted {status_value}")
+                current_status_value = current_issue.status.value
+                log.debug(f"Current status of issue {issue_id} is {current_status_value}, wanted {status_value}")
 
-            if current_issue.status == status_enum or current_status_value == status_value:
-                log.debug(f"Issue {issue_id} is already in status {status_value}")
-                return True
+                if current_issue.status == status_enum or current_status_value == status_value:
+                    log.debug(f"Issue {issue_id} is already in status {status_value}")
+                    return True
 
-            log.error(f"Cannot transition issue {issue_id} from {current_status_value} to {status_value}")
-            return False
+                log.error(f"Cannot transition issue {issue_id} from {current_status_value} to {status_value}")
+                return False
 
         # 4. Thực hiện transition nếu tìm thấy ID phù hợp
         try:
-            log.debug(f"Transitioning issue {issue_id} to {status_value} using transition ID {transition_id}")
-            await self.client.post(
-                session=session,
-                endpoint=f"/rest/api/3/issue/{issue_id}/transitions",
-                user_id=user_id,
-                data={"transition": {"id": transition_id}},
-                error_msg=f"Error when transitioning issue {issue_id} to {status_value}"
-            )
+            if not transitioned:
+                log.debug(f"Transitioning issue {issue_id} to {status_value} using transition ID {transition_id}")
+                await self.client.post(
+                    session=session,
+                    endpoint=f"/rest/api/3/issue/{issue_id}/transitions",
+                    user_id=user_id,
+                    data={"transition": {"id": transition_id}},
+                    error_msg=f"Error when transitioning issue {issue_id} to {status_value}"
+                )
+
+            # 5. Kiểm tra lại trạng thái sau khi transition (bỏ qua ở chế độ lightweight)
+            if lightweight:
+                return True
 
-            # 5. Kiểm tra lại trạng thái sau khi transition
             updated_issue = await self.get_issue(session=session, user_id=user_id, issue_id=issue_id)
             log.debug(f"After transition, issue {issue_id} is in status {updated_issue.status.value}")
 
@@ -437,6 +521,90 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             log.error(f"Error transitioning issue {issue_id} to {status_value}: {str(e)}")
             return False
 
+    def _find_transition_id(self, transitions: List[Dict[str, Any]], status_value: str) -> Optional[str]:
+        """Tìm transition ID đầu tiên có name hoặc to.name khớp với status mong muốn"""
+        for t in transitions:
+            to_name = t.get('to', {}).get('name')
+            transition_name = t.get('name')
+            transition_id_str = t.get('id')
+
+            log.debug(f"Available transition: {transition_id_str} - {transition_name} -> {to_name}")
+
+            # So sánh cả name và to.name với status value
+            if (transition_name == status_value or to_name == status_value):
+                log.debug(f"Found matching transition: {transition_id_str} for status {status_value}")
+                return transition_id_str
+
+        return None
+
+    async def _get_transitions_with_cache_context(
+        self,
+        client: JiraAPIClient,
+        session: Optional[AsyncSession],
+        user_id: Optional[int],
+        issue_id: str
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, str, str]]]:
+        """Lấy danh sách transitions cùng key cache dựng từ trạng thái thực tế của issue trên Jira
+
+        Status trong DB có thể đã cũ, nên transitions chỉ được cache theo status mà Jira trả về
+        cùng lúc với danh sách transitions (một request duy nhất với ``expand=transitions``).
+        """
+        response_data = await client.get(
+            session=session,
+            endpoint=f"/rest/api/3/issue/{issue_id}",
+            user_id=user_id,
+            params={"fields": "project,issuetype,status", "expand": "transitions"},
+            error_msg=f"Error when getting list of transitions for issue {issue_id}"
+        )
+
+        transitions: List[Dict[str, Any]] = response_data.get("transitions", [])
+        fields: Dict[str, Any] = response_data.get("fields") or {}
+        project_key = (fields.get("project") or {}).get("key")
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        from_status = (fields.get("status") or {}).get("name")
+        if not project_key or not issue_type or not from_status:
+            return transitions, None
+        return transitions, (project_key, issue_type, from_status)
+
+    def _get_transition_cache_context(self, current_issue: Optional[JiraIssueModel]) -> Optional[Tuple[str, str, str]]:
+        """Lấy key (project_key, issue_type, from_status) để tra transition cache, None nếu không dùng được cache
+
+        Key này chỉ dùng để đọc cache: transition ID lấy từ status cũ sẽ bị Jira từ chối, còn việc ghi
+        cache luôn dùng key từ ``_get_transitions_with_cache_context``.
+        """
+        if not self.transition_cache or not current_issue or not current_issue.project_key:
+            return None
+        return current_issue.project_key, current_issue.type.value, current_issue.status.value
+
+    async def _get_cached_transition_id(self, cache_context: Optional[Tuple[str, str, str]], status_value: str) -> Optional[str]:
+        """Lấy transition ID từ cache"""
+        if not cache_context or not self.transition_cache:
+            return None
+        project_key, issue_type, from_status = cache_context
+        return await self.transition_cache.get_transition_id(project_key, issue_type, from_status, status_value)
+
+    async def _cache_transitions(self, cache_context: Optional[Tuple[str, str, str]], transitions: List[Dict[str, Any]]) -> None:
+        """Lưu mapping {target_status: transition_id} vào cache theo thứ tự ưu tiên của _find_transition_id"""
+        if not cache_context or not self.transition_cache or not transitions:
+            return
+        mapping: Dict[str, str] = {}
+        for t in transitions:
+            transition_id = t.get('id')
+            if not transition_id:
+                continue
+            for name in (t.get('name'), t.get('to', {}).get('name')):
+                if name:
+                    mapping.setdefault(name, transition_id)
+        project_key, issue_type, from_status = cache_context
+        await self.transition_cache.set_transitions(project_key, issue_type, from_status, mapping)
+
+    async def _invalidate_cached_transitions(self, cache_context: Optional[Tuple[str, str, str]]) -> None:
+        """Xoá transitions đã cache"""
+        if not cache_context or not self.transition_cache:
+            return
+        project_key, issue_type, from_status = cache_context
+        await self.transition_cache.invalidate(project_key, issue_type, from_status)
+
     def _get_intermediate_statuses(self, current_status: JiraIssueStatus, target_status: JiraIssueStatus) -> List[JiraIssueStatus]:
         """Lấy danh sách các trạng thái trung gian để chuyển từ current_status -> target_status
 
@@ -496,6 +664,72 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             ]
         }
 
+    def _build_issue_from_create_payload(
+        self,
+        issue_data: JiraIssueAPICreateRequestDTO,
+        payload: Dict[str, Any],
+        created: JiraIssueCreateAPIResponseDTO,
+        transitioned: bool
+    ) -> JiraIssueModel:
+        """Dựng JiraIssueModel từ payload tạo issue và response (id, key, self) mà không gọi lại Jira"""
+        fields: Dict[str, Any] = payload["fields"]
+        now = datetime.now(timezone.utc)
+
+        issue_type = JiraIssueType(fields["issuetype"]["name"])
+        status = JiraIssueStatus(issue_data.status) if issue_data.status and transitioned else JiraIssueStatus.TO_DO
+
+        return JiraIssueModel(
+            jira_issue_id=created.id,
+            key=created.key,
+            project_key=issue_data.project_key,
+            summary=issue_data.summary,
+            description=JiraIssueMapper.convert_adf_to_html(fields.get("description")),
+            type=issue_type,
+            status=status,
+            assignee_id=fields.get("assignee", {}).get("id"),
+            estimate_point=issue_data.estimate_point or 0,
+            created_at=now,
+            updated_at=now,
+            last_synced_at=now,
+            link_url=JiraIssueMapper.build_link_url(issue_data.project_key, issue_data.board_id, created.key)
+        )
+
+    def _can_skip_update_read_back(
+        self,
+        update: JiraIssueAPIUpdateRequestDTO,
+        payload: Dict[str, Any],
+        update_result: Dict[str, Any]
+    ) -> bool:
+        """Kiểm tra có thể dựng kết quả update từ payload thay vì đọc lại issue từ Jira hay không"""
+        # Sprint chỉ có ID, không dựng lại được JiraSprintModel -> vẫn đọc lại từ Jira
+        sprint_changed = update.sprint_id is not None or "customfield_10020" in payload["fields"]
+        return bool(update_result["success"]) and not sprint_changed
+
+    def _build_issue_from_update_payload(
+        self,
+        current_issue: JiraIssueModel,
+        payload: Dict[str, Any],
+        status: Optional[Union[JiraIssueStatus, str]]
+    ) -> JiraIssueModel:
+        """Áp dụng payload update (và status mới) lên issue hiện tại mà không gọi lại Jira"""
+        fields: Dict[str, Any] = payload["fields"]
+        now = datetime.now(timezone.utc)
+
+        changes: Dict[str, Any] = {"updated_at": now, "last_synced_at": now}
+        if "summary" in fields:
+            changes["summary"] = fields["summary"]
+        if "description" in fields:
+            changes["description"] = JiraIssueMapper.convert_adf_to_html(fields["description"])
+        if "assignee" in fields:
+            changes["assignee_id"] = fields["assignee"]["id"]
+            changes["assignee"] = None
+        if "customfield_10016" in fields:
+            changes["estimate_point"] = fields["customfield_10016"]
+        if status is not None:
+            changes["status"] = JiraIssueStatus(status)
+
+        return current_issue.model_copy(update=changes)
+
     async def create_issue_link(self, session: AsyncSession, user_id: int, source_issue_id: str, target_issue_id: str, relationship: str) -> bool:
         """Create link between two issues in Jira
 
@@ -622,43 +856,25 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             # Trả về DTO rỗng
             return JiraIssueChangelogAPIGetResponseDTO(values=[], startAt=0, maxResults=0, total=0, isLast=True)
 
-    async def create_issue_with_admin_auth(self, session: AsyncSession, issue_data: JiraIssueAPICreateRequestDTO) -> JiraIssueModel:
-        """Create new issue in Jira using admin auth"""
+    async def create_issue_with_admin_auth(
+        self,
+        session: AsyncSession,
+        issue_data: JiraIssueAPICreateRequestDTO,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
+        """Create new issue in Jira using admin auth
+
+        See ``create_issue`` for ``lightweight``.
+        """
         log.debug(f"Creating issue with admin auth: {issue_data}")
 
         # Sử dụng admin client
         client_to_use = self.admin_client or self.client
 
         # Prepare payload
-        payload = {
-            "fields": {
-                "project": {"key": issue_data.project_key},
-                "summary": issue_data.summary,
-                "issuetype": self._get_issue_type_payload(issue_data.type),
-            }
-        }
-
-        # Add description if available
-        if issue_data.description:
-            payload["fields"]["description"] = self._text_to_adf(issue_data.description)
-
-        # Add sprint if available
-        if issue_data.sprint_id:
-            # Jira expects customfield_10020 as a value of 1 active sprint
-            payload["fields"]["customfield_10020"] = issue_data.sprint_id
-            log.debug(f"Adding issue to sprints: {issue_data.sprint_id}")
-
-        # Add optional fields
-        if issue_data.assignee_id:
-            log.debug(f"Updating assignee_id: {issue_data.assignee_id}")
-            jira_user = await self.user_repository.get_user_by_id(session=session, user_id=int(issue_data.assignee_id))
-            if jira_user and jira_user.jira_account_id:
-                payload["fields"]["assignee"] = {"id": jira_user.jira_account_id}
+        payload = await self._build_create_issue_payload(session=session, issue_data=issue_data)
 
-        if issue_data.estimate_point is not None:
-            payload["fields"]["customfield_10016"] = issue_data.estimate_point
-
-        log.debug(f"Creating issue with admin auth and payload: {payload}")
+        log.debug("Creating issue with admin auth and payload: {}", truncated(payload))
         response_data = await client_to_use.post(
             session=None,
             endpoint="/rest/api/3/issue",
@@ -672,15 +888,24 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             log.error(f"Error when creating issue: {response_data.get('errorMessages')}")
             raise Exception(f"Error when creating issue: {response_data.get('errorMessages')}")
 
-        # Get new created issue
-        created_issue_id: str = response_data.get("id")
-        created_issue = await self.get_issue_with_admin_auth(created_issue_id)
+        created = JiraIssueCreateAPIResponseDTO.model_validate(response_data)
+        created_issue_id: str = created.id
 
         # Handle initial status if specified
+        transitioned = False
         if issue_data.status:
             log.debug(f"Setting initial status to {issue_data.status}")
-            await self.transition_issue_with_admin_auth(created_issue_id, issue_data.status)
-            created_issue = await self.get_issue_with_admin_auth(created_issue_id)
+            transitioned = await self.transition_issue_with_admin_auth(
+                created_issue_id,
+                issue_data.status,
+                lightweight=lightweight
+            )
+
+        if lightweight:
+            return self._build_issue_from_create_payload(issue_data, payload, created, transitioned)
+
+        # Get new created issue
+        created_issue = await self.get_issue_with_admin_auth(created_issue_id)
 
         if created_issue:
             return created_issue
@@ -688,8 +913,135 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             log.error(f"Failed to get issue {created_issue_id} after create")
             raise Exception(f"Failed to get issue {created_issue_id} after create")
 
-    async def update_issue_with_admin_auth(self, session: AsyncSession, issue_id: str, update: JiraIssueAPIUpdateRequestDTO) -> JiraIssueModel:
-        """Update issue in Jira using admin auth"""
+    async def bulk_create_issues_with_admin_auth(
+        self,
+        session: AsyncSession,
+        issues_data: List[JiraIssueAPICreateRequestDTO],
+        lightweight: bool = False
+    ) -> List[Optional[JiraIssueModel]]:
+        """Create multiple issues in Jira using admin auth
+
+        Issues are sent to ``/rest/api/3/issue/bulk`` in chunks of ``bulk_create_chunk_size``,
+        initial statuses are applied concurrently and the created issues are read back with
+        a single bulk fetch instead of one GET per issue.
+
+        Args:
+            session: AsyncSession, used to resolve assignees
+            issues_data: Issues to create
+            lightweight: Skip the bulk fetch and build the results from the payloads (see ``create_issue``)
+
+        Returns:
+            List aligned with ``issues_data``; an item is None when its issue could not be created.
+            Issues that were created but could not be transitioned or read back are still returned.
+        """
+        client_to_use = self.admin_client or self.client
+        created_issues: List[Optional[JiraIssueCreateAPIResponseDTO]] = [None] * len(issues_data)
+        # Kết quả tạo của từng issue, None khi issue không được tạo
+        created: Optional[JiraIssueCreateAPIResponseDTO]
+        payloads: List[Dict[str, Any]] = []
+
+        # Dựng toàn bộ payload trước khi gửi request đầu tiên, tránh lỗi giữa chừng khi đã có issue được tạo
+        for issue_data in issues_data:
+            payloads.append(await self._build_create_issue_payload(session=session, issue_data=issue_data))
+
+        for chunk_start in range(0, len(issues_data), self.bulk_create_chunk_size):
+            chunk = issues_data[chunk_start:chunk_start + self.bulk_create_chunk_size]
+            issue_updates = payloads[chunk_start:chunk_start + self.bulk_create_chunk_size]
+
+            log.debug(f"Bulk creating {len(issue_updates)} issues with admin auth")
+            try:
+                response_data = await client_to_use.post(
+                    session=None,
+                    endpoint="/rest/api/3/issue/bulk",
+                    user_id=None,  # Không cần user_id
+                    data={"issueUpdates": issue_updates},
+                    error_msg="Error when bulk creating issues"
+                )
+            except Exception as e:
+                # Jira trả về 400 khi không có issue nào trong chunk được tạo; các chunk đã tạo vẫn được giữ lại
+                log.error(f"Error when bulk creating issues {chunk_start}-{chunk_start + len(chunk) - 1}: {str(e)}")
+                continue
+
+            bulk_response = JiraIssueBulkCreateAPIResponseDTO.model_validate(response_data)
+
+            # Jira chỉ trả về các issue tạo thành công, theo thứ tự của request
+            failed_elements = {error.failed_element_number for error in bulk_response.errors}
+            for error in bulk_response.errors:
+                log.error(f"Error when creating issue #{chunk_start + error.failed_element_number}: {error.element_errors}")
+
+            succeeded_positions = [i for i in range(len(chunk)) if i not in failed_elements]
+            for position, created in zip(succeeded_positions, bulk_response.issues, strict=False):
+                created_issues[chunk_start + position] = created
+
+        created_issue_ids: List[Optional[str]] = [created.id if created else None for created in created_issues]
+
+        # Handle initial status if specified
+        semaphore = asyncio.Semaphore(self.bulk_transition_concurrency)
+
+        async def _transition(issue_id: Optional[str], status: Union[JiraIssueStatus, str, None]) -> bool:
+            if not issue_id or not status:
+                return False
+            async with semaphore:
+                return await self.transition_issue_with_admin_auth(issue_id, status, lightweight=lightweight)
+
+        # Issue đã được tạo trong Jira, lỗi khi transition một issue không được làm mất các issue còn lại
+        transition_results = await asyncio.gather(*[
+            _transition(issue_id, issue_data.status)
+            for issue_id, issue_data in zip(created_issue_ids, issues_data, strict=True)
+        ], return_exceptions=True)
+
+        transitioned: List[bool] = []
+        for issue_id, transition_result in zip(created_issue_ids, transition_results, strict=True):
+            if isinstance(transition_result, BaseException):
+                log.error(f"Error setting initial status of issue {issue_id}: {str(transition_result)}")
+                transitioned.append(False)
+            else:
+                transitioned.append(transition_result)
+
+        fetched_by_id: Dict[str, JiraIssueModel] = {}
+        if not lightweight:
+            # Read back all created issues at once
+            ids_to_fetch = [issue_id for issue_id in created_issue_ids if issue_id]
+            try:
+                fetched_issues = await self._bulk_fetch_issues_with_admin_auth(ids_to_fetch, expand=["renderedFields"])
+                for fetched_issue in fetched_issues:
+                    # Mapper bỏ qua các issue type không hỗ trợ (Epic, Sub-task)
+                    mapped_issue = JiraIssueMapper.to_domain(fetched_issue)
+                    if mapped_issue:
+                        fetched_by_id[mapped_issue.jira_issue_id] = mapped_issue
+            except Exception as e:
+                log.error(f"Error reading back created issues {ids_to_fetch}: {str(e)}")
+
+        # Luôn trả về các issue đã tạo; nếu không đọc lại được thì dựng từ payload
+        results: List[Optional[JiraIssueModel]] = []
+        for issue_data, payload, created, issue_transitioned in zip(
+            issues_data, payloads, created_issues, transitioned, strict=True
+        ):
+            if not created:
+                results.append(None)
+                continue
+
+            created_issue = fetched_by_id.get(created.id)
+            if not created_issue:
+                if not lightweight:
+                    log.warning(f"Failed to get issue {created.id} after create, building it from the create payload")
+                created_issue = self._build_issue_from_create_payload(issue_data, payload, created, issue_transitioned)
+            results.append(created_issue)
+
+        return results
+
+    async def update_issue_with_admin_auth(
+        self,
+        session: AsyncSession,
+        issue_id: str,
+        update: JiraIssueAPIUpdateRequestDTO,
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> JiraIssueModel:
+        """Update issue in Jira using admin auth
+
+        See ``update_issue`` for ``current_issue`` and ``lightweight``.
+        """
         # Sử dụng admin client
         client_to_use = self.admin_client or self.client
 
@@ -722,7 +1074,7 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         if update.sprint_id is not None:
             payload["fields"]["customfield_10020"] = update.sprint_id
 
-        log.debug(f"Updating issue {issue_id} with admin auth, payload: {payload}")
+        log.debug("Updating issue {} with admin auth, payload: {}", issue_id, truncated(payload))
 
         # Only send request if there is a field to update
         if payload["fields"]:
@@ -743,7 +1095,12 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Update status if provided
         if status_to_update is not None:
             log.debug(f"Attempting to update status to {status_to_update}")
-            status_success = await self.transition_issue_with_admin_auth(issue_id, status_to_update)
+            status_success = await self.transition_issue_with_admin_auth(
+                issue_id,
+                status_to_update,
+                current_issue=current_issue,
+                lightweight=lightweight
+            )
             if status_success:
                 update_result["messages"].append(f"Successfully transitioned to {status_to_update}")
             else:
@@ -753,6 +1110,9 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Log kết quả cập nhật
         log.debug(f"Update result for issue {issue_id}: {update_result}")
 
+        if lightweight and current_issue and self._can_skip_update_read_back(update, payload, update_result):
+            return self._build_issue_from_update_payload(current_issue, payload, status_to_update)
+
         # Return issue after update
         updated_issue = await self.get_issue_with_admin_auth(issue_id)
         if updated_issue:
@@ -798,8 +1158,21 @@ class JiraIssueAPIService(IJiraIssueAPIService):
             log.error(f"Error creating issue link: {str(e)}")
             return False
 
-    async def transition_issue_with_admin_auth(self, issue_id: str, status: Union[JiraIssueStatus, str]) -> bool:
-        """Chuyển trạng thái của issue sử dụng admin auth"""
+    async def transition_issue_with_admin_auth(
+        self,
+        issue_id: str,
+        status: Union[JiraIssueStatus, str],
+        current_issue: Optional[JiraIssueModel] = None,
+        lightweight: bool = False
+    ) -> bool:
+        """Chuyển trạng thái của issue sử dụng admin auth
+
+        Args:
+            issue_id: ID hoặc key của issue cần chuyển trạng thái
+            status: Trạng thái mới (JiraIssueStatus enum hoặc string)
+            current_issue: Trạng thái hiện tại của issue (nếu có), dùng để tra transition ID từ cache
+            lightweight: Không đọc lại issue để kiểm tra trạng thái sau khi transition
+        """
         # Sử dụng admin client
         client_to_use = self.admin_client or self.client
 
@@ -816,65 +1189,79 @@ class JiraIssueAPIService(IJiraIssueAPIService):
         # Lấy giá trị chuỗi của status để sử dụng trong so sánh
         status_value = status_enum.value
 
-        # 1. Lấy danh sách transitions có thể thực hiện
-        log.debug(f"Getting transitions for issue {issue_id} with admin auth")
-        transitions = await self.get_issue_transitions_with_admin_auth(issue_id)
-
-        # 2. Tìm transition ID tương ứng với status mong muốn
-        transition_id = None
-        matching_transitions = []
+        # 0. Thử dùng transition ID đã cache để bỏ qua bước lấy danh sách transitions
+        cache_context = self._get_transition_cache_context(current_issue)
+        transition_id = await self._get_cached_transition_id(cache_context, status_value)
+        transitioned = False
+        if cache_context and transition_id:
+            try:
+                log.debug(
+                    f"Transitioning issue {issue_id} to {status_value} using cached transition ID {transition_id} with admin auth")
+                await client_to_use.post(
+                    session=None,
+                    endpoint=f"/rest/api/3/issue/{issue_id}/transitions",
+                    user_id=None,  # Không cần user_id
+                    data={"transition": {"id": transition_id}},
+                    error_msg=f"Error when transitioning issue {issue_id} to {status_value}"
+                )
+                transitioned = True
+            except JiraRequestError as e:
+                # Transition ID không còn hợp lệ (workflow đã thay đổi hoặc status trong DB đã cũ) -> xoá cache và thử lại một lần
+                log.warning(f"Cached transition {transition_id} rejected for issue {issue_id}: {str(e)}")
+                await self._invalidate_cached_transitions(cache_context)
+                transition_id = None
+
+        if not transitioned:
+            # 1. Lấy danh sách transitions có thể thực hiện
+            log.debug(f"Getting transitions for issue {issue_id} with admin auth")
+            if self.transition_cache:
+                transitions, fetched_context = await self._get_transitions_with_cache_context(
+                    client=client_to_use, session=None, user_id=None, issue_id=issue_id
+                )
+                await self._cache_transitions(fetched_context, transitions)
+            else:
+                transitions = await self.get_issue_transitions_with_admin_auth(issue_id)
 
-        # Log tất cả transitions có sẵn để debug
-        for t in transitions:
-            to_name = t.get('to', {}).get('name')
-            transition_name = t.get('name')
-            transition_id_str = t.get('id')
+            # 2. Tìm transition ID tương ứng với status mong muốn
+            transition_id = self._find_transition_id(transitions, status_value)
 
-            log.debug(f"Available transition: {transition_id_str} - {transition_name} -> {to_name}")
+            # 3. Nếu không tìm thấy transition phù hợp
+            if not transition_id:
+                log.warning(f"No transition found for status {status_value} of issue {issue_id}")
 
-            # So sánh cả name và to.name với status value
-            if (transition_name == status_value or to_name == status_value):
-                matching_transitions.append(t)
-                break
-
-        if matching_transitions:
-            # Lấy transition đầu tiên khớp
-            transition_id = matching_transitions[0].get('id')
-            log.debug(f"Found matching transition: {transition_id} for status {status_value}")
-
-        # 3. Nếu không tìm thấy transition phù hợp
-        if not transition_id:
-            log.warning(f"No transition found for status {status_value} of issue {issue_id}")
-
-            # 3.1. Kiểm tra xem issue có đã ở trạng thái mong muốn chưa
-            current_issue = await self.get_issue_with_admin_auth(issue_id)
-            if not current_issue:
-                log.error(f"Issue {issue_id} not found")
-                return False
+                # 3.1. Kiểm tra xem issue có đã ở trạng thái mong muốn chưa
+                current_issue = await self.get_issue_with_admin_auth(issue_id)
+                if not current_issue:
+                    log.error(f"Issue {issue_id} not found")
+                    return False
 
-            current_status_value = current_issue.status.value
-            log.debug(f"Current status of issue {issue_id} is {current_status_value}, wanted {status_value}")
+                current_status_value = current_issue.status.value
+                log.debug(f"Current status of issue {issue_id} is {current_status_value}, wanted {status_value}")
 
-            if current_issue.status == status_enum or current_status_value == status_value:
-                log.debug(f"Issue {issue_id} is already in status {status_value}")
-                return True
+                if current_issue.status == status_enum or current_status_value == status_value:
+                    log.debug(f"Issue {issue_id} is already in status {status_value}")
+                    return True
 
-            log.error(f"Cannot transition issue {issue_id} from {current_status_value} to {status_value}")
-            return False
+                log.error(f"Cannot transition issue {issue_id} from {current_status_value} to {status_value}")
+                return False
 
         # 4. Thực hiện transition nếu tìm thấy ID phù hợp
         try:
-            log.debug(
-                f"Transitioning issue {issue_id} to {status_value} using transition ID {transition_id} with admin auth")
-            await client_to_use.post(
-                session=None,
-                endpoint=f"/rest/api/3/issue/{issue_id}/transitions",
-                user_id=None,  # Không cần user_id
-                data={"transition": {"id": transition_id}},
-                error_msg=f"Error when transitioning issue {issue_id} to {status_value}"
-            )
+            if not transitioned:
+                log.debug(
+                    f"Transitioning issue {issue_id} to {status_value} using transition ID {transition_id} with admin auth")
+                await client_to_use.post(
+                    session=None,
+                    endpoint=f"/rest/api/3/issue/{issue_id}/transitions",
+                    user_id=None,  # Không cần user_id
+                    data={"transition": {"id": transition_id}},
+                    error_msg=f"Error when transitioning issue {issue_id} to {status_value}"
+                )
+
+            # 5. Kiểm tra lại trạng thái sau khi transition (bỏ qua ở chế độ lightweight)
+            if lightweight:
+                return True
 
-            # 5. Kiểm tra lại trạng thái sau khi transition
             updated_issue = await self.get_issue_with_admin_auth(issue_id)
             log.debug(f"After transition, issue {issue_id} is in status {updated_issue.status.value}")
 
@@ -934,18 +1321,36 @@ class JiraIssueAPIService(IJiraIssueAPIService):
 
     async def bulk_get_issues_with_admin_auth(self, issue_ids: List[str]) -> List[JiraIssueModel]:
         """Bulk get issues with admin auth"""
+        issues = await self._bulk_fetch_issues_with_admin_auth(issue_ids)
+        return [JiraIssueMapper.to_domain(issue) for issue in issues]
+
+    async def _bulk_fetch_issues_with_admin_auth(
+        self,
+        issue_ids: List[str],
+        expand: Optional[List[str]] = None
+    ) -> List[JiraIssueAPIGetResponseDTO]:
+        """Gọi /rest/api/3/issue/bulkfetch theo từng chunk ``bulk_fetch_chunk_size`` issue"""
         client_to_use = self.admin_client or self.client
 
-        response_data = await client_to_use.post(
-            session=None,
-            endpoint="/rest/api/3/issue/bulkfetch",
-            user_id=None,  # Không cần user_id
-            data={"issueIdsOrKeys": issue_ids},
-            error_msg=f"Error when getting issues {issue_ids}"
-        )
+        result: List[JiraIssueAPIGetResponseDTO] = []
+        for chunk_start in range(0, len(issue_ids), self.bulk_fetch_chunk_size):
+            chunk = issue_ids[chunk_start:chunk_start + self.bulk_fetch_chunk_size]
+            data: Dict[str, Any] = {"issueIdsOrKeys": chunk}
+            if expand:
+                data["expand"] = expand
+
+            response_data = await client_to_use.post(
+                session=None,
+                endpoint="/rest/api/3/issue/bulkfetch",
+                user_id=None,  # Không cần user_id
+                data=data,
+                error_msg=f"Error when getting issues {chunk}"
+            )
+
+            issues = JiraIssueBulkFetchAPIGetResponseDTO.model_validate(response_data)
+            result.extend(issues.issues)
 
-        issues = JiraIssueBulkFetchAPIGetResponseDTO.model_validate(response_data)
-        return [JiraIssueMapper.to_domain(issue) for issue in issues.issues]
+        return result
 
     async def update_issue_assignee_with_admin_auth(self, issue_key: str, assignee_account_id: str) -> bool:
         """Update the assignee of a Jira issue
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -45,6 +45,30 @@ class JiraIssueDatabaseService(IJiraIssueDatabaseService):
             limit=limit
         )
 
+    async def get_project_issues_page(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        project_key: str,
+        sprint_id: Optional[int] = None,
+        is_backlog: Optional[bool] = None,
+        issue_type: Optional[JiraIssueType] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[JiraIssueModel], Optional[str]]:
+        """Get one page of project issues from database with filters"""
+        return await self.issue_repository.get_project_issues_page(
+            session,
+            project_key=project_key,
+            sprint_id=sprint_id,
+            is_backlog=is_backlog,
+            issue_type=issue_type,
+            search=search,
+            limit=limit,
+            cursor=cursor
+        )
+
     async def get_issue_by_key(self, session: AsyncSession, issue_key: str) -> Optional[JiraIssueModel]:
         """Get issue by key from database"""
         return await self.issue_repository.get_by_jira_issue_key(session, issue_key)
@@ -19,10 +19,39 @@ class JiraIssueHistoryDatabaseService(IJiraIssueHistoryDatabaseService):
     async def get_issue_history(
         self,
         session: AsyncSession,
-        jira_issue_id: str
+        jira_issue_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        field_names: Optional[List[str]] = None,
+        with_known_author: bool = False
     ) -> List[JiraIssueHistoryModel]:
-        """Lấy toàn bộ lịch sử thay đổi của một issue"""
-        return await self.history_repository.get_issue_history(session, jira_issue_id)
+        """Lấy lịch sử thay đổi của một issue (toàn bộ nếu không truyền limit)
+
+        ``field_names`` và ``with_known_author`` lọc trước khi áp dụng offset/limit.
+        """
+        return await self.history_repository.get_issue_history(
+            session,
+            jira_issue_id,
+            limit=limit,
+            offset=offset,
+            field_names=field_names,
+            with_known_author=with_known_author
+        )
+
+    async def count_issue_history(
+        self,
+        session: AsyncSession,
+        jira_issue_id: str,
+        field_names: Optional[List[str]] = None,
+        with_known_author: bool = False
+    ) -> int:
+        """Đếm số history event của một issue với cùng bộ lọc như get_issue_history"""
+        return await self.history_repository.count_issue_history(
+            session,
+            jira_issue_id,
+            field_names=field_names,
+            with_known_author=with_known_author
+        )
 
     async def get_issue_field_history(
         self,
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Tuple
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.configs.logger import log
+from src.configs.metrics import timed_computation
 from src.domain.constants.jira import JiraIssueStatus, JiraIssueType
 from src.domain.models.jira_issue import JiraIssueModel
 from src.domain.models.jira_issue_history import JiraIssueHistoryModel
@@ -32,6 +33,7 @@ class JiraPerformanceSummaryService(IJiraPerformanceSummaryService):
         self.jira_issue_history_db_service = jira_issue_history_db_service
         self.jira_user_db_service = jira_user_db_service
 
+    @timed_computation("analytics.user_performance_summary")
     async def get_user_performance_summary(
         self,
         session: AsyncSession,
@@ -1,14 +1,23 @@
 import asyncio
 import base64
+import copy
+from dataclasses import dataclass
 import json
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import time
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
 
 import aiohttp
+from opentelemetry.trace import SpanKind
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.configs.http_transport import HTTPTransport, HTTPTransportResponse, get_http_transport, request_key
 from src.configs.logger import log
+from src.configs.metrics import JIRA_REQUEST_RETRIES, JIRA_REQUESTS_COALESCED, endpoint_template, observe_jira_request
+from src.configs.resource_pools import acquire_resource
 from src.configs.settings import settings
-from src.domain.constants.refresh_tokens import TokenType
+from src.configs.tracing import tracer
+from src.domain.constants.refresh_tokens import JIRA_TOKEN_REFRESH_LOCK_KEY, TokenType
+from src.domain.constants.resource_pools import ResourceKind
 from src.domain.exceptions.jira_exceptions import JiraAuthenticationError, JiraConnectionError, JiraRequestError
 from src.domain.services.redis_service import IRedisService
 from src.domain.services.token_scheduler_service import ITokenSchedulerService
@@ -18,53 +27,159 @@ T = TypeVar('T')  # Domain model
 U = TypeVar('U')  # API response model
 
 
+@dataclass
+class _InFlightGet:
+    """A Jira GET being sent and the number of other callers waiting for it"""
+    task: "asyncio.Task[Dict[str, Any]]"
+    # JiraAPIClient._get_generation khi request bắt đầu
+    generation: int
+    followers: int = 0
+
+
 class JiraAPIClient:
     """Common client to interact with Jira API"""
 
+    # Dùng chung giữa các instance trong process (client được tạo theo từng request):
+    # user_id -> (access token, thời điểm hết hạn theo time.monotonic())
+    _token_cache: ClassVar[Dict[int, Tuple[str, float]]] = {}
+    _refresh_locks: ClassVar[Dict[int, asyncio.Lock]] = {}
+    # GET đang chạy theo key (auth + URL + params)
+    _inflight_gets: ClassVar[Dict[str, _InFlightGet]] = {}
+    # key -> (thời điểm hết hạn theo time.monotonic(), response), bật bằng JIRA_GET_CACHE_TTL_SECONDS
+    _get_cache: ClassVar[Dict[str, Tuple[float, Dict[str, Any]]]] = {}
+    # Tăng sau mỗi lần ghi lên Jira; GET bắt đầu trước đó không được cache response
+    _get_generation: ClassVar[int] = 0
+
     def __init__(
         self,
         redis_service: IRedisService,
         token_scheduler_service: ITokenSchedulerService,
         timeout: int = 30,
         max_retries: int = 3,
-        use_admin_auth: bool = False  # Thêm flag cho admin auth
+        use_admin_auth: bool = False,  # Thêm flag cho admin auth
+        transport: Optional[HTTPTransport] = None
     ):
         self.redis_service = redis_service
         self.token_scheduler_service = token_scheduler_service
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = timeout
+        # Mặc định theo HTTP_TRANSPORT_MODE: gọi Jira thật, ghi lại hoặc replay từ cassette
+        self.transport = transport or get_http_transport("jira")
         self.max_retries = max_retries
         self.base_url = settings.JIRA_BASE_URL
         self.use_admin_auth = use_admin_auth
 
     async def _get_token(self, session: AsyncSession, user_id: int) -> str:
-        """Get Jira token from cache or refresh"""
-        # Try to get token from cache first
-        token = await self.redis_service.get_cached_jira_token(user_id)
+        """Get Jira token from in-process cache, Redis or refresh"""
+        token = self._get_local_token(user_id)
         if token:
-            # Chỉ kiểm tra token refresh định kỳ, không phải mỗi lần request API
-            # Sử dụng một key cache riêng để theo dõi thời điểm kiểm tra cuối cùng
-            last_check_key = f"jira_token_last_check:{user_id}"
-            last_check = await self.redis_service.get(last_check_key)
-
-            # Nếu chưa từng kiểm tra hoặc đã 10 phút từ lần kiểm tra cuối cùng
-            if not last_check:
-                # Schedule token refresh check
-                await self.token_scheduler_service.schedule_token_refresh(session=session, user_id=user_id)
-                # Cập nhật thời điểm kiểm tra, hết hạn sau 10 phút
-                await self.redis_service.set(last_check_key, "1", 600)  # 600 seconds = 10 minutes
+            return token
+
+        # Đọc token và mốc kiểm tra refresh trong một round-trip
+        token, checked_recently = await self.redis_service.get_cached_jira_token_with_last_check(user_id)
+        if token:
+            # Chỉ kiểm tra token refresh định kỳ (10 phút), không phải mỗi lần request API
+            if not checked_recently:
+                await self._schedule_token_refresh(session=session, user_id=user_id)
 
+            self._cache_local_token(user_id, token)
             return token
 
         # If not in cache, using refresh token to get new access token
-        await self.token_scheduler_service.refresh_token_chain(session=session, user_id=user_id, token_type=TokenType.JIRA)
-
-        # Try to get token from cache again
-        token = await self.redis_service.get_cached_jira_token(user_id)
+        token = await self._refresh_token_single_flight(session=session, user_id=user_id)
         if token:
             return token
 
         raise JiraAuthenticationError("Cannot get Jira token")
 
+    async def _schedule_token_refresh(self, session: AsyncSession, user_id: int) -> None:
+        """Run the periodic refresh check once per user across requests and replicas"""
+        refresh_lock = self._get_refresh_lock(user_id)
+        if refresh_lock.locked():
+            # Request khác trong process đang kiểm tra / refresh token của user này
+            return
+
+        async with refresh_lock:
+            lock_key = JIRA_TOKEN_REFRESH_LOCK_KEY.format(user_id=user_id)
+            owner_token = await self.redis_service.acquire_lock(lock_key, settings.JIRA_TOKEN_REFRESH_LOCK_TTL_SECONDS)
+            if owner_token is None:
+                # Replica khác đang xử lý
+                return
+
+            try:
+                await self.token_scheduler_service.schedule_token_refresh(session=session, user_id=user_id)
+                # Cập nhật thời điểm kiểm tra, hết hạn sau 10 phút
+                await self.redis_service.mark_jira_token_checked(user_id, 600)
+            finally:
+                await self.redis_service.release_lock(lock_key, owner_token)
+
+    async def _refresh_token_single_flight(self, session: AsyncSession, user_id: int) -> str:
+        """Refresh the Jira token of a user once, no matter how many requests miss the cache
+
+        Concurrent callers in this process wait on a local lock, other replicas wait on a
+        Redis lock; whoever gets the lock refreshes and the others read the new token.
+        """
+        async with self._get_refresh_lock(user_id):
+            # Request khác có thể đã refresh xong trong lúc chờ lock
+            token = self._get_local_token(user_id) or await self.redis_service.get_cached_jira_token(user_id)
+            if token:
+                self._cache_local_token(user_id, token)
+                return token
+
+            lock_key = JIRA_TOKEN_REFRESH_LOCK_KEY.format(user_id=user_id)
+            lock_ttl = settings.JIRA_TOKEN_REFRESH_LOCK_TTL_SECONDS
+            deadline = time.monotonic() + lock_ttl
+            owner_token = await self.redis_service.acquire_lock(lock_key, lock_ttl)
+            while owner_token is None and time.monotonic() < deadline:
+                await asyncio.sleep(0.2)
+                token = await self.redis_service.get_cached_jira_token(user_id)
+                if token:
+                    self._cache_local_token(user_id, token)
+                    return token
+                owner_token = await self.redis_service.acquire_lock(lock_key, lock_ttl)
+
+            if owner_token is None:
+                log.warning(f"Timed out waiting for Jira token refresh lock of user {user_id}, refreshing anyway")
+
+            try:
+                await self.token_scheduler_service.refresh_token_chain(session=session, user_id=user_id, token_type=TokenType.JIRA)
+            finally:
+                if owner_token is not None:
+                    await self.redis_service.release_lock(lock_key, owner_token)
+
+            token = await self.redis_service.get_cached_jira_token(user_id)
+            if token:
+                self._cache_local_token(user_id, token)
+            return token
+
+    @classmethod
+    def _get_refresh_lock(cls, user_id: int) -> asyncio.Lock:
+        refresh_lock = cls._refresh_locks.get(user_id)
+        if refresh_lock is None:
+            refresh_lock = cls._refresh_locks[user_id] = asyncio.Lock()
+        return refresh_lock
+
+    @classmethod
+    def _get_local_token(cls, user_id: int) -> Optional[str]:
+        cached = cls._token_cache.get(user_id)
+        if cached is None:
+            return None
+
+        token, expires_at = cached
+        if expires_at <= time.monotonic():
+            del cls._token_cache[user_id]
+            return None
+        return token
+
+    @classmethod
+    def _cache_local_token(cls, user_id: int, token: str) -> None:
+        if settings.JIRA_TOKEN_LOCAL_CACHE_TTL_SECONDS > 0:
+            cls._token_cache[user_id] = (token, time.monotonic() + settings.JIRA_TOKEN_LOCAL_CACHE_TTL_SECONDS)
+
+    @classmethod
+    def invalidate_cached_token(cls, user_id: int) -> None:
+        """Drop the in-process token of a user, e.g. after Jira rejected it"""
+        cls._token_cache.pop(user_id, None)
+
     def _get_headers(self, token: str) -> Dict[str, str]:
         """Create standard headers for request"""
         return {
@@ -94,27 +209,22 @@ class JiraAPIClient:
             token = await self._get_token(session=session, user_id=user_id)
             return self._get_headers(token)
 
-    async def _handle_response(self, response: aiohttp.ClientResponse, error_msg: str = "Jira API error") -> Dict[str, Any]:
+    def _handle_response(self, response: HTTPTransportResponse, error_msg: str = "Jira API error") -> Dict[str, Any]:
         """Handle HTTP response and throw exception if needed"""
         if response.status == 200 or response.status == 201:
-            return await response.json()
+            return response.json()
         elif response.status == 204:
             return {}  # No content
         elif response.status == 401:
-            error_text = await response.text()
-            raise JiraAuthenticationError(f"Token is invalid or expired: {error_text}")
+            raise JiraAuthenticationError(f"Token is invalid or expired: {response.text}")
         elif response.status == 403:
-            error_text = await response.text()
-            raise JiraAuthenticationError(f"You do not have permission to perform this action: {error_text}")
+            raise JiraAuthenticationError(f"You do not have permission to perform this action: {response.text}")
         elif response.status == 404:
-            error_text = await response.text()
-            raise JiraRequestError(response.status, f"Resource not found: {error_text}")
+            raise JiraRequestError(response.status, f"Resource not found: {response.text}")
         elif response.status >= 500:
-            error_text = await response.text()
-            raise JiraConnectionError(f"Jira server error: {error_text}")
+            raise JiraConnectionError(f"Jira server error: {response.text}")
         else:
-            error_text = await response.text()
-            raise JiraRequestError(response.status, f"{error_msg}: {error_text}")
+            raise JiraRequestError(response.status, f"{error_msg}: {response.text}")
 
     async def request_with_retry(
         self,
@@ -131,18 +241,31 @@ class JiraAPIClient:
 
         retry_count = 0
         # last_error = None
+        endpoint = endpoint_template(url)
 
         while retry_count < self.max_retries:
             try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as http_session:
-                    request_method = getattr(http_session, method.lower())
-                    request_kwargs = {"headers": headers, "params": params}
-
-                    if json_data is not None and method.lower() in ['post', 'put', 'patch']:
-                        request_kwargs["json"] = json_data
-
-                    async with request_method(url, **request_kwargs) as response:
-                        return await self._handle_response(response, error_msg)
+                # Mỗi lần thử là một span, gồm cả thời gian chờ slot request
+                with tracer.start_as_current_span(f"jira {method.upper()} {endpoint}", kind=SpanKind.CLIENT) as span:
+                    span.set_attribute("http.request.method", method.upper())
+                    span.set_attribute("url.template", endpoint)
+                    span.set_attribute("jira.attempt", retry_count + 1)
+                    # Giới hạn số request Jira đồng thời theo loại workload hiện tại
+                    async with acquire_resource(ResourceKind.JIRA_REQUEST):
+                        body = json_data if method.lower() in ['post', 'put', 'patch'] else None
+
+                        # Đo từng lần gửi, không tính thời gian chờ slot và backoff
+                        status: Optional[int] = None
+                        started_at = time.perf_counter()
+                        try:
+                            response = await self.transport.request(
+                                method, url, headers=headers, params=params, json_data=body, timeout=self.timeout
+                            )
+                            status = response.status
+                            span.set_attribute("http.response.status_code", status)
+                            return self._handle_response(response, error_msg)
+                        finally:
+                            observe_jira_request(method, endpoint, status, started_at)
 
             except (JiraConnectionError, aiohttp.ClientError) as e:
                 # Chỉ retry với lỗi kết nối
@@ -153,36 +276,134 @@ class JiraAPIClient:
                     log.error(f"Attempted {retry_count} times but failed: {str(e)}")
                     raise
 
+                JIRA_REQUEST_RETRIES.labels(method=method.upper(), endpoint=endpoint).inc()
+
                 # Exponential backoff
                 wait_time = 0.5 * (2 ** retry_count)
                 log.warning(f"Retrying in {wait_time}s. Error: {str(e)}")
                 await asyncio.sleep(wait_time)
 
-            except (JiraAuthenticationError, JiraRequestError):
-                # Không retry với lỗi xác thực hoặc request
+            except JiraAuthenticationError:
+                # Không retry với lỗi xác thực, bỏ token trong bộ nhớ để lần sau đọc lại từ Redis
+                if user_id is not None:
+                    self.invalidate_cached_token(user_id)
+                raise
+
+            except JiraRequestError:
+                # Không retry với lỗi request
                 raise
 
         raise JiraRequestError(500, "Error fetching data from Jira")
 
+    async def _coalesced_get(self, key: str, url: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Share one Jira GET between concurrent identical calls (single flight)
+
+        The request runs in its own task, so a caller being cancelled does not fail the
+        others. Every caller gets its own copy of the response when it is shared.
+        """
+        if not settings.JIRA_GET_COALESCING_ENABLED:
+            return await fetch()
+
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            JIRA_REQUESTS_COALESCED.labels(endpoint=endpoint_template(url), source="cache").inc()
+            return copy.deepcopy(cached)
+
+        flight = self._inflight_gets.get(key)
+        if flight is not None:
+            JIRA_REQUESTS_COALESCED.labels(endpoint=endpoint_template(url), source="inflight").inc()
+            flight.followers += 1
+            return copy.deepcopy(await asyncio.shield(flight.task))
+
+        flight = _InFlightGet(asyncio.ensure_future(fetch()), self._get_generation)
+        self._inflight_gets[key] = flight
+        # Chạy trước khi caller nào được đánh thức: từ đây không caller mới nào nhập vào request này
+        flight.task.add_done_callback(lambda task: self._finish_get(key, flight))
+        result = await asyncio.shield(flight.task)
+        if flight.followers or settings.JIRA_GET_CACHE_TTL_SECONDS > 0:
+            # Response dùng chung với caller khác / cache, không trả về bản gốc
+            return copy.deepcopy(result)
+        return result
+
+    @classmethod
+    def _finish_get(cls, key: str, flight: _InFlightGet) -> None:
+        if cls._inflight_gets.get(key) is flight:
+            del cls._inflight_gets[key]
+        # Đọc exception để task lỗi không bị báo "never retrieved" khi mọi caller đã bị hủy
+        if flight.task.cancelled() or flight.task.exception() is not None:
+            return
+        # Có lần ghi trong lúc request chạy thì response có thể đã cũ
+        if settings.JIRA_GET_CACHE_TTL_SECONDS > 0 and flight.generation == cls._get_generation:
+            cls._cache_response(key, flight.task.result())
+
+    @classmethod
+    def _get_cached_response(cls, key: str) -> Optional[Dict[str, Any]]:
+        cached = cls._get_cache.get(key)
+        if cached is None:
+            return None
+
+        expires_at, response = cached
+        if expires_at <= time.monotonic():
+            del cls._get_cache[key]
+            return None
+        return response
+
+    @classmethod
+    def _cache_response(cls, key: str, response: Dict[str, Any]) -> None:
+        if len(cls._get_cache) >= settings.JIRA_GET_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for cached_key in [cached_key for cached_key, (expires_at, _) in cls._get_cache.items() if expires_at <= now]:
+                del cls._get_cache[cached_key]
+            # Vẫn đầy: bỏ response được cache sớm nhất
+            while cls._get_cache and len(cls._get_cache) >= settings.JIRA_GET_CACHE_MAX_ENTRIES:
+                del cls._get_cache[next(iter(cls._get_cache))]
+        cls._get_cache[key] = (time.monotonic() + settings.JIRA_GET_CACHE_TTL_SECONDS, response)
+
+    @classmethod
+    def clear_get_cache(cls) -> None:
+        """Drop cached and in-flight GET responses, e.g. after writing to Jira
+
+        Callers already waiting on an in-flight GET still get its response; later callers
+        start a new request, and the old one is not cached when it finishes.
+        """
+        cls._get_generation += 1
+        cls._get_cache.clear()
+        cls._inflight_gets.clear()
+
     async def get(self, session: Optional[AsyncSession], endpoint: str, user_id: Optional[int] = None, params: Optional[Dict[str, Any]] = None, error_msg: str = "Error fetching data from Jira") -> Dict[str, Any]:
         """Perform HTTP GET request"""
         url = f"{self.base_url}{endpoint}"
-        return await self.request_with_retry(session=session, method="GET", url=url, user_id=user_id, params=params, error_msg=error_msg)
+        # Response phụ thuộc quyền của người gọi: key gồm cả danh tính auth
+        identity = "admin" if user_id is None else f"user:{user_id}"
+        return await self._coalesced_get(
+            f"{identity} {request_key('GET', url, params)}",
+            url,
+            lambda: self.request_with_retry(session=session, method="GET", url=url, user_id=user_id, params=params, error_msg=error_msg)
+        )
 
     async def post(self, session: Optional[AsyncSession], endpoint: str, user_id: Optional[int] = None, data: Dict[str, Any] = None, error_msg: str = "Error creating new data on Jira") -> Dict[str, Any]:
         """Perform HTTP POST request"""
         url = f"{self.base_url}{endpoint}"
-        return await self.request_with_retry(session=session, method="POST", url=url, user_id=user_id, json_data=data, error_msg=error_msg)
+        response = await self.request_with_retry(session=session, method="POST", url=url, user_id=user_id, json_data=data, error_msg=error_msg)
+        # Có thể đã đổi dữ liệu trên Jira (POST gồm cả search, bỏ cache cho đơn giản)
+        self.clear_get_cache()
+        return response
 
     async def put(self, session: Optional[AsyncSession], endpoint: str, user_id: Optional[int] = None, data: Dict[str, Any] = None, error_msg: str = "Error updating data on Jira") -> Dict[str, Any]:
         """Perform HTTP PUT request"""
         url = f"{self.base_url}{endpoint}"
-        return await self.request_with_retry(session=session, method="PUT", url=url, user_id=user_id, json_data=data, error_msg=error_msg)
+        response = await self.request_with_retry(session=session, method="PUT", url=url, user_id=user_id, json_data=data, error_msg=error_msg)
+        # Dữ liệu trên Jira đã đổi, bỏ các GET đang cache
+        self.clear_get_cache()
+        return response
 
     async def delete(self, session: Optional[AsyncSession], endpoint: str, user_id: Optional[int] = None, error_msg: str = "Error deleting data on Jira") -> Dict[str, Any]:
         """Perform HTTP DELETE request"""
         url = f"{self.base_url}{endpoint}"
-        return await self.request_with_retry(session=session, method="DELETE", url=url, user_id=user_id, error_msg=error_msg)
+        response = await self.request_with_retry(session=session, method="DELETE", url=url, user_id=user_id, error_msg=error_msg)
+        # Dữ liệu trên Jira đã đổi, bỏ các GET đang cache
+        self.clear_get_cache()
+        return response
 
     # Các phương thức tiện ích
 
@@ -223,6 +444,14 @@ class JiraAPIClient:
         Raises:
             JiraRequestError: If the request fails
         """
+        url = f"{self.base_url}{path}"
+        return await self._coalesced_get(
+            f"admin-raw {request_key('GET', url, params)}",
+            url,
+            lambda: self._get_with_admin_auth(path, params, error_msg)
+        )
+
+    async def _get_with_admin_auth(self, path: str, params: Optional[Dict[str, Any]], error_msg: str) -> Dict[str, Any]:
         try:
             # Sử dụng admin credentials từ cấu hình
             admin_auth = self._get_admin_headers()
@@ -234,14 +463,19 @@ class JiraAPIClient:
             log.info(f"GET {url} with admin auth")
 
             # Thực hiện request với admin auth
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(
-                    url,
-                    headers=admin_auth,
-                    params=params
-                ) as response:
-                    response_text = await response.text()
+            endpoint = endpoint_template(url)
+            with tracer.start_as_current_span(f"jira GET {endpoint}", kind=SpanKind.CLIENT) as span:
+                span.set_attribute("http.request.method", "GET")
+                span.set_attribute("url.template", endpoint)
+                async with acquire_resource(ResourceKind.JIRA_REQUEST):
+                    started_at = time.perf_counter()
+                    response = await self.transport.request(
+                        "GET", url, headers=admin_auth, params=params, timeout=self.timeout
+                    )
+                    response_text = response.text
                     status_code = response.status
+                    span.set_attribute("http.response.status_code", status_code)
+                    observe_jira_request("GET", endpoint, status_code, started_at)
 
                     # Kiểm tra nếu request thành công
                     if status_code < 200 or status_code >= 300:
@@ -255,7 +489,7 @@ class JiraAPIClient:
                         log.error(f"Failed to parse JSON response: {response_text}")
                         return {"raw_response": response_text}
 
-        except (aiohttp.ClientConnectorError, aiohttp.ClientTimeout) as e:
+        except (aiohttp.ClientConnectorError, asyncio.TimeoutError) as e:
             log.error(f"Connection error when calling Jira API: {str(e)}")
             raise JiraRequestError(500, str(e)) from e
         except JiraRequestError as e:
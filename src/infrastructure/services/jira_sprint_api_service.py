@@ -4,7 +4,7 @@ from typing import List, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.configs.logger import log
+from src.configs.logger import log, truncated
 from src.domain.exceptions.jira_exceptions import JiraRequestError
 from src.domain.models.jira.apis.mappers.jira_board import JiraBoardMapper
 from src.domain.models.jira.apis.mappers.jira_sprint import JiraSprintMapper
@@ -40,7 +40,7 @@ class JiraSprintAPIService(IJiraSprintAPIService):
                     error_msg=f"Error fetching sprint {sprint_id}"
                 )
 
-                log.info(f"Response data when get sprint: {response_data}")
+                log.debug("Response data when get sprint: {}", truncated(response_data))
 
                 # Map response to domain model
                 sprint: JiraSprintModel = await client_to_use.map_to_domain(
@@ -48,7 +48,7 @@ class JiraSprintAPIService(IJiraSprintAPIService):
                     JiraSprintAPIGetResponseDTO,
                     JiraSprintMapper
                 )
-                log.info(f"Sprint: {sprint}")
+                log.debug("Sprint: {}", truncated(sprint))
 
                 return sprint
 
@@ -86,7 +86,7 @@ class JiraSprintAPIService(IJiraSprintAPIService):
                     error_msg=f"Error fetching sprint {sprint_id}"
                 )
 
-                log.info(f"Response data when get sprint: {response_data}")
+                log.debug("Response data when get sprint: {}", truncated(response_data))
 
                 # Map response to domain model
                 sprint: JiraSprintModel = await self.client.map_to_domain(
@@ -221,7 +221,7 @@ class JiraSprintAPIService(IJiraSprintAPIService):
                 if goal is not None:
                     payload["goal"] = goal
 
-                log.info(f"Starting sprint with payload: {payload}")
+                log.debug("Starting sprint with payload: {}", truncated(payload))
 
                 # Call Jira API to start the sprint
                 await self.client.post(
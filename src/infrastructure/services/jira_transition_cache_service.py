@@ -0,0 +1,60 @@
+import json
+from typing import Dict, Optional
+
+from src.configs.logger import log
+from src.domain.services.jira_transition_cache_service import IJiraTransitionCacheService
+from src.domain.services.redis_service import IRedisService
+
+
+class JiraTransitionCacheService(IJiraTransitionCacheService):
+    """Redis-backed cache of Jira transition IDs
+
+    Transition IDs only depend on the workflow attached to (project, issue type) and the
+    current status, so they can be shared by every issue in the same state. Entries expire
+    after ``ttl`` seconds so workflow changes in Jira are picked up automatically.
+    """
+
+    def __init__(self, redis_service: IRedisService, ttl: int = 6 * 3600):
+        self.redis_service = redis_service
+        self.ttl = ttl
+
+    def _get_key(self, project_key: str, issue_type: str, from_status: str) -> str:
+        return f"jira_transitions:{project_key}:{issue_type}:{from_status}"
+
+    async def get_transitions(self, project_key: str, issue_type: str, from_status: str) -> Optional[Dict[str, str]]:
+        """Get cached {target_status: transition_id} mapping, None if not cached"""
+        try:
+            cached = await self.redis_service.get(self._get_key(project_key, issue_type, from_status))
+            if not cached:
+                return None
+            transitions: Dict[str, str] = json.loads(cached)
+            return transitions
+        except Exception as e:
+            # Cache lỗi thì fallback về gọi Jira API
+            log.warning(f"Error reading cached transitions for {project_key}/{issue_type}/{from_status}: {str(e)}")
+            return None
+
+    async def get_transition_id(self, project_key: str, issue_type: str, from_status: str, to_status: str) -> Optional[str]:
+        """Get cached transition ID from from_status to to_status"""
+        transitions = await self.get_transitions(project_key, issue_type, from_status)
+        if not transitions:
+            return None
+        return transitions.get(to_status)
+
+    async def set_transitions(self, project_key: str, issue_type: str, from_status: str, transitions: Dict[str, str]) -> None:
+        """Cache {target_status: transition_id} mapping"""
+        try:
+            await self.redis_service.set(
+                self._get_key(project_key, issue_type, from_status),
+                json.dumps(transitions),
+                self.ttl
+            )
+        except Exception as e:
+            log.warning(f"Error caching transitions for {project_key}/{issue_type}/{from_status}: {str(e)}")
+
+    async def invalidate(self, project_key: str, issue_type: str, from_status: str) -> None:
+        """Remove cached transitions, e.g. when Jira rejects a cached transition ID"""
+        try:
+            await self.redis_service.delete(self._get_key(project_key, issue_type, from_status))
+        except Exception as e:
+            log.warning(f"Error invalidating cached transitions for {project_key}/{issue_type}/{from_status}: {str(e)}")
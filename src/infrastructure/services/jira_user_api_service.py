@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.configs.logger import log
+from src.configs.logger import log, truncated
 from src.domain.exceptions.jira_exceptions import JiraRequestError
 from src.domain.models.jira.apis.mappers.jira_user import JiraUserMapper
 from src.domain.models.jira.apis.responses.jira_user import JiraUserAPIGetResponseDTO
@@ -41,7 +41,7 @@ class JiraUserAPIService(IJiraUserAPIService):
                     error_msg=f"Error fetching user with account ID {account_id}"
                 )
 
-                log.info(f"Response data when get user: {response_data}")
+                log.debug("Response data when get user: {}", truncated(response_data))
 
                 # Map response to domain model
                 user: JiraUserModel = await self.client.map_to_domain(
@@ -90,7 +90,7 @@ class JiraUserAPIService(IJiraUserAPIService):
                     error_msg=f"Error fetching user with account ID {account_id}"
                 )
 
-                log.info(f"Response data when get user: {response_data}")
+                log.debug("Response data when get user: {}", truncated(response_data))
 
                 # Map response to domain model
                 user: JiraUserModel = await self.client.map_to_domain(
@@ -53,6 +53,14 @@ class JiraUserDatabaseService(IJiraUserDatabaseService):
             log.error(f"Error getting user by account ID: {str(e)}")
             return None
 
+    async def get_users_by_jira_account_ids(self, session: AsyncSession, jira_account_ids: List[str]) -> List[JiraUserModel]:
+        """Get users by Jira account IDs in a single query"""
+        try:
+            return await self.user_repository.get_users_by_jira_account_ids(session, jira_account_ids)
+        except Exception as e:
+            log.error(f"Error getting users by account IDs: {str(e)}")
+            return []
+
     async def get_users_by_project(self, session: AsyncSession, project_key: str) -> List[JiraUserModel]:
         """Get users associated with a project"""
         try:
@@ -0,0 +1,98 @@
+from collections import OrderedDict
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.configs.logger import log
+from src.domain.models.jira_user import JiraUserModel
+from src.domain.services.jira_user_identity_map_service import IJiraUserIdentityMapService
+
+
+class JiraUserIdentityMapService(IJiraUserIdentityMapService):
+    """Bounded LRU identity map of Jira users, shared by every handler in the process
+
+    Users are stored once (keyed by DB id) and indexed by internal user_id and Jira
+    account ID. The least recently used users are dropped once ``max_size`` is reached and
+    every entry expires ``ttl_seconds`` after it was stored, which bounds staleness when an
+    invalidation from another process is missed. All access happens on the event loop so no
+    locking is needed.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # entry id -> (user, thời điểm hết hạn theo time.monotonic())
+        self._users: "OrderedDict[int, Tuple[JiraUserModel, float]]" = OrderedDict()
+        self._by_user_id: Dict[int, int] = {}
+        self._by_jira_account_id: Dict[str, int] = {}
+
+    def get_by_user_id(self, user_id: int) -> Optional[JiraUserModel]:
+        """Get cached user by internal user ID, None if not cached"""
+        return self._get(self._by_user_id.get(user_id))
+
+    def get_by_jira_account_id(self, jira_account_id: str) -> Optional[JiraUserModel]:
+        """Get cached user by Jira account ID, None if not cached"""
+        return self._get(self._by_jira_account_id.get(jira_account_id))
+
+    def put(self, user: JiraUserModel) -> None:
+        """Add or refresh a user"""
+        if user.id is None:
+            return
+
+        # Xóa entry cũ (kể cả entry khác đang giữ cùng user_id / account ID)
+        self._remove(user.id)
+        if user.user_id is not None and user.user_id in self._by_user_id:
+            self._remove(self._by_user_id[user.user_id])
+        if user.jira_account_id and user.jira_account_id in self._by_jira_account_id:
+            self._remove(self._by_jira_account_id[user.jira_account_id])
+
+        self._users[user.id] = (user.model_copy(), time.monotonic() + self.ttl_seconds)
+        if user.user_id is not None:
+            self._by_user_id[user.user_id] = user.id
+        if user.jira_account_id:
+            self._by_jira_account_id[user.jira_account_id] = user.id
+
+        while len(self._users) > self.max_size:
+            oldest_id = next(iter(self._users))
+            self._remove(oldest_id)
+
+    def put_many(self, users: List[JiraUserModel]) -> None:
+        """Add or refresh multiple users, e.g. when warming up at startup"""
+        for user in users:
+            self.put(user)
+        log.debug(f"User identity map holds {len(self._users)} users")
+
+    def evict(self, user_id: Optional[int] = None, jira_account_id: Optional[str] = None) -> None:
+        """Remove a user by internal user ID and/or Jira account ID"""
+        if user_id is not None and user_id in self._by_user_id:
+            self._remove(self._by_user_id[user_id])
+        if jira_account_id and jira_account_id in self._by_jira_account_id:
+            self._remove(self._by_jira_account_id[jira_account_id])
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._by_user_id.clear()
+        self._by_jira_account_id.clear()
+
+    def _get(self, entry_id: Optional[int]) -> Optional[JiraUserModel]:
+        if entry_id is None:
+            return None
+        entry = self._users.get(entry_id)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(entry_id)
+            return None
+        self._users.move_to_end(entry_id)
+        # Trả về bản sao để caller không sửa được dữ liệu trong cache
+        return user.model_copy()
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._users.pop(entry_id, None)
+        if entry is None:
+            return
+        user = entry[0]
+        if user.user_id is not None and self._by_user_id.get(user.user_id) == entry_id:
+            del self._by_user_id[user.user_id]
+        if user.jira_account_id and self._by_jira_account_id.get(user.jira_account_id) == entry_id:
+            del self._by_jira_account_id[user.jira_account_id]
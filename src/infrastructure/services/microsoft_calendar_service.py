@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 
 from httpx import AsyncClient
 
+from src.configs.http_transport import HTTPTransport, get_http_transport
 from src.configs.logger import log
 from src.configs.settings import settings
 from src.domain.exceptions.microsoft_calendar_exceptions import CalendarError, CalendarTokenError
@@ -14,9 +15,11 @@ from src.infrastructure.services.redis_service import RedisService
 class MicrosoftCalendarService(IMicrosoftCalendarService):
     BASE_URL = "https://graph.microsoft.com/v1.0"
 
-    def __init__(self, redis_service: RedisService):
+    def __init__(self, redis_service: RedisService, transport: Optional[HTTPTransport] = None):
         self.redis_service = redis_service
         self.timeout = 30
+        # Request tới Graph đi qua transport theo HTTP_TRANSPORT_MODE (live / record / replay)
+        self.transport = transport or get_http_transport("microsoft_graph")
 
     async def _get_token(self, user_id: int) -> str:
         """Get Microsoft token from cache or auth service."""
@@ -66,25 +69,23 @@ class MicrosoftCalendarService(IMicrosoftCalendarService):
             )
 
             # Call Microsoft Graph API
-            async with AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers={
-                        "Authorization": f"Bearer {token}",
-                        "Accept": "application/json"
-                    }
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_response(data)
-                else:
-                    log.error(
-                        f"Microsoft Graph API error: {
-                            response.status_code} - {response.text}"
-                    )
-                    raise CalendarError("Failed to fetch calendar events")
+            response = await self.transport.request(
+                "GET",
+                url,
+                params=params,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Accept": "application/json"
+                },
+                timeout=self.timeout
+            )
+
+            if response.status == 200:
+                data = response.json()
+                return self._parse_response(data)
+            else:
+                log.error(f"Microsoft Graph API error: {response.status} - {response.text}")
+                raise CalendarError("Failed to fetch calendar events")
 
         except Exception as e:
             log.error(f"Calendar repository error: {str(e)}")
@@ -3,9 +3,11 @@ from typing import Any, Callable, Coroutine, Dict, List
 
 from nats.aio.client import Client
 from nats.aio.msg import Msg
+from opentelemetry.trace import SpanKind
 
-from src.configs.logger import log
+from src.configs.logger import log, truncated
 from src.configs.settings import settings
+from src.configs.tracing import extract_trace_context, inject_trace_headers, tracer
 from src.domain.services.nats_service import INATSService, MessageCallback
 
 
@@ -46,9 +48,11 @@ class NATSService(INATSService):
             if not self._is_connected:
                 await self.connect()
 
-            payload = json.dumps(message).encode()
-            await self._client.publish(subject, payload)
-            log.info(f"Published message to {subject}: {message}")
+            with tracer.start_as_current_span(f"nats.publish {subject}", kind=SpanKind.PRODUCER):
+                payload = json.dumps(message).encode()
+                # Trace context đi theo header để bên nhận nối tiếp trace
+                await self._client.publish(subject, payload, headers=inject_trace_headers() or None)
+            log.debug("Published message to {}: {}", subject, truncated(message))
         except Exception as e:
             log.error(f"Failed to publish message: {str(e)}")
             raise
@@ -61,8 +65,13 @@ class NATSService(INATSService):
 
             async def message_handler(msg: Msg) -> None:
                 try:
-                    data = json.loads(msg.data.decode())
-                    await callback(msg.subject, data)
+                    with tracer.start_as_current_span(
+                        f"nats.handle {subject}",
+                        context=extract_trace_context(msg.headers),
+                        kind=SpanKind.CONSUMER
+                    ):
+                        data = json.loads(msg.data.decode())
+                        await callback(msg.subject, data)
                 except Exception as e:
                     log.error(f"Error processing message: {str(e)}")
 
@@ -80,17 +89,22 @@ class NATSService(INATSService):
 
             async def request_handler(msg: Msg) -> None:
                 try:
-                    # Parse request data
-                    data = json.loads(msg.data.decode())
-
-                    # Process request and get response
-                    response = await callback(msg.subject, data)
-
-                    # Send response back
-                    response_data = json.dumps(response).encode()
-                    await msg.respond(response_data)
-
-                    log.info(f"Handled request for {msg.subject} with response: {response}")
+                    with tracer.start_as_current_span(
+                        f"nats.handle_request {subject}",
+                        context=extract_trace_context(msg.headers),
+                        kind=SpanKind.SERVER
+                    ):
+                        # Parse request data
+                        data = json.loads(msg.data.decode())
+
+                        # Process request and get response
+                        response = await callback(msg.subject, data)
+
+                        # Send response back
+                        response_data = json.dumps(response).encode()
+                        await msg.respond(response_data)
+
+                    log.debug("Handled request for {} with response: {}", msg.subject, truncated(response))
                 except Exception as e:
                     # Send error response
                     error_response = json.dumps({"error": str(e)}).encode()
@@ -114,8 +128,14 @@ class NATSService(INATSService):
             if not self._is_connected:
                 await self.connect()
 
-            payload = json.dumps(message).encode()
-            response = await self._client.request(subject, payload, timeout=timeout)
+            with tracer.start_as_current_span(f"nats.request {subject}", kind=SpanKind.CLIENT):
+                payload = json.dumps(message).encode()
+                response = await self._client.request(
+                    subject,
+                    payload,
+                    timeout=timeout,
+                    headers=inject_trace_headers() or None
+                )
 
             if not response.data:
                 return {}
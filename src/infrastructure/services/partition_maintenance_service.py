@@ -0,0 +1,83 @@
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.configs.logger import log
+from src.domain.constants.partitions import PartitionedTable
+from src.domain.models.partition import PartitionMaintenanceResultModel
+from src.domain.repositories.partition_repository import IPartitionRepository
+from src.domain.services.partition_maintenance_service import IPartitionMaintenanceService
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionMaintenanceService(IPartitionMaintenanceService):
+    """Keeps ``premake_months`` future partitions and expires months older than the retention
+
+    A month is expired once all of it is older than ``retention_months`` full months (0 keeps
+    every month). Expired partitions are dropped, or detached and moved to ``archive_schema``
+    when it is set. Rows of expired months that landed in the DEFAULT partition are deleted.
+    """
+
+    def __init__(
+        self,
+        partition_repository: IPartitionRepository,
+        retention_months: Dict[PartitionedTable, int],
+        premake_months: int = 3,
+        archive_schema: Optional[str] = None,
+        lock_timeout_seconds: int = 5
+    ):
+        self.partition_repository = partition_repository
+        self.retention_months = retention_months
+        self.premake_months = premake_months
+        self.archive_schema = archive_schema
+        self.lock_timeout_seconds = lock_timeout_seconds
+
+    def get_partitioned_tables(self) -> List[PartitionedTable]:
+        return list(self.retention_months)
+
+    async def maintain_partitions(self, session: AsyncSession, table: PartitionedTable) -> PartitionMaintenanceResultModel:
+        result = PartitionMaintenanceResultModel(table=table.value)
+        await self.partition_repository.set_lock_timeout(session, self.lock_timeout_seconds)
+
+        partitions = await self.partition_repository.get_monthly_partitions(session, table.value)
+        current_month = datetime.now(timezone.utc).date().replace(day=1)
+
+        for offset in range(self.premake_months + 1):
+            month = _add_months(current_month, offset)
+            if month in partitions:
+                continue
+            try:
+                # Savepoint: partition trùng khoảng với dữ liệu trong DEFAULT sẽ lỗi, không hủy cả job
+                async with session.begin_nested():
+                    result.created.append(
+                        await self.partition_repository.create_monthly_partition(session, table.value, month)
+                    )
+            except Exception as e:
+                log.error(f"Error creating partition of {table.value} for {month:%Y-%m}: {str(e)}")
+
+        retention_months = self.retention_months.get(table, 0)
+        if retention_months <= 0:
+            return result
+
+        expire_before = _add_months(current_month, -retention_months)
+        for month, partition in sorted(partitions.items()):
+            if month >= expire_before:
+                continue
+            if self.archive_schema:
+                await self.partition_repository.archive_partition(session, table.value, partition, self.archive_schema)
+                result.archived.append(partition)
+            else:
+                await self.partition_repository.drop_partition(session, table.value, partition)
+                result.dropped.append(partition)
+
+        result.default_rows_deleted = await self.partition_repository.delete_default_partition_rows(
+            session,
+            table.value,
+            datetime.combine(expire_before, datetime.min.time(), timezone.utc)
+        )
+        return result
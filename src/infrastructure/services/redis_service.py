@@ -1,10 +1,27 @@
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+import uuid
 
 from redis.asyncio import Redis
 
 from src.configs.logger import log
 from src.domain.services.redis_service import IRedisService
 
+# Chỉ xóa lock nếu vẫn do owner token này giữ (lock có thể đã hết hạn và bị process khác lấy)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Gia hạn lock chỉ khi vẫn do owner token này giữ
+EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
 
 class RedisService(IRedisService):
     """Service for managing Redis operations."""
@@ -26,6 +43,22 @@ class RedisService(IRedisService):
         else:
             await self.redis.setex(key, expiry, value)
 
+    async def set_many(self, values: Dict[str, str], expiry: Optional[int] = None) -> None:
+        """Set several values with the same expiry time in one round-trip."""
+        if not values:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                if expiry is None:
+                    pipe.set(key, value)
+                else:
+                    pipe.setex(key, expiry, value)
+            await pipe.execute()
+
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer value, returns the new value."""
+        return int(await self.redis.incr(key))
+
     async def delete(self, key: str) -> None:
         """Delete a key from Redis."""
         await self.redis.delete(key)
@@ -45,6 +78,37 @@ class RedisService(IRedisService):
             log.error(f"Error getting cached Jira token: {str(e)}")
             return ""
 
+    async def get_cached_jira_token_with_last_check(self, user_id: int) -> Tuple[str, bool]:
+        """Get cached Jira access token and whether its refresh was checked recently, in one round-trip."""
+        try:
+            token, last_check = await self.redis.mget(f"jira_token:{user_id}", f"jira_token_last_check:{user_id}")
+            if isinstance(token, bytes):
+                token = token.decode('utf-8')
+            return token or "", last_check is not None
+        except Exception as e:
+            log.error(f"Error getting cached Jira token: {str(e)}")
+            return "", False
+
+    async def mark_jira_token_checked(self, user_id: int, expiry: int = 600) -> None:
+        """Remember that the Jira token refresh of a user was checked."""
+        await self.set(f"jira_token_last_check:{user_id}", "1", expiry)
+
+    async def acquire_lock(self, key: str, expiry: int, owner_token: Optional[str] = None) -> Optional[str]:
+        """Try to acquire a lock shared across replicas, returns the owner token or None if already held."""
+        owner_token = owner_token or uuid.uuid4().hex
+        acquired = await self.redis.set(key, owner_token, nx=True, ex=expiry)
+        return owner_token if acquired else None
+
+    async def extend_lock(self, key: str, owner_token: str, expiry: int) -> bool:
+        """Reset the expiry of a lock only if it is still held by owner_token."""
+        extended = await self.redis.eval(EXTEND_LOCK_SCRIPT, 1, key, owner_token, expiry)
+        return bool(extended)
+
+    async def release_lock(self, key: str, owner_token: str) -> bool:
+        """Release a lock only if it is still held by owner_token."""
+        released = await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, key, owner_token)
+        return bool(released)
+
     async def cache_microsoft_token(self, user_id: int, access_token: str, expiry: int = 3600) -> None:
         """Cache Microsoft access token with expiry."""
         key = f"microsoft_token:{user_id}"
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timezone
+import os
+import socket
+import time
+from typing import Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from src.configs.logger import log
+from src.domain.models.scheduler_leader import SchedulerLeaderStatusModel
+from src.domain.services.redis_service import IRedisService
+from src.domain.services.scheduler_leader_service import ISchedulerLeaderService
+
+
+class RedisSchedulerLeaderService(ISchedulerLeaderService):
+    """Leader election with a Redis lease; only the leader's scheduler runs jobs
+
+    Every process starts its scheduler paused. The leader holds a Redis key with a short TTL
+    and renews it every ``renew_interval_seconds``, followers try to take the key at the same
+    interval. A crashed leader is replaced once its lease expires, a stopped leader deletes
+    the key so a follower takes over on its next attempt.
+    """
+
+    LEASE_KEY = "scheduler:leader"
+
+    def __init__(
+        self,
+        redis_service: IRedisService,
+        scheduler: AsyncIOScheduler,
+        lease_seconds: int = 15,
+        renew_interval_seconds: int = 5,
+        instance_id: Optional[str] = None
+    ):
+        self.redis_service = redis_service
+        self.scheduler = scheduler
+        self.lease_seconds = lease_seconds
+        self.renew_interval_seconds = renew_interval_seconds
+        self.instance_id = instance_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._is_leader = False
+        self._acquired_at: Optional[datetime] = None
+        self._last_renewed_at: Optional[datetime] = None
+        self._last_renewed_monotonic = 0.0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def start(self) -> None:
+        """Start competing for leadership in the background"""
+        if self._task is not None:
+            return
+
+        # Thử nhận leader ngay để job không phải chờ hết một chu kỳ sau khi deploy
+        await self._elect()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop competing and hand over leadership if held"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._is_leader:
+            self._step_down()
+            try:
+                await self.redis_service.release_lock(self.LEASE_KEY, self.instance_id)
+            except Exception as e:
+                log.warning(f"Error releasing scheduler leader lease: {str(e)}")
+
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    async def get_status(self) -> SchedulerLeaderStatusModel:
+        """Get current leader and lease state"""
+        return SchedulerLeaderStatusModel(
+            instance_id=self.instance_id,
+            is_leader=self._is_leader,
+            leader_id=await self.redis_service.get(self.LEASE_KEY),
+            lease_seconds=self.lease_seconds,
+            acquired_at=self._acquired_at,
+            last_renewed_at=self._last_renewed_at
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.renew_interval_seconds)
+            await self._elect()
+
+    async def _elect(self) -> None:
+        try:
+            if self._is_leader:
+                renewed = await self.redis_service.extend_lock(self.LEASE_KEY, self.instance_id, self.lease_seconds)
+                if renewed:
+                    self._mark_renewed()
+                else:
+                    log.warning(f"Scheduler leader lease lost by {self.instance_id}")
+                    self._step_down()
+            else:
+                owner_token = await self.redis_service.acquire_lock(
+                    self.LEASE_KEY,
+                    self.lease_seconds,
+                    owner_token=self.instance_id
+                )
+                if owner_token is not None:
+                    self._become_leader()
+        except Exception as e:
+            log.error(f"Error in scheduler leader election: {str(e)}")
+            # Không gia hạn được và lease có thể đã hết hạn: dừng job để không chạy song song với leader mới
+            if self._is_leader and time.monotonic() - self._last_renewed_monotonic >= self.lease_seconds:
+                self._step_down()
+
+    def _become_leader(self) -> None:
+        self._is_leader = True
+        self._acquired_at = datetime.now(timezone.utc)
+        self._mark_renewed()
+        if self.scheduler.running:
+            self.scheduler.resume()
+        log.info(f"{self.instance_id} became scheduler leader")
+
+    def _step_down(self) -> None:
+        self._is_leader = False
+        self._acquired_at = None
+        if self.scheduler.running:
+            self.scheduler.pause()
+        log.info(f"{self.instance_id} stepped down as scheduler leader")
+
+    def _mark_renewed(self) -> None:
+        self._last_renewed_at = datetime.now(timezone.utc)
+        self._last_renewed_monotonic = time.monotonic()
@@ -0,0 +1,146 @@
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+import random
+from typing import Deque, List, Optional
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+from src.configs.database import AsyncSessionManager
+from src.configs.logger import log
+from src.configs.resource_pools import use_resource_class
+from src.domain.constants.resource_pools import ResourceClass
+from src.domain.models.database.sync_log import SyncLogDBCreateDTO
+from src.domain.repositories.sync_log_repository import ISyncLogRepository
+from src.domain.services.sync_log_writer_service import ISyncLogWriterService
+from src.utils.payload_utils import compact_payload
+
+
+class SyncLogWriterService(ISyncLogWriterService):
+    """Buffers sync logs in memory and writes them in batched multi-row inserts
+
+    Logs are written in their own session every ``flush_interval_seconds``, so webhook and
+    NATS handlers no longer wait for the insert. Logs of successful operations are kept with
+    probability ``success_sample_rate``; failures are always kept. When the queue is full new
+    logs are dropped with a warning instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        sync_log_repository: ISyncLogRepository,
+        flush_interval_seconds: float = 1.0,
+        batch_size: int = 200,
+        max_queue_size: int = 10000,
+        max_payload_bytes: int = 8192,
+        success_sample_rate: float = 1.0
+    ):
+        self.sync_log_repository = sync_log_repository
+        self.flush_interval_seconds = flush_interval_seconds
+        self.batch_size = batch_size
+        self.max_queue_size = max_queue_size
+        self.max_payload_bytes = max_payload_bytes
+        self.success_sample_rate = success_sample_rate
+        self._queue: Deque[SyncLogDBCreateDTO] = deque()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._dropped_count = 0
+
+    def enqueue(self, sync_log: SyncLogDBCreateDTO) -> bool:
+        """Queue a sync log for writing, False if it was sampled out or dropped"""
+        if self._is_success(sync_log) and random.random() >= self.success_sample_rate:
+            return False
+
+        if len(self._queue) >= self.max_queue_size:
+            self._dropped_count += 1
+            if self._dropped_count == 1 or self._dropped_count % 1000 == 0:
+                log.warning(f"Sync log queue is full ({self.max_queue_size}), dropped {self._dropped_count} logs so far")
+            return False
+
+        # Rút gọn payload ngay khi nhận để hàng đợi không giữ payload lớn tới lúc flush.
+        # Giữ thời điểm xảy ra thao tác, không phải thời điểm flush
+        self._queue.append(sync_log.model_copy(update={
+            "request_payload": compact_payload(sync_log.request_payload, self.max_payload_bytes),
+            "response_body": compact_payload(sync_log.response_body, self.max_payload_bytes),
+            "created_at": sync_log.created_at or datetime.now(timezone.utc)
+        }))
+        return True
+
+    async def start(self) -> None:
+        """Start flushing queued logs periodically"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flush and write the remaining logs"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+        if self._queue:
+            log.warning(f"Shutting down with {len(self._queue)} sync logs not written")
+
+    async def flush(self) -> None:
+        """Write all queued logs now, or until the database is unavailable"""
+        async with self._flush_lock:
+            while self._queue:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not await self._write_batch(batch):
+                    break
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                log.error(f"Error flushing sync logs: {str(e)}")
+
+    async def _write_batch(self, batch: List[SyncLogDBCreateDTO]) -> bool:
+        """Write one batch, False if the database is unavailable and the rest was put back in the queue"""
+        # Ghi log là việc nền, tính vào ngân sách sync thay vì của UI
+        with use_resource_class(ResourceClass.SYNC):
+            try:
+                async with AsyncSessionManager.session() as session:
+                    await self.sync_log_repository.create_sync_logs(session=session, sync_logs=batch)
+                return True
+            except Exception as e:
+                log.warning(f"Batch insert of {len(batch)} sync logs failed, retrying one by one: {str(e)}")
+
+            # Một dòng lỗi (vd. sender không tồn tại) không làm mất cả lô
+            for index, sync_log in enumerate(batch):
+                try:
+                    async with AsyncSessionManager.session() as session:
+                        await self.sync_log_repository.create_sync_logs(session=session, sync_logs=[sync_log])
+                except Exception as e:
+                    if self._is_connection_error(e):
+                        # DB không dùng được: giữ phần còn lại cho lần flush sau
+                        self._requeue(batch[index:])
+                        log.error(f"Cannot write sync logs, keeping {len(batch) - index} for the next flush: {str(e)}")
+                        return False
+                    # Lỗi của riêng dòng này (vi phạm ràng buộc, payload không encode được, ...): bỏ dòng,
+                    # không để nó chặn các lần flush sau
+                    log.error(f"Dropping sync log of {sync_log.entity_type} {sync_log.entity_id}: {str(e)}")
+        return True
+
+    def _requeue(self, sync_logs: List[SyncLogDBCreateDTO]) -> None:
+        """Put unwritten logs back at the head of the queue, dropping what exceeds the queue limit"""
+        room = max(self.max_queue_size - len(self._queue), 0)
+        if len(sync_logs) > room:
+            self._dropped_count += len(sync_logs) - room
+            log.warning(f"Sync log queue is full ({self.max_queue_size}), dropped {self._dropped_count} logs so far")
+        self._queue.extendleft(reversed(sync_logs[:room]))
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        if isinstance(error, DBAPIError):
+            return error.connection_invalidated or isinstance(error, (OperationalError, InterfaceError))
+        return isinstance(error, OSError)
+
+    @staticmethod
+    def _is_success(sync_log: SyncLogDBCreateDTO) -> bool:
+        return sync_log.error_message is None and (sync_log.response_status is None or sync_log.response_status < 400)
@@ -1,10 +1,14 @@
 from datetime import datetime, timedelta, timezone
+from typing import List
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.configs.logger import log
-from src.domain.constants.refresh_tokens import TokenType
+from src.configs.settings import settings
+from src.domain.constants.refresh_tokens import JIRA_TOKEN_REFRESH_LOCK_KEY, TokenRefreshResult, TokenType
+from src.domain.models.refresh_token import RefreshTokenModel
 from src.domain.repositories.refresh_token_repository import IRefreshTokenRepository
+from src.domain.services.redis_service import IRedisService
 from src.domain.services.token_refresh_service import ITokenRefreshService
 from src.domain.services.token_scheduler_service import ITokenSchedulerService
 
@@ -13,10 +17,12 @@ class TokenSchedulerService(ITokenSchedulerService):
     def __init__(
         self,
         token_refresh_service: ITokenRefreshService,
-        refresh_token_repository: IRefreshTokenRepository
+        refresh_token_repository: IRefreshTokenRepository,
+        redis_service: IRedisService
     ):
         self.token_refresh_service = token_refresh_service
         self.refresh_token_repository = refresh_token_repository
+        self.redis_service = redis_service
         self.refresh_threshold = timedelta(minutes=60)
         self.refresh_token_threshold = timedelta(days=7)
 
@@ -24,7 +30,6 @@ class TokenSchedulerService(ITokenSchedulerService):
         """Schedule token refresh check for a user"""
         try:
             log.info(f"Scheduling token refresh for user {user_id}")
-            now = datetime.now(timezone.utc)
 
             # Check Jira tokens
             jira_token = await self.refresh_token_repository.get_by_user_id_and_type(
@@ -33,10 +38,7 @@ class TokenSchedulerService(ITokenSchedulerService):
                 token_type=TokenType.JIRA
             )
             if jira_token:
-                if jira_token.expires_at - now <= self.refresh_threshold:
-                    await self.refresh_token_chain(session, user_id, TokenType.JIRA)
-                elif not jira_token.is_revoked and jira_token.expires_at - now <= self.refresh_token_threshold:
-                    await self.rotate_refresh_token(session, user_id, TokenType.JIRA)
+                await self.refresh_token_if_due(session, jira_token)
 
             # Check Microsoft tokens
             microsoft_token = await self.refresh_token_repository.get_by_user_id_and_type(
@@ -45,15 +47,55 @@ class TokenSchedulerService(ITokenSchedulerService):
                 token_type=TokenType.MICROSOFT
             )
             if microsoft_token:
-                if microsoft_token.expires_at - now <= self.refresh_threshold:
-                    await self.refresh_token_chain(session, user_id, TokenType.MICROSOFT)
-                elif not microsoft_token.is_revoked and microsoft_token.expires_at - now <= self.refresh_token_threshold:
-                    await self.rotate_refresh_token(session, user_id, TokenType.MICROSOFT)
+                await self.refresh_token_if_due(session, microsoft_token)
 
         except Exception as e:
             log.error(f"Error in token refresh scheduler: {str(e)}")
 
-    async def refresh_token_chain(self, session: AsyncSession, user_id: int, token_type: TokenType) -> None:
+    async def get_tokens_due_for_refresh(self, session: AsyncSession) -> List[RefreshTokenModel]:
+        """Get the latest token of each user and token type that needs a refresh or rotation"""
+        # refresh_threshold < refresh_token_threshold nên mọi token cần xử lý đều hết hạn trước mốc này
+        expires_before = datetime.now(timezone.utc) + max(self.refresh_threshold, self.refresh_token_threshold)
+        return await self.refresh_token_repository.get_latest_tokens_expiring_before(
+            session=session,
+            expires_before=expires_before
+        )
+
+    async def refresh_token_if_due(self, session: AsyncSession, token: RefreshTokenModel) -> TokenRefreshResult:
+        """Refresh the access token or rotate the refresh token if it is close to expiry"""
+        now = datetime.now(timezone.utc)
+        if token.expires_at - now <= self.refresh_threshold:
+            refreshed = await self.refresh_token_chain(session, token.user_id, token.token_type)
+            return TokenRefreshResult.REFRESHED if refreshed else TokenRefreshResult.FAILED
+        if not token.is_revoked and token.expires_at - now <= self.refresh_token_threshold:
+            rotated = await self.rotate_refresh_token(session, token.user_id, token.token_type)
+            return TokenRefreshResult.ROTATED if rotated else TokenRefreshResult.FAILED
+        return TokenRefreshResult.SKIPPED
+
+    async def refresh_user_tokens_if_due(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        tokens: List[RefreshTokenModel]
+    ) -> List[TokenRefreshResult]:
+        """Refresh or rotate the due tokens of one user while holding the user's token refresh lock
+
+        The lock is the one JiraAPIClient takes before refreshing, so the scheduled job and a
+        request (on any replica) never use the same refresh token twice.
+        """
+        lock_key = JIRA_TOKEN_REFRESH_LOCK_KEY.format(user_id=user_id)
+        owner_token = await self.redis_service.acquire_lock(lock_key, settings.JIRA_TOKEN_REFRESH_LOCK_TTL_SECONDS)
+        if owner_token is None:
+            # Request hoặc replica khác đang refresh token của user này, lần chạy sau sẽ kiểm tra lại
+            log.info(f"Token refresh of user {user_id} is already in progress, skipping")
+            return [TokenRefreshResult.SKIPPED for _ in tokens]
+
+        try:
+            return [await self.refresh_token_if_due(session, token) for token in tokens]
+        finally:
+            await self.redis_service.release_lock(lock_key, owner_token)
+
+    async def refresh_token_chain(self, session: AsyncSession, user_id: int, token_type: TokenType) -> bool:
         """Refresh both access and refresh tokens"""
         try:
             if token_type == TokenType.JIRA:
@@ -64,14 +106,16 @@ class TokenSchedulerService(ITokenSchedulerService):
 
             if not new_access_token:
                 log.error(f"Failed to refresh {token_type.value} token for user {user_id}")
-                return
+                return False
 
             log.info(f"Successfully refreshed {token_type.value} token for user {user_id}")
+            return True
 
         except Exception as e:
             log.error(f"Error in refresh token chain: {str(e)}")
+            return False
 
-    async def rotate_refresh_token(self, session: AsyncSession, user_id: int, token_type: TokenType) -> None:
+    async def rotate_refresh_token(self, session: AsyncSession, user_id: int, token_type: TokenType) -> bool:
         """Rotate refresh token before it expires"""
         try:
             # Get current refresh token
@@ -81,14 +125,17 @@ class TokenSchedulerService(ITokenSchedulerService):
                 token_type=token_type
             )
             if not current_token or current_token.is_revoked:
-                return
+                return False
 
             # Refresh tokens which will create new refresh token
-            await self.refresh_token_chain(session=session, user_id=user_id, token_type=token_type)
+            if not await self.refresh_token_chain(session=session, user_id=user_id, token_type=token_type):
+                return False
 
             # Revoke old refresh token
             await self.refresh_token_repository.revoke_token(session=session, token=current_token.token)
             log.info(f"Successfully rotated {token_type.value} refresh token for user {user_id}")
+            return True
 
         except Exception as e:
             log.error(f"Error rotating refresh token: {str(e)}")
+            return False
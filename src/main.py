@@ -12,6 +12,7 @@ from src.app.routers.jira_user_router import router as jira_user_router
 from src.app.routers.jira_webhook_router import router as jira_webhook_router
 from src.app.routers.media_router import router as media_router
 from src.app.routers.microsoft_calendar_router import router as microsoft_calendar_router
+from src.app.routers.scheduler_router import router as scheduler_router
 from src.app.routers.system_config_router import router as system_config_router
 from src.app.routers.util_router import router as util_router
 from src.configs.settings import settings
@@ -64,6 +65,7 @@ app.include_router(jira_sprint_router, prefix=settings.API_V1_STR +
 app.include_router(media_router, prefix=settings.API_V1_STR + "/media", tags=["media"])
 app.include_router(system_config_router, prefix=settings.API_V1_STR + "/configs", tags=["system_config"])
 app.include_router(jira_user_router, prefix=settings.API_V1_STR + "/jira/users", tags=["jira_users"])
+app.include_router(scheduler_router, prefix=settings.API_V1_STR + "/scheduler", tags=["scheduler"])
 
 if __name__ == "__main__":
     import uvicorn
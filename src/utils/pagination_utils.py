@@ -0,0 +1,24 @@
+import base64
+import json
+from typing import Any, Dict
+
+from src.domain.exceptions.pagination_exceptions import InvalidCursorError
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Encode keyset values into an opaque, URL-safe cursor."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor created by encode_cursor, raise InvalidCursorError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(values, dict):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return values
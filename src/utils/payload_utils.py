@@ -0,0 +1,40 @@
+import json
+from typing import Any, Dict
+
+# Số phần tử / key tối đa giữ lại khi tóm tắt list / dict bị lược bỏ
+_SUMMARY_ITEMS = 20
+
+
+def json_size(value: Any) -> int:
+    """Size in bytes of the compact JSON encoding of a value."""
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def compact_payload(payload: Dict[str, Any], max_bytes: int, max_string_length: int = 512) -> Dict[str, Any]:
+    """Shrink a JSON payload to roughly max_bytes for storage.
+
+    Payloads within the limit are returned unchanged. Otherwise top-level scalars are kept,
+    long strings are cut to max_string_length and nested objects larger than
+    max_string_length are replaced by a summary of their keys / length.
+    """
+    original_size = json_size(payload)
+    if original_size <= max_bytes:
+        return payload
+
+    compacted: Dict[str, Any] = {}
+    for key, value in payload.items():
+        if isinstance(value, str):
+            compacted[key] = value[:max_string_length]
+        elif value is None or isinstance(value, (bool, int, float)):
+            compacted[key] = value
+        elif json_size(value) <= max_string_length:
+            compacted[key] = value
+        elif isinstance(value, dict):
+            compacted[key] = {"_omitted_keys": list(value)[:_SUMMARY_ITEMS]}
+        elif isinstance(value, (list, tuple)):
+            compacted[key] = {"_omitted_items": len(value)}
+        else:
+            compacted[key] = str(value)[:max_string_length]
+
+    compacted["_truncated_from_bytes"] = original_size
+    return compacted
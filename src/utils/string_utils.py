@@ -1,3 +1,5 @@
+import re
+from typing import Optional
 import uuid
 
 
@@ -8,3 +10,15 @@ def is_valid_uuid(uuid_str: str) -> bool:
         return True
     except ValueError:
         return False
+
+
+def build_prefix_tsquery(search: str) -> Optional[str]:
+    """Build a prefix-matching tsquery ('foo:* & bar:*') from free text.
+
+    Only word characters are kept, so the result is always valid to_tsquery input.
+    Returns None when the text has no searchable words.
+    """
+    words = re.findall(r"\w+", search.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
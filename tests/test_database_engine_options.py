@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy.pool import NullPool
+
+from src.configs.database import build_engine_options
+from src.configs.settings import settings
+
+
+@pytest.fixture
+def pool_settings(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Start each test from the default pool settings, restored afterwards"""
+    monkeypatch.setattr(settings, "DATABASE_POOL_SIZE", 40)
+    monkeypatch.setattr(settings, "DATABASE_MAX_OVERFLOW", 40)
+    monkeypatch.setattr(settings, "DATABASE_PGBOUNCER_MODE", False)
+    return monkeypatch
+
+
+def test_pool_size_zero_uses_null_pool(pool_settings: pytest.MonkeyPatch) -> None:
+    """DATABASE_POOL_SIZE=0 leaves pooling to PgBouncer: NullPool and no pool sizing options"""
+    pool_settings.setattr(settings, "DATABASE_POOL_SIZE", 0)
+
+    options = build_engine_options()
+
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+    assert "max_overflow" not in options
+
+
+def test_pool_size_is_used_for_queue_pool(pool_settings: pytest.MonkeyPatch) -> None:
+    """A positive pool size keeps the default pool class with the configured size"""
+    pool_settings.setattr(settings, "DATABASE_POOL_SIZE", 5)
+    pool_settings.setattr(settings, "DATABASE_MAX_OVERFLOW", 3)
+
+    options = build_engine_options()
+
+    assert "poolclass" not in options
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 3
+
+
+def test_explicit_pool_size_overrides_settings(pool_settings: pytest.MonkeyPatch) -> None:
+    """The replica engine passes its own pool size, 0 also means NullPool there"""
+    assert build_engine_options(pool_size=10, max_overflow=2)["pool_size"] == 10
+    assert build_engine_options(pool_size=0, max_overflow=0)["poolclass"] is NullPool
+
+
+def test_pgbouncer_mode_disables_statement_caches(pool_settings: pytest.MonkeyPatch) -> None:
+    """Transaction pooling needs asyncpg's statement caches off and unique prepared statement names"""
+    pool_settings.setattr(settings, "DATABASE_PGBOUNCER_MODE", True)
+
+    connect_args = build_engine_options()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    first_name, second_name = name_func(), name_func()
+    assert first_name != second_name
+    assert first_name.startswith("__asyncpg_")
+
+
+def test_connect_args_absent_without_pgbouncer(pool_settings: pytest.MonkeyPatch) -> None:
+    """Without PgBouncer asyncpg keeps its default statement caches"""
+    assert "connect_args" not in build_engine_options()
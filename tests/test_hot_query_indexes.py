@@ -0,0 +1,107 @@
+"""EXPLAIN checks that the hot queries can use the indexes of migration 9d4f1a6b2e85
+
+Needs a migrated Postgres at DATABASE_URL; skipped when it is not reachable.
+"""
+import asyncio
+from typing import Any, Dict, Iterator, Set
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.configs.settings import settings
+
+# Index trên partition được tạo từ index của bảng cha, nên quy về tên index của bảng cha
+PARENT_INDEX_QUERY = text("""
+    SELECT child.relname, parent.relname
+    FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    WHERE child.relkind = 'i'
+""")
+
+# (index mong đợi, câu query, tham số)
+HOT_QUERIES = {
+    "project_issues_page": (
+        "ix_jira_issues_project_key_updated_at_active",
+        "SELECT * FROM jira_issues WHERE project_key = :project_key AND is_deleted = false "
+        "ORDER BY updated_at DESC, id DESC LIMIT 51",
+        {"project_key": "HOT"},
+    ),
+    "issues_by_assignee": (
+        "ix_jira_issues_assignee_id",
+        "SELECT * FROM jira_issues WHERE assignee_id = :assignee_id",
+        {"assignee_id": "hot-account"},
+    ),
+    "issues_by_story": (
+        "ix_jira_issues_story_id",
+        "SELECT * FROM jira_issues WHERE story_id = :story_id",
+        {"story_id": "HOT-1"},
+    ),
+    "issue_field_history": (
+        "ix_jira_issue_histories_issue_field_created",
+        "SELECT * FROM jira_issue_histories WHERE jira_issue_id = :jira_issue_id AND field_name = :field_name "
+        "ORDER BY created_at",
+        {"jira_issue_id": "10001", "field_name": "status"},
+    ),
+    "issue_changelog_page": (
+        "ix_jira_issue_histories_issue_created",
+        "SELECT * FROM jira_issue_histories WHERE jira_issue_id = :jira_issue_id "
+        "ORDER BY created_at DESC, id DESC LIMIT 50",
+        {"jira_issue_id": "10001"},
+    ),
+    "sprint_issues": (
+        "ix_jira_issue_sprints_sprint_issue",
+        "SELECT jira_issue_id FROM jira_issue_sprints WHERE jira_sprint_id = :jira_sprint_id",
+        {"jira_sprint_id": 1},
+    ),
+    "entity_sync_logs": (
+        "ix_sync_logs_entity_id_created_at",
+        "SELECT * FROM sync_logs WHERE entity_id = :entity_id ORDER BY created_at DESC LIMIT 50",
+        {"entity_id": "10001"},
+    ),
+}
+
+
+def _walk_plan(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk_plan(child)
+
+
+async def _explain_index_names(conn: AsyncConnection, query: str, params: Dict[str, Any]) -> Set[str]:
+    parents = dict((await conn.execute(PARENT_INDEX_QUERY)).all())
+
+    # Bảng test gần như rỗng nên planner sẽ chọn seq scan; tắt đi để xem index có dùng được không
+    await conn.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {query}"), params)).scalar_one()
+
+    return {
+        parents.get(node["Index Name"], node["Index Name"])
+        for node in _walk_plan(plan[0]["Plan"])
+        if "Index Name" in node
+    }
+
+
+async def _run_explain(query: str, params: Dict[str, Any]) -> Set[str]:
+    engine = create_async_engine(str(settings.DATABASE_URL), poolclass=NullPool)
+    try:
+        try:
+            conn = await engine.connect()
+        except (OSError, asyncio.TimeoutError) as e:
+            pytest.skip(f"Postgres is not reachable: {e}")
+        async with conn, conn.begin():
+            return await _explain_index_names(conn, query, params)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(name: str) -> None:
+    """The plan of each hot query scans its index (directly or through the partition indexes)"""
+    expected_index, query, params = HOT_QUERIES[name]
+
+    index_names = asyncio.run(_run_explain(query, params))
+
+    assert expected_index in index_names, f"{name} uses {sorted(index_names) or 'no index'}"
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from src.configs.settings import settings
+from src.infrastructure.services.jira_service import JiraAPIClient
+
+
+@pytest.fixture(autouse=True)
+def coalescing_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Coalescing and the response cache on, starting from an empty cache"""
+    monkeypatch.setattr(settings, "JIRA_GET_COALESCING_ENABLED", True)
+    monkeypatch.setattr(settings, "JIRA_GET_CACHE_TTL_SECONDS", 60)
+    JiraAPIClient.clear_get_cache()
+
+
+class SlowFetch:
+    """Jira GET stand-in that returns the number of the call once released"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return {"call": call}
+
+
+def test_concurrent_gets_share_one_request() -> None:
+    """Identical GETs in flight at the same time send one request"""
+    async def run() -> None:
+        client = JiraAPIClient.__new__(JiraAPIClient)
+        fetch = SlowFetch()
+        first = asyncio.ensure_future(client._coalesced_get("key", "https://jira/rest/api/3/issue/1", fetch))
+        second = asyncio.ensure_future(client._coalesced_get("key", "https://jira/rest/api/3/issue/1", fetch))
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        assert await first == await second == {"call": 1}
+        assert fetch.calls == 1
+
+    asyncio.run(run())
+
+
+def test_write_drops_in_flight_get() -> None:
+    """A GET started after a write does not join (or read the cache of) a GET started before it"""
+    async def run() -> None:
+        client = JiraAPIClient.__new__(JiraAPIClient)
+        fetch = SlowFetch()
+        before_write = asyncio.ensure_future(client._coalesced_get("key", "https://jira/rest/api/3/issue/1", fetch))
+        await asyncio.sleep(0)
+
+        JiraAPIClient.clear_get_cache()
+        after_write = asyncio.ensure_future(client._coalesced_get("key", "https://jira/rest/api/3/issue/1", fetch))
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        assert await before_write == {"call": 1}
+        assert await after_write == {"call": 2}
+        # Response cũ không được cache sau khi request mới xong
+        assert await client._coalesced_get("key", "https://jira/rest/api/3/issue/1", fetch) == {"call": 2}
+        assert fetch.calls == 2
+
+    asyncio.run(run())
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from src.configs import resource_pools
+from src.configs.resource_pools import (
+    ResourceLimiter,
+    acquire_resource,
+    get_resource_class,
+    install_resource_task_factory,
+    use_resource_class,
+)
+from src.domain.constants.resource_pools import ResourceClass, ResourceKind
+
+
+@pytest.fixture
+def single_sync_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Limit the SYNC class to one DB session"""
+    key = (ResourceClass.SYNC, ResourceKind.DB_SESSION)
+    monkeypatch.setitem(resource_pools._limiters, key, ResourceLimiter(key[0], key[1], 1))
+
+
+def test_nested_acquire_in_same_task_reuses_slot(single_sync_session: None) -> None:
+    """A nested session in the same task doesn't wait for the slot it already holds"""
+    async def run() -> None:
+        with use_resource_class(ResourceClass.SYNC):
+            async with acquire_resource(ResourceKind.DB_SESSION):
+                async with acquire_resource(ResourceKind.DB_SESSION):
+                    pass
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+
+
+def test_spawned_task_waits_for_its_own_slot(single_sync_session: None) -> None:
+    """Tasks spawned while holding a slot keep the resource class but must acquire their own slot"""
+    async def child() -> ResourceClass:
+        async with acquire_resource(ResourceKind.DB_SESSION):
+            return get_resource_class()
+
+    async def run() -> None:
+        install_resource_task_factory()
+        with use_resource_class(ResourceClass.SYNC):
+            async with acquire_resource(ResourceKind.DB_SESSION):
+                task = asyncio.ensure_future(asyncio.gather(child()))
+                done, _ = await asyncio.wait([task], timeout=0.1)
+                assert not done, "child task reused the parent's slot"
+
+            assert await asyncio.wait_for(task, timeout=1) == [ResourceClass.SYNC]
+
+    asyncio.run(run())
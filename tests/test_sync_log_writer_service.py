@@ -0,0 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import pytest
+from sqlalchemy.exc import OperationalError, StatementError
+
+from src.domain.models.database.sync_log import SyncLogDBCreateDTO
+from src.infrastructure.services import sync_log_writer_service
+from src.infrastructure.services.sync_log_writer_service import SyncLogWriterService
+
+
+class _SessionManager:
+    @classmethod
+    @asynccontextmanager
+    async def session(cls, *, auto_commit: bool = True) -> AsyncIterator[None]:
+        yield None
+
+
+class StubSyncLogRepository:
+    """Writes logs to a list, failing with ``error`` for the given entity ids (or every log when None)"""
+
+    def __init__(self) -> None:
+        self.written: List[str] = []
+        self.error: Optional[Exception] = None
+        self.failing_ids: Optional[List[str]] = None
+
+    async def create_sync_logs(self, session: None, sync_logs: List[SyncLogDBCreateDTO]) -> None:
+        if self.error is not None and (
+            self.failing_ids is None or any(sync_log.entity_id in self.failing_ids for sync_log in sync_logs)
+        ):
+            raise self.error
+        self.written.extend(sync_log.entity_id for sync_log in sync_logs)
+
+
+@pytest.fixture(autouse=True)
+def stub_session_manager(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Don't open real DB sessions"""
+    monkeypatch.setattr(sync_log_writer_service, "AsyncSessionManager", _SessionManager)
+
+
+def _writer(repository: StubSyncLogRepository, entity_ids: List[str]) -> SyncLogWriterService:
+    writer = SyncLogWriterService(repository, batch_size=10, max_queue_size=10)  # type: ignore[arg-type]
+    for entity_id in entity_ids:
+        writer.enqueue(SyncLogDBCreateDTO(entity_type="issue", entity_id=entity_id, operation="update", source="nats"))
+    return writer
+
+
+def test_outage_keeps_logs_for_next_flush() -> None:
+    """A lost connection puts the batch back and the next flush writes it"""
+    repository = StubSyncLogRepository()
+    repository.error = OperationalError("INSERT", {}, ConnectionRefusedError("connection refused"))
+    writer = _writer(repository, ["a", "b"])
+
+    asyncio.run(writer.flush())
+    assert [sync_log.entity_id for sync_log in writer._queue] == ["a", "b"]
+
+    repository.error = None
+    asyncio.run(writer.flush())
+    assert repository.written == ["a", "b"]
+    assert not writer._queue
+
+
+def test_poison_row_is_dropped_instead_of_blocking_the_queue() -> None:
+    """A row the driver cannot encode is dropped, the other rows are written"""
+    repository = StubSyncLogRepository()
+    repository.error = StatementError("cannot encode", "INSERT", {}, TypeError("datetime is not JSON serializable"))
+    repository.failing_ids = ["bad"]
+    writer = _writer(repository, ["bad", "ok1", "ok2"])
+
+    asyncio.run(writer.flush())
+
+    assert repository.written == ["ok1", "ok2"]
+    assert not writer._queue